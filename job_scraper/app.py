@@ -3,38 +3,144 @@ Flask web application for the job scraper.
 Provides a modern UI for job searching and viewing results.
 """
 
+import base64
+import hashlib
+import json
+import threading
 from flask import Flask, render_template, request, jsonify, flash
-from src.scraper import JobScraper
+from src.config import STORAGE_CONFIG
+from src.scheduler import RefreshScheduler
 from src.logger import logger, log_error
-import json
-import os
 from datetime import datetime
 
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-here'  # Change this in production
+app.config['JOBS_PAGE_SIZE'] = STORAGE_CONFIG['page_size']
+
+# The scraper and its refresh scheduler are created by the first request, not
+# at import, so preforked workers start fast and start their threads after forking
+_scraper = None
+_scheduler = None
+_init_lock = threading.Lock()
+
+def get_scraper():
+    """Return the shared JobScraper, creating it on first use."""
+    global _scraper
+    if _scraper is None:
+        with _init_lock:
+            if _scraper is None:
+                from src.scraper import JobScraper
+                _scraper = JobScraper()
+    return _scraper
+
+def get_scheduler():
+    """Return the refresh scheduler, starting it on first use; scrapes run on its worker thread."""
+    global _scheduler
+    if _scheduler is None:
+        scraper = get_scraper()
+        with _init_lock:
+            if _scheduler is None:
+                _scheduler = RefreshScheduler(scraper).start()
+    return _scheduler
+
+@app.before_request
+def start_scheduler():
+    """Start scheduled refreshes with the first request a worker serves."""
+    get_scheduler()
+
+def job_filters(params) -> dict:
+    """
+    Read job list filters from request args or form data.
+    
+    Args:
+        params (MultiDict): request.args or request.form
+        
+    Returns:
+        dict: Keyword arguments for JobIndex.query()
+    """
+    titles = [t for t in params.getlist('titles[]') + params.getlist('titles') if t]
+    return {
+        'titles': titles or None,
+        'location': params.get('location') or None,
+        'source': params.get('source') or None,
+        'company': params.get('company') or None,
+        'min_score': params.get('min_score', type=float),
+        'min_salary': params.get('min_salary', type=float),
+        'max_salary': params.get('max_salary', type=float),
+    }
+
+def encode_cursor(job: dict) -> str:
+    """Encode the position after a job as an opaque pagination cursor."""
+    raw = json.dumps([job.get('score') or 0.0, job['id']]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def decode_cursor(cursor: str):
+    """Decode a cursor from encode_cursor(), raising ValueError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        score, job_id = json.loads(raw)
+        return float(score), str(job_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f'Invalid cursor: {cursor}') from e
+
+def select_fields(jobs: list, params) -> list:
+    """Trim jobs to the comma separated `fields` parameter, if given; 'id' is always kept."""
+    fields = [f.strip() for f in params.get('fields', '').split(',') if f.strip()]
+    if not fields:
+        return jobs
+    fields = ['id'] + [f for f in fields if f != 'id']
+    return [{f: job[f] for f in fields if f in job} for job in jobs]
+
+def jobs_page(params, default_limit: int) -> dict:
+    """
+    Run a filtered, paginated job query described by request parameters.
+    
+    Besides the filters from job_filters(), understands `profile` (whose
+    scores rank the jobs), `limit`, `cursor` (from a previous page's
+    next_cursor) and `fields` (comma separated job fields to return; 'id' is
+    always included).
+    
+    Args:
+        params (MultiDict): request.args or request.form
+        default_limit (int): Page size when no limit is given
+        
+    Returns:
+        dict: 'jobs' and 'next_cursor', which is None on the last page
+        
+    Raises:
+        ValueError: If the cursor is malformed or the profile unknown
+    """
+    limit = max(1, params.get('limit', default_limit, type=int))
+    cursor = params.get('cursor')
+    after = decode_cursor(cursor) if cursor else None
+    # Fetch one extra job to learn whether another page exists
+    index = get_scraper().index_for(params.get('profile'))
+    jobs = index.query(after=after, limit=limit + 1, **job_filters(params))
+    next_cursor = encode_cursor(jobs[limit - 1]) if len(jobs) > limit else None
+    return {'jobs': select_fields(jobs[:limit], params), 'next_cursor': next_cursor}
 
-# Initialize the job scraper
-scraper = JobScraper()
+def list_etag(version: int) -> str:
+    """ETag for a GET job list: changes when the data version or the query string does."""
+    query = hashlib.sha1(request.query_string).hexdigest()[:16]
+    return f'{version}-{query}'
 
 @app.route('/')
 def index():
     """Render the main page."""
     try:
-        # Load existing jobs if available
-        jobs_file = os.path.join('data', 'jobs.json')
-        if os.path.exists(jobs_file):
-            with open(jobs_file, 'r') as f:
-                data = json.load(f)
-                jobs = data.get('jobs', [])
-                last_updated = datetime.fromisoformat(data.get('timestamp')).strftime('%Y-%m-%d %H:%M:%S')
-        else:
-            jobs = []
-            last_updated = None
+        # Load the top stored jobs
+        scraper = get_scraper()
+        profile = request.args.get('profile')
+        jobs = scraper.index_for(profile).query(limit=STORAGE_CONFIG['page_size'])
+        updated = scraper.store.last_updated()
+        last_updated = updated.strftime('%Y-%m-%d %H:%M:%S') if updated else None
             
         return render_template(
             'index.html',
             jobs=jobs,
-            last_updated=last_updated
+            last_updated=last_updated,
+            profiles=scraper.profiles.names(),
+            profile=profile
         )
     except Exception as e:
         log_error(logger, e)
@@ -45,35 +151,30 @@ def index():
 def search():
     """Handle job search requests."""
     try:
-        # Get search parameters from form
-        search_params = {
-            'titles': request.form.getlist('titles[]'),
-            'location': request.form.get('location'),
-            'radius': request.form.get('radius', type=int),
-            'min_salary': request.form.get('min_salary', type=int),
-            'max_salary': request.form.get('max_salary', type=int)
-        }
-        
-        # Update scraper configuration with new parameters
-        # (You would need to add this functionality to the scraper)
-        
-        # Perform the search
-        jobs = scraper.scrape_jobs()
+        # Queue the search in the background and show the best stored matches meanwhile
+        refresh = get_scheduler().enqueue('search')
+        page = jobs_page(request.form, STORAGE_CONFIG['page_size'])
         
         if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
             # Return JSON for AJAX requests
             return jsonify({
-                'jobs': jobs,
+                **page,
+                'refresh': refresh.to_dict(),
                 'timestamp': datetime.now().isoformat()
-            })
+            }), 202
         else:
             # Render template for regular requests
-            flash(f'Found {len(jobs)} matching jobs!', 'success')
+            flash('Search started. Results will update when it finishes.', 'success')
+            updated = get_scraper().store.last_updated()
             return render_template(
                 'index.html',
-                jobs=jobs,
-                last_updated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                jobs=page['jobs'],
+                last_updated=updated.strftime('%Y-%m-%d %H:%M:%S') if updated else None,
+                profiles=get_scraper().profiles.names(),
+                profile=request.form.get('profile')
             )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         log_error(logger, e)
         error_message = 'Error performing job search. Please try again.'
@@ -85,39 +186,137 @@ def search():
 
 @app.route('/jobs/top')
 def top_jobs():
-    """Get top matching jobs."""
+    """Get top matching jobs, filtered and paginated by query parameters."""
     try:
-        limit = request.args.get('limit', 10, type=int)
-        top_jobs = scraper.get_top_jobs(limit)
-        return jsonify({
-            'jobs': top_jobs,
+        # The index may still serve an older snapshot while it reloads; tag what it serves
+        etag = list_etag(get_scraper().index_for(request.args.get('profile')).version())
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+            response.set_etag(etag, weak=True)
+            return response
+        response = jsonify({
+            **jobs_page(request.args, 10),
             'timestamp': datetime.now().isoformat()
         })
+        response.set_etag(etag, weak=True)
+        return response
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         log_error(logger, e)
         return jsonify({'error': 'Error fetching top jobs'}), 500
 
+@app.route('/jobs/search')
+def search_jobs():
+    """
+    Find stored jobs by keywords in their title, company or description.
+
+    `q` holds the words to find; `limit`, `offset`, `profile`, `source`,
+    `company`, `location`, `min_score` and `fields` work as for /jobs/top.
+    """
+    try:
+        text = request.args.get('q', '').strip()
+        if not text:
+            return jsonify({'error': 'Missing search query q'}), 400
+        etag = list_etag(get_scraper().store.version())
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+            response.set_etag(etag, weak=True)
+            return response
+        scraper = get_scraper()
+        profile = request.args.get('profile') or None
+        if profile is not None:
+            scraper.profiles[profile]
+        jobs = scraper.store.search(
+            text,
+            limit=max(1, request.args.get('limit', 10, type=int)),
+            offset=max(0, request.args.get('offset', 0, type=int)),
+            profile=profile,
+            source=request.args.get('source') or None,
+            company=request.args.get('company') or None,
+            location=request.args.get('location') or None,
+            min_score=request.args.get('min_score', type=float)
+        )
+        response = jsonify({
+            'jobs': select_fields(jobs, request.args),
+            'query': text,
+            'timestamp': datetime.now().isoformat()
+        })
+        response.set_etag(etag, weak=True)
+        return response
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        log_error(logger, e)
+        return jsonify({'error': 'Error searching jobs'}), 500
+
+@app.route('/profiles')
+def profiles():
+    """List the candidate profiles jobs are scored for, with their settings."""
+    scorers = get_scraper().profiles.scorers
+    return jsonify({
+        'profiles': [{'name': name, **scorer.profile, 'weights': scorer.weights,
+                      'max_age': scorer.max_age}
+                     for name, scorer in scorers.items()],
+        'timestamp': datetime.now().isoformat()
+    })
+
 @app.route('/jobs/refresh')
 def refresh_jobs():
-    """Refresh job listings."""
+    """Queue a background refresh of job listings."""
     try:
-        jobs = scraper.scrape_jobs()
+        refresh = get_scheduler().enqueue('manual')
         return jsonify({
-            'jobs': jobs,
+            'refresh': refresh.to_dict(),
             'timestamp': datetime.now().isoformat()
-        })
+        }), 202
     except Exception as e:
         log_error(logger, e)
         return jsonify({'error': 'Error refreshing jobs'}), 500
 
-@app.template_filter('format_date')
-def format_date(date_str):
-    """Format ISO date string for display."""
+@app.route('/jobs/refresh/<refresh_id>')
+def refresh_status(refresh_id):
+    """Get the status and progress of a queued refresh."""
+    scheduler = get_scheduler()
+    refresh = scheduler.latest() if refresh_id == 'latest' else scheduler.get(refresh_id)
+    if refresh is None:
+        return jsonify({'error': 'Unknown refresh'}), 404
+    return jsonify({
+        'refresh': refresh.to_dict(),
+        'timestamp': datetime.now().isoformat()
+    })
+
+@app.route('/metrics')
+def metrics():
+    """
+    Expose scrape pipeline metrics in the Prometheus text format.
+
+    Totals come from the job store, which every worker process adds its
+    runs to, so each worker serves the same figures.
+    """
+    scraper = get_scraper()
+    return app.response_class(scraper.metrics.render(scraper.store.metrics()),
+                              mimetype='text/plain; version=0.0.4')
+
+@app.route('/metrics/runs')
+def metrics_runs():
+    """Get summaries of the most recent scrape runs, newest first."""
     try:
-        date = datetime.fromisoformat(date_str)
-        return date.strftime('%Y-%m-%d %H:%M:%S')
-    except:
-        return date_str
+        limit = max(1, min(request.args.get('limit', 20, type=int), 100))
+        return jsonify({
+            'runs': get_scraper().store.runs(limit),
+            'timestamp': datetime.now().isoformat()
+        })
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        log_error(logger, e)
+        return jsonify({'error': 'Error fetching run summaries'}), 500
+
+@app.template_filter('format_date')
+def format_date(timestamp):
+    """Format a job's posted_at timestamp, parsed when the job was stored, for display."""
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=8000, debug=True)
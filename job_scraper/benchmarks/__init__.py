@@ -0,0 +1,4 @@
+"""
+Offline benchmarks for the job scraper.
+Run from the job_scraper directory, e.g. `python -m benchmarks.bench_scoring`.
+"""
@@ -0,0 +1,79 @@
+"""
+Benchmark near-duplicate detection over synthetic postings with known reposts.
+
+A share of the generated postings are cross-posts or reposts of earlier
+ones with abbreviated titles and trimmed descriptions; the benchmark
+reports throughput and how many of those the index collapses.
+
+Usage:
+    python -m benchmarks.bench_dedup --jobs 100000
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Tuple
+
+from benchmarks.bench_scoring import LOCATIONS
+from src.config import SEARCH_TITLES
+from src.dedup import NearDuplicateIndex
+
+ABBREVIATIONS = {'Senior ': 'Sr. ', 'Manager': 'Mgr'}
+COMPANY_WORDS = ['Acme', 'Northwind', 'Globex', 'Initech', 'Umbrella', 'Stark', 'Wayne',
+                 'Tyrell', 'Cyberdyne', 'Soylent', 'Hooli', 'Vandelay']
+VOCABULARY_SIZE = 5000
+
+
+def synthetic_postings(count: int, rng: random.Random) -> List[Dict]:
+    """Postings with Zipf-distributed description words, like real job ads."""
+    vocabulary = [f'w{i}' for i in range(VOCABULARY_SIZE)]
+    weights = [1 / (rank + 1) for rank in range(VOCABULARY_SIZE)]
+    return [{
+        'title': rng.choice(['Senior ', '', 'Lead ']) + rng.choice(SEARCH_TITLES),
+        'company': ' '.join(rng.sample(COMPANY_WORDS, 2)) + f' {i}',
+        'location': rng.choice(LOCATIONS),
+        'description': ' '.join(rng.choices(vocabulary, weights, k=rng.randint(40, 120))),
+        'source': 'Indeed',
+    } for i in range(count)]
+
+
+def postings_with_reposts(count: int, repost_share: float, seed: int = 0) -> Tuple[List[Dict], int]:
+    """Return postings where about repost_share of them copy an earlier posting."""
+    rng = random.Random(seed)
+    jobs, reposts = [], 0
+    for i, job in enumerate(synthetic_postings(count, rng)):
+        if jobs and rng.random() < repost_share:
+            original = rng.choice(jobs)
+            title = original['title']
+            for full, short in ABBREVIATIONS.items():
+                title = title.replace(full, short)
+            words = original['description'].split()
+            job = dict(original, title=title,
+                       description=' '.join(words[:max(1, len(words) - rng.randint(0, 3))]),
+                       source=rng.choice(['LinkedIn', 'Indeed']))
+            reposts += 1
+        job['id'] = f'bench:{i}'
+        jobs.append(job)
+    return jobs, reposts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=100000, help='number of postings')
+    parser.add_argument('--reposts', type=float, default=0.2, help='share of postings that are reposts')
+    args = parser.parse_args()
+
+    jobs, reposts = postings_with_reposts(args.jobs, args.reposts)
+    index = NearDuplicateIndex()
+    start = time.perf_counter()
+    duplicates = sum(1 for job in jobs if index.check(job))
+    seconds = time.perf_counter() - start
+
+    print(f"{args.jobs} postings, {reposts} reposts")
+    print(f"  {args.jobs / seconds:8.0f} postings/s ({seconds:.2f}s)")
+    print(f"  collapsed {duplicates} postings, {len(index)} canonical jobs kept, "
+          f"{duplicates / reposts if reposts else 0:.1%} of reposts")
+
+
+if __name__ == '__main__':
+    main()
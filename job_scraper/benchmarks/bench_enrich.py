@@ -0,0 +1,79 @@
+"""
+Benchmark LinkedIn detail enrichment against the local fixture server.
+
+Parses the saved LinkedIn result page, then fetches every posting's detail
+page through DetailEnricher at several concurrency levels, reporting
+throughput and fetch latency percentiles.
+
+Usage:
+    python -m benchmarks.bench_enrich --latency 0.05 --copies 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import requests
+
+from benchmarks.fixture_server import start_server
+from src.enrich import DetailEnricher
+from src.parsers import get_parsers
+from src.scoring import JobScorer
+from src.seen_index import SeenJobsIndex
+from src.storage import JobStore
+
+
+def linkedin_jobs(base_url: str, copies: int):
+    """Jobs from the fixture result page, repeated with distinct ids and URLs."""
+    parsers = get_parsers()
+    html = requests.get(f'{base_url}/linkedin').text
+    parser = parsers['linkedin']
+    cards = [parser.parse_card(card) for card in parser.iter_cards(html)]
+    jobs = []
+    for copy in range(copies):
+        for job in cards:
+            job = dict(job, id=f"linkedin:{job['job_id']}-{copy}",
+                       url=job['url'].replace('/?', f'{copy}/?'))
+            jobs.append(job)
+    return parsers, jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--latency', type=float, default=0.05, help='server seconds per response')
+    parser.add_argument('--copies', type=int, default=8, help='copies of the 25 fixture postings')
+    args = parser.parse_args()
+
+    server = start_server(latency=args.latency)
+    base_url = f'http://127.0.0.1:{server.server_port}'
+    parsers, template_jobs = linkedin_jobs(base_url, args.copies)
+    session = requests.Session()
+    scorer = JobScorer()
+
+    def fetch(url, params):
+        response = session.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        return response.text
+
+    print(f"{len(template_jobs)} postings, {args.latency * 1000:.0f} ms server latency")
+    for workers in (1, 4, 8, 16):
+        with tempfile.TemporaryDirectory() as directory:
+            seen = SeenJobsIndex(os.path.join(directory, 'seen.json'))
+            jobs = [dict(job) for job in template_jobs]
+            for job in jobs:
+                seen.mark_seen(job['id'], '')
+            enricher = DetailEnricher(fetch, parsers, seen, JobStore(os.path.join(directory, 'jobs.db')),
+                                      scorer.score, max_workers=workers, per_host_limit=workers)
+            start = time.perf_counter()
+            enriched = enricher.enrich(jobs)
+            seconds = time.perf_counter() - start
+            latency = enricher.last_report['latency_ms']
+            print(f"  {workers:>2} workers  {len(enriched) / seconds:7.1f} pages/s  "
+                  f"p50 {latency['p50']:6.1f} ms  p90 {latency['p90']:6.1f} ms  "
+                  f"p99 {latency['p99']:6.1f} ms")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark salary/date/experience/skill extraction per description.
+
+Compares the original helpers, which rebuilt their patterns on every call,
+with DescriptionExtractor, which compiles them once and lowercases each
+description a single time.
+
+Usage:
+    python -m benchmarks.bench_extraction --jobs 20000
+"""
+
+import argparse
+import random
+import re
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from benchmarks.bench_scoring import synthetic_jobs
+from src.config import REQUIRED_SKILLS, TECHNICAL_SKILLS
+from src.utils.extraction import DescriptionExtractor
+
+SKILLS = REQUIRED_SKILLS + TECHNICAL_SKILLS
+
+SNIPPETS = [
+    'Pay: $85,000 - $110,000 a year.', 'Salary $120,000 to $140,000.', '$95,000/yr plus bonus.',
+    'Up to 130K DOE.', 'Posted 3 days ago.', 'Posted 2 weeks ago.', 'Just posted.',
+    '5+ years of experience required.', '3-5 years experience preferred.',
+    'Minimum of 7 years experience.', 'Managed projects and planned sprints.',
+]
+
+
+def legacy_extract_salary(text: str) -> Optional[Dict[str, float]]:
+    patterns = [
+        r'\$(\d{2,3}(?:,\d{3})*(?:\.\d{2})?)\s*-\s*\$(\d{2,3}(?:,\d{3})*(?:\.\d{2})?)',
+        r'\$(\d{2,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:to|–)\s*\$(\d{2,3}(?:,\d{3})*(?:\.\d{2})?)',
+        r'\$(\d{2,3}(?:,\d{3})*(?:\.\d{2})?)/(?:yr|year|annual)',
+        r'(\d{2,3}(?:,\d{3})*(?:\.\d{2})?)[Kk]',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, text)
+        if match:
+            groups = match.groups()
+            if len(groups) == 2:
+                return {'min': float(groups[0].replace(',', '')), 'max': float(groups[1].replace(',', ''))}
+            salary = float(groups[0].replace(',', ''))
+            if 'k' in text.lower():
+                salary *= 1000
+            return {'min': salary * 0.9, 'max': salary * 1.1}
+    return None
+
+
+def legacy_parse_date_posted(text: str, now: datetime) -> Optional[datetime]:
+    patterns = {
+        r'(\d+)\s*hours?\s*ago': lambda x: now - timedelta(hours=int(x)),
+        r'(\d+)\s*days?\s*ago': lambda x: now - timedelta(days=int(x)),
+        r'(\d+)\s*weeks?\s*ago': lambda x: now - timedelta(weeks=int(x)),
+        r'(\d+)\s*months?\s*ago': lambda x: now - timedelta(days=int(x)*30),
+        r'today': lambda x: now,
+        r'yesterday': lambda x: now - timedelta(days=1),
+        r'just\s*posted': lambda x: now,
+    }
+    text = text.lower()
+    for pattern, date_func in patterns.items():
+        match = re.search(pattern, text)
+        if match:
+            groups = match.groups()
+            return date_func(groups[0] if groups else None)
+    return None
+
+
+def legacy_experience_years(text: str) -> Optional[Dict[str, int]]:
+    patterns = [
+        r'(\d+)\+?\s*-\s*(\d+)\+?\s*years?(?:\s+of)?\s+experience',
+        r'(\d+)\+?\s*years?(?:\s+of)?\s+experience',
+        r'minimum\s+(?:of\s+)?(\d+)\s+years?(?:\s+of)?\s+experience',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, text.lower())
+        if match:
+            groups = match.groups()
+            if len(groups) == 2:
+                return {'min': int(groups[0]), 'max': int(groups[1])}
+            years = int(groups[0])
+            return {'min': years, 'max': years + 3}
+    return None
+
+
+def legacy_extract_skills(text: str, skill_list: list) -> list:
+    found_skills = []
+    text = text.lower()
+    for skill in skill_list:
+        pattern = r'\b' + re.escape(skill.lower()) + r'(?:ing|ed|s)?\b'
+        if re.search(pattern, text):
+            found_skills.append(skill)
+    return found_skills
+
+
+def legacy_extract(text: str, now: datetime) -> tuple:
+    """The four original helpers as they were, kept as the baseline."""
+    return (legacy_extract_salary(text), legacy_parse_date_posted(text, now),
+            legacy_experience_years(text), legacy_extract_skills(text, SKILLS))
+
+
+def descriptions(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    texts = []
+    for job in synthetic_jobs(count, seed):
+        texts.append(' '.join([job['description']] + rng.sample(SNIPPETS, rng.randint(0, 4))))
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=20000, help='number of synthetic descriptions')
+    args = parser.parse_args()
+
+    texts = descriptions(args.jobs)
+    extractor = DescriptionExtractor(SKILLS)
+    now = datetime.now()
+
+    start = time.perf_counter()
+    legacy = [legacy_extract(text, now) for text in texts]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    extracted = extractor.extract_batch(texts)
+    batch_seconds = time.perf_counter() - start
+
+    # Salaries differ on purpose: K suffixes, hourly pay and 401k are read differently now
+    mismatches = sum(1 for old, new in zip(legacy, extracted)
+                     if (old[2], old[3]) != (new.experience, new.skills)
+                     or (old[1] is None) != (new.date_posted is None))
+    salaries = sum(1 for old, new in zip(legacy, extracted) if old[0] != new.salary)
+    print(f"{args.jobs} descriptions, {len(SKILLS)} skills, {mismatches} mismatches, "
+          f"{salaries} salaries read differently from the legacy helper")
+    print(f"  per-call helpers  {legacy_seconds / args.jobs * 1e6:8.1f} us/description")
+    print(f"  extract_batch     {batch_seconds / args.jobs * 1e6:8.1f} us/description   "
+          f"{legacy_seconds / batch_seconds:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Benchmark a full scrape against the local fixture server: the original
+one-request-at-a-time loop, the pipeline fetching one page at a time, and
+the pipeline fetching concurrently.
+
+Points JobScraper at benchmarks.fixture_server, with Indeed and LinkedIn on
+two host names so per-host limits apply as they would live, and every
+search page holding postings of its own, so each search paginates through
+all FETCH_CONFIG['max_pages'] pages (6 titles x 2 boards x 10 pages = 120
+requests by default). A fixed delay per response stands in for network
+latency. Each run starts in a scratch directory without a response cache,
+and detail-page enrichment (see bench_enrich) and the token-bucket rate
+limit are turned off, so the figures are page fetching and the pipeline.
+
+The original scraper slept random.uniform(1, 5) seconds before every
+request. Its loop is timed without the sleeps, and their expected total
+(3 s per request) is added, unless --legacy-sleep makes it really sleep.
+
+Usage:
+    python -m benchmarks.bench_fetch --latency 0.2
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import requests
+
+from benchmarks.fixture_server import start_server
+from src.config import CACHE_CONFIG, ENRICH_CONFIG, FETCH_CONFIG, LOG_CONFIG, REQUEST_CONFIG
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The original REQUEST_CONFIG['retry_delay']: each request slept uniform(1, this) seconds first
+LEGACY_DELAY = 5
+
+
+def in_scratch_directory(function):
+    """Run function() with a fresh working directory, so no run sees another's data."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            return function()
+        finally:
+            os.chdir(cwd)
+
+
+def page_requests(base_urls, max_pages: int):
+    """Every page of every search a scrape makes, as the original loop would request them."""
+    from src.fetcher import build_page_requests
+    from src.profiles import ProfileSet
+
+    return [page_request for location, titles in ProfileSet().searches()
+            for page_request in build_page_requests(base_urls, titles, location, max_pages)]
+
+
+def legacy(base_urls, max_pages: int, sleep: bool):
+    """Fetch every page one after another like the original scraper; return seconds and requests."""
+    pages = in_scratch_directory(lambda: page_requests(base_urls, max_pages))
+    session = requests.Session()
+    start = time.perf_counter()
+    for page_request in pages:
+        if sleep:
+            time.sleep(random.uniform(1, LEGACY_DELAY))
+        session.get(page_request.url, params=page_request.params,
+                    timeout=REQUEST_CONFIG['timeout']).raise_for_status()
+    seconds = time.perf_counter() - start
+    if not sleep:
+        seconds += len(pages) * (1 + LEGACY_DELAY) / 2
+    return seconds, len(pages)
+
+
+def scrape(base_urls, max_pages: int, concurrent: bool):
+    """Run one scrape; return seconds, requests sent and jobs stored."""
+    from src.scraper import JobScraper
+
+    def run():
+        scraper = JobScraper(base_urls=base_urls, use_mock=False, max_pages=max_pages)
+        start = time.perf_counter()
+        scraper.scrape_jobs(concurrent=concurrent)
+        seconds = time.perf_counter() - start
+        return seconds, scraper.request_stats.snapshot()['requests_sent'], scraper.store.count()
+
+    return in_scratch_directory(run)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--latency', type=float, default=0.2, help='server seconds per response')
+    parser.add_argument('--pages', type=int, default=FETCH_CONFIG['max_pages'],
+                        help='result pages per search title')
+    parser.add_argument('--legacy-sleep', action='store_true',
+                        help='really sleep before each request of the original loop (minutes)')
+    args = parser.parse_args()
+
+    logs = tempfile.TemporaryDirectory()
+    LOG_CONFIG.update(directory=logs.name, level='WARNING')
+    CACHE_CONFIG['enabled'] = False
+    ENRICH_CONFIG['enabled'] = False
+    REQUEST_CONFIG.update(rate=1e6, burst=10 ** 6)
+    sys.path.insert(0, ROOT)  # the scraper is imported from inside a scratch directory
+
+    server = start_server(latency=args.latency, vary_pages=True)
+    base_urls = {
+        'indeed': f'http://127.0.0.1:{server.server_port}/indeed',
+        'linkedin': f'http://localhost:{server.server_port}/linkedin',
+    }
+    print(f"{args.latency * 1000:.0f} ms server latency, {args.pages} pages per search, "
+          f"{FETCH_CONFIG['max_workers']} workers, {FETCH_CONFIG['per_host_limit']} per host")
+    try:
+        seconds, sent = legacy(base_urls, args.pages, args.legacy_sleep)
+        estimated = '' if args.legacy_sleep else '  (sleeps estimated)'
+        print(f"  original loop {seconds:7.2f}s  {sent:4d} requests{estimated}")
+        results = {'original loop': seconds}
+        for name, concurrent in (('one at a time', False), ('concurrent', True)):
+            seconds, sent, stored = scrape(base_urls, args.pages, concurrent)
+            results[name] = seconds
+            print(f"  {name:<13} {seconds:7.2f}s  {sent:4d} requests  {stored} jobs stored")
+        for name in ('original loop', 'one at a time'):
+            print(f"  concurrent vs. {name:<13} {results[name] / results['concurrent']:6.1f}x")
+    finally:
+        server.shutdown()
+        logs.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark top-N and filtered job queries through the in-memory job index.
+
+Fills a throwaway SQLite store with synthetic postings and compares the
+index with querying the store directly, as the web app did before, then
+times queries made right after a write, while the index reloads.
+
+Usage:
+    python -m benchmarks.bench_job_index --jobs 50000 --queries 2000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.bench_scoring import synthetic_jobs
+from src.job_index import JobIndex
+from src.scoring import JobScorer
+from src.storage import JobStore
+
+SOURCES = ['Indeed', 'LinkedIn']
+COMPANIES = ['Tech Innovations Inc.', 'Global Solutions Corp', 'Innovation Labs',
+             'HealthBridge', 'Civic Data Partners', 'Northwind Security']
+
+
+def fill_store(store: JobStore, count: int) -> None:
+    rng = random.Random(1)
+    jobs = synthetic_jobs(count)
+    scores = JobScorer().score_batch(jobs).scores
+    for i, job in enumerate(jobs):
+        job.update(id=f'bench:{i}', source=rng.choice(SOURCES),
+                   company=rng.choice(COMPANIES), score=scores[i])
+    store.upsert_jobs(jobs)
+
+
+def timed(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=50000, help='number of stored postings')
+    parser.add_argument('--queries', type=int, default=2000, help='queries per case')
+    parser.add_argument('--limit', type=int, default=100, help='jobs per query')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = JobStore(os.path.join(directory, 'jobs.db'))
+        fill_store(store, args.jobs)
+        index = JobIndex(store)
+
+        start = time.perf_counter()
+        index.query(limit=1)
+        print(f"{args.jobs} jobs, index load {time.perf_counter() - start:.2f}s, "
+              f"{args.queries} queries of {args.limit} per case")
+
+        cases = {
+            'top': {},
+            'source': {'source': 'LinkedIn'},
+            'source+location': {'source': 'Indeed', 'location': 'CA'},
+            'min_score': {'min_score': 0.5},
+        }
+        for name, filters in cases.items():
+            assert ([job['id'] for job in index.query(limit=args.limit, **filters)]
+                    == [job['id'] for job in store.query(limit=args.limit, **filters)]), \
+                f'index disagrees with the store on {name}'
+            store_seconds = timed(lambda: store.query(limit=args.limit, **filters), args.queries)
+            index_seconds = timed(lambda: index.query(limit=args.limit, **filters), args.queries)
+            print(f"  {name:<16} store {args.queries / store_seconds:8.0f} q/s   "
+                  f"index {args.queries / index_seconds:8.0f} q/s   "
+                  f"{store_seconds / index_seconds:5.1f}x")
+
+        # A scrape flushes a batch, bumping the version; queries keep coming meanwhile
+        written = store.get('bench:0')
+        latencies = []
+        start = time.perf_counter()
+        store.upsert_jobs([written])
+        while index._snapshot.version != store.version() or not latencies:
+            latencies.append(timed(lambda: index.query(limit=args.limit), 1))
+        reload_seconds = time.perf_counter() - start
+        latencies.sort()
+        print(f"  after a write    {len(latencies)} queries during a {reload_seconds:.2f}s reload, "
+              f"p50 {latencies[len(latencies) // 2] * 1000:.2f} ms, "
+              f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms, "
+              f"slowest {latencies[-1] * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark per-job logging cost on the scraping threads.
+
+Logs a found-job record per synthetic posting through the original setup
+(synchronous file and console handlers, f-string helpers) and through
+setup_logger() (queue handler, listener thread, lazy %-formatting, level
+guards), timing the calling thread and the time until every record is written.
+Console output goes to /dev/null and log files to a scratch directory.
+
+Usage:
+    python -m benchmarks.bench_logging --jobs 20000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_scoring import synthetic_jobs
+from src import logger as log_module
+from src.config import LOG_CONFIG
+
+
+def legacy_logger(directory: str) -> logging.Logger:
+    """The original setup: one timestamped file and the console, written inline."""
+    logger = logging.getLogger('bench_legacy')
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    formatter = logging.Formatter(LOG_CONFIG['format'])
+    for handler in (logging.FileHandler(os.path.join(directory, 'legacy.log')), logging.StreamHandler()):
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    return logger
+
+
+def legacy_log_job_found(logger, job_info):
+    logger.info(f"Found job: {job_info.get('title')} at {job_info.get('company')}")
+    logger.debug(f"Job details: {job_info}")
+
+
+def legacy_log_refinement_result(logger, job_id, score, criteria):
+    logger.debug(f"Job {job_id} refinement score: {score}")
+    logger.debug(f"Scoring criteria: {criteria}")
+
+
+def run(logger, log_job_found, log_refinement_result, jobs) -> float:
+    criteria = {'title_match': 1, 'skills_match': 0.4, 'industry_match': 0, 'location_match': 1}
+    start = time.perf_counter()
+    for job in jobs:
+        log_refinement_result(logger, job['id'], 0.5, criteria)
+        log_job_found(logger, job)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=20000, help='number of logged postings')
+    args = parser.parse_args()
+
+    jobs = synthetic_jobs(args.jobs)
+    for i, job in enumerate(jobs):
+        job.update(id=f'bench:{i}', company='Tech Innovations Inc.', source='Indeed')
+
+    stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, 'w') as devnull:
+        sys.stderr = devnull
+        try:
+            legacy = legacy_logger(directory)
+            legacy_seconds = run(legacy, legacy_log_job_found, legacy_log_refinement_result, jobs)
+
+            LOG_CONFIG['directory'] = directory
+            logger = log_module.setup_logger('bench_queued')
+            logger.propagate = False
+            start = time.perf_counter()
+            caller_seconds = run(logger, log_module.log_job_found, log_module.log_refinement_result, jobs)
+            log_module.stop_logging()
+            total_seconds = time.perf_counter() - start
+        finally:
+            sys.stderr = stderr
+
+    print(f"{args.jobs} postings logged at INFO")
+    print(f"  synchronous handlers  {legacy_seconds / args.jobs * 1e6:6.1f} us/job on the scraping thread")
+    print(f"  queue + listener      {caller_seconds / args.jobs * 1e6:6.1f} us/job on the scraping thread   "
+          f"{legacy_seconds / caller_seconds:4.1f}x")
+    print(f"  queue, until written  {total_seconds / args.jobs * 1e6:6.1f} us/job")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark parse throughput of the job board parser backends.
+
+Compares the original full BeautifulSoup tree with the SoupStrainer and
+lxml/XPath parsers over the saved result pages in benchmarks/fixtures.
+
+Usage:
+    python -m benchmarks.bench_parsing --repeat 200
+"""
+
+import argparse
+import os
+import time
+from typing import Dict, List
+
+from bs4 import BeautifulSoup
+
+from src.parsers import get_parser
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+PAGES = {
+    'indeed': 'indeed_search.html',
+    'linkedin': 'linkedin_search.html',
+}
+
+
+def load_page(source: str) -> str:
+    with open(os.path.join(FIXTURES, PAGES[source]), 'r') as f:
+        return f.read()
+
+
+def parse_full_tree(source: str, html: str) -> List[Dict]:
+    """The original path: build the whole document, then find the cards."""
+    parser = get_parser(source, 'soup')
+    soup = BeautifulSoup(html, 'html.parser')
+    cards = soup.find_all(parser.card_tag, {'class': parser.card_class})
+    return [parser.parse_card(card) for card in cards]
+
+
+def parse_with(source: str, backend: str, html: str) -> List[Dict]:
+    parser = get_parser(source, backend)
+    return [parser.parse_card(card) for card in parser.iter_cards(html)]
+
+
+def comparable(jobs: List[Dict]) -> List[Dict]:
+    return [{k: v for k, v in job.items() if k != 'date_found'} for job in jobs]
+
+
+def timed(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=200, help='parses per page and backend')
+    args = parser.parse_args()
+
+    for source in PAGES:
+        html = load_page(source)
+        baseline = parse_full_tree(source, html)
+        results = {
+            'full tree': timed(lambda: parse_full_tree(source, html), args.repeat),
+        }
+        for backend in ('soup', 'lxml'):
+            assert comparable(parse_with(source, backend, html)) == comparable(baseline), \
+                f'{backend} parser disagrees with the full tree on {source}'
+            label = 'soup+strainer' if backend == 'soup' else 'lxml+xpath'
+            results[label] = timed(lambda: parse_with(source, backend, html), args.repeat)
+
+        print(f"{source}: {len(baseline)} cards/page, {len(html) / 1024:.0f} KiB, {args.repeat} pages")
+        for label, seconds in results.items():
+            pages_per_second = args.repeat / seconds
+            print(f"  {label:<14} {pages_per_second:8.0f} pages/s "
+                  f"{pages_per_second * len(baseline):9.0f} jobs/s "
+                  f"{results['full tree'] / seconds:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark scoring one scrape for many candidate profiles.
+
+Compares one scrape per profile (each parsing the result pages and scoring
+the text for its profile) with one shared scrape: parse once, build each
+job's feature vector over the terms of every profile, then score the
+vectors per profile. Fetching, which one scrape per profile also repeats,
+is not counted.
+
+Usage:
+    python -m benchmarks.bench_profiles --jobs 20000 --profiles 10
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from benchmarks.bench_scoring import LOCATIONS
+from benchmarks.corpus import OTHER_TITLES, iter_chunks, pages_for
+from src.config import REQUIRED_SKILLS, SEARCH_TITLES, TARGET_INDUSTRIES, TECHNICAL_SKILLS
+from src.profiles import DEFAULT_PROFILE, ProfileSet, profile_scorer
+from src.workers import parse_and_score
+
+
+def synthetic_profiles(count: int, seed: int = 0) -> List[Dict]:
+    """Profile settings drawing titles, skills, industries and places from the corpus vocabulary."""
+    rng = random.Random(seed)
+    profiles = []
+    for _ in range(count):
+        city, _, state = rng.choice([place for place in LOCATIONS if ', ' in place]).partition(', ')
+        profiles.append({
+            'titles': rng.sample(SEARCH_TITLES + OTHER_TITLES, 3),
+            'required_skills': rng.sample(REQUIRED_SKILLS, 4),
+            'technical_skills': rng.sample(TECHNICAL_SKILLS, 3),
+            'industries': rng.sample(TARGET_INDUSTRIES, 3),
+            'location': {'city': city, 'state': state},
+            'min_salary': rng.choice([60000, 90000, 120000]),
+        })
+    return profiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=20000, help='number of scraped postings')
+    parser.add_argument('--profiles', type=int, default=10, help='number of candidate profiles')
+    args = parser.parse_args()
+
+    scorers = {f'profile{i}': profile_scorer(settings)
+               for i, settings in enumerate(synthetic_profiles(args.profiles - 1))}
+    profiles = ProfileSet({DEFAULT_PROFILE: profile_scorer({}), **scorers})
+    pages = [page for offset, chunk in enumerate(iter_chunks(args.jobs))
+             for page in pages_for(chunk, offset * len(chunk))]
+
+    start = time.perf_counter()
+    jobs = [parsed.job for page in pages for parsed in parse_and_score(page)]
+    parse_seconds = time.perf_counter() - start
+    now = time.time()
+
+    start = time.perf_counter()
+    separate = {name: scorer.score_batch(jobs, now).scores
+                for name, scorer in profiles.scorers.items()}
+    score_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectors = [profiles.terms.vector(job) for job in jobs]
+    vector_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    shared = {name: [scorer.score_vector(vector, now) for vector in vectors]
+              for name, scorer in profiles.scorers.items()}
+    weigh_seconds = time.perf_counter() - start
+
+    mismatches = sum(1 for name in separate for a, b in zip(separate[name], shared[name])
+                     if abs(a - b) > 1e-12)
+    per_profile = parse_seconds * len(profiles) + score_seconds
+    once = parse_seconds + vector_seconds + weigh_seconds
+    print(f"{len(jobs)} jobs, {len(profiles)} profiles, {len(profiles.terms.keys)} distinct terms")
+    print(f"  one scrape per profile: {per_profile:7.2f}s   "
+          f"parse {parse_seconds:.2f}s x {len(profiles)}, score text {score_seconds:.2f}s")
+    print(f"  one shared scrape:      {once:7.2f}s   "
+          f"parse {parse_seconds:.2f}s, vectors {vector_seconds:.2f}s, score vectors {weigh_seconds:.2f}s")
+    print(f"  speed-up:               {per_profile / once:7.1f}x")
+    print(f"  scores differing between the two: {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
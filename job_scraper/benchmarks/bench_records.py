@@ -0,0 +1,62 @@
+"""
+Benchmark memory of job dicts against Job records.
+
+Holds a synthetic corpus (see benchmarks.corpus) as the job dicts the index
+used to keep, and as a JobBatch of slotted records with salary columns,
+measuring retained memory with tracemalloc.
+
+Usage:
+    python -m benchmarks.bench_records --jobs 100000
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from benchmarks.corpus import iter_chunks
+from benchmarks.suite import stored_jobs
+from src.records import JobBatch
+from src.scoring import JobScorer
+
+
+def retained(build):
+    """Return what build() returns and the bytes it still holds afterwards."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=100000, help='number of postings')
+    args = parser.parse_args()
+
+    scorer = JobScorer()
+
+    def load_dicts():
+        jobs = []
+        for chunk in iter_chunks(args.jobs):
+            jobs += stored_jobs(chunk, scorer.score_batch(chunk).scores)
+        return jobs
+
+    # Both are decoded from the rows the store returns, so neither shares strings
+    rows = [json.dumps(job) for job in load_dicts()]
+    dicts, dict_bytes = retained(lambda: [json.loads(row) for row in rows])
+    batch, batch_bytes = retained(lambda: JobBatch.from_dicts(json.loads(row) for row in rows))
+
+    print(f"{args.jobs} jobs held in memory")
+    print(f"  job dicts     {dict_bytes / 2**20:8.1f} MiB  {dict_bytes / args.jobs:6.0f} B/job")
+    print(f"  JobBatch      {batch_bytes / 2**20:8.1f} MiB  {batch_bytes / args.jobs:6.0f} B/job   "
+          f"{dict_bytes / batch_bytes:4.1f}x smaller")
+
+    mismatches = sum(1 for job, record in zip(dicts, batch) if job != record.to_dict())
+    print(f"  records differing from their dicts after to_dict(): {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark rescoring a job store after the profile or the weights change.
+
+Fills a throwaway store with a synthetic corpus (see benchmarks.corpus) and
+cached feature vectors, then compares scoring every stored job from its text
+with rescoring from the vectors, for a weight change and a term change.
+
+Usage:
+    python -m benchmarks.bench_rescore --jobs 100000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.corpus import iter_chunks
+from benchmarks.suite import stored_jobs
+from src.config import PIPELINE_CONFIG
+from src.profiles import DEFAULT_PROFILE, ProfileSet
+from src.rescore import rescore
+from src.scoring import JobScorer
+from src.storage import JobStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=100000, help='number of stored postings')
+    args = parser.parse_args()
+
+    scorer = JobScorer()
+    weights = dict(scorer.weights, title_match=scorer.weights['title_match'] + 0.05,
+                   skills_match=scorer.weights['skills_match'] - 0.05)
+    technical = list(scorer.technical_skills)
+    reweighted, added, removed = (
+        ProfileSet({DEFAULT_PROFILE: JobScorer(weights=weights, technical_skills=skills)})
+        for skills in (technical, technical + ['Kubernetes'], technical[:-1] + ['Kubernetes']))
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = JobStore(os.path.join(directory, 'jobs.db'))
+        batch_size = PIPELINE_CONFIG['batch_size']
+        for chunk in iter_chunks(args.jobs):
+            jobs = stored_jobs(chunk, scorer.score_batch(chunk).scores)
+            for i in range(0, len(jobs), batch_size):
+                batch = jobs[i:i + batch_size]
+                store.upsert_jobs(batch)
+                store.save_vectors(scorer.terms, [(job['id'], scorer.vector(job)) for job in batch])
+        print(f"{store.count()} stored jobs")
+
+        start = time.perf_counter()
+        jobs = store.query()
+        scores = reweighted.default.score_batch(jobs).scores
+        store.set_scores(zip((job['id'] for job in jobs), scores))
+        print(f"  rescore from text        {time.perf_counter() - start:7.2f}s")
+        del jobs
+
+        report = rescore(store, reweighted)
+        print(f"  weights changed          {report['seconds']:7.2f}s   "
+              f"{report['cached']} from cached vectors, {report['scores_written']} scores changed")
+        report = rescore(store, added)
+        print(f"  one skill added          {report['seconds']:7.2f}s   "
+              f"{report['searched']} searched for {', '.join(report['added_terms'])}, "
+              f"{report['scores_written']} scores changed")
+        report = rescore(store, removed)
+        print(f"  one skill removed        {report['seconds']:7.2f}s   "
+              f"{report['cached']} from cached vectors")
+
+        now = time.time()
+        rescore(store, removed, now)
+        jobs = store.query()
+        expected = removed.default.score_batch(jobs, now).scores
+        mismatches = sum(1 for job, score in zip(jobs, expected) if abs(job['score'] - score) > 1e-12)
+        print(f"  scores differing from scoring the text: {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark the batch scorer against the original per-job scoring loop.
+
+Usage:
+    python -m benchmarks.bench_scoring --jobs 100000
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from src.config import (
+    SEARCH_TITLES, REQUIRED_SKILLS, TECHNICAL_SKILLS,
+    TARGET_INDUSTRIES, LOCATION, SCORING_WEIGHTS
+)
+from src.logger import logger
+from src.scoring import UNKNOWN_MATCH, JobScorer
+
+FILLER = (
+    'team lead deliver roadmap budget vendor cross-functional reporting '
+    'strategy customers growth hybrid office benefits equity analytics '
+    'planning execution operations communication'
+).split()
+
+LOCATIONS = ['Los Angeles, CA', 'San Francisco, CA', 'Austin, TX', 'Remote', 'New York, NY']
+
+
+def legacy_score(job: Dict) -> float:
+    """Scoring loop as it was before the batch scorer, kept as the baseline."""
+    score = 0
+    criteria = {}
+    title_matches = any(title.lower() in job['title'].lower() for title in SEARCH_TITLES)
+    criteria['title_match'] = 1 if title_matches else 0
+    score += criteria['title_match'] * SCORING_WEIGHTS['title_match']
+    required_skills_found = sum(1 for skill in REQUIRED_SKILLS
+                                if skill.lower() in job['description'].lower())
+    technical_skills_found = sum(1 for skill in TECHNICAL_SKILLS
+                                 if skill.lower() in job['description'].lower())
+    skills_score = (required_skills_found / len(REQUIRED_SKILLS) * 0.7 +
+                    technical_skills_found / len(TECHNICAL_SKILLS) * 0.3)
+    criteria['skills_match'] = skills_score
+    score += skills_score * SCORING_WEIGHTS['skills_match']
+    industry_matches = any(industry.lower() in job['description'].lower()
+                           for industry in TARGET_INDUSTRIES)
+    criteria['industry_match'] = 1 if industry_matches else 0
+    score += criteria['industry_match'] * SCORING_WEIGHTS['industry_match']
+    location_matches = (LOCATION['city'].lower() in job['location'].lower() and
+                        LOCATION['state'].lower() in job['location'].lower())
+    criteria['location_match'] = 1 if location_matches else 0
+    score += criteria['location_match'] * SCORING_WEIGHTS['location_match']
+    # The old path always built these debug strings, even with DEBUG off
+    logger.debug(f"Job {job.get('id', 'unknown')} refinement score: {score}")
+    logger.debug(f"Scoring criteria: {criteria}")
+    return score
+
+
+def synthetic_jobs(count: int, seed: int = 0) -> List[Dict]:
+    """Generate postings with a realistic mix of profile terms and filler."""
+    rng = random.Random(seed)
+    terms = REQUIRED_SKILLS + TECHNICAL_SKILLS + TARGET_INDUSTRIES
+    jobs = []
+    for _ in range(count):
+        words = rng.choices(FILLER, k=rng.randint(20, 60))
+        words += rng.sample(terms, rng.randint(0, 6))
+        rng.shuffle(words)
+        title = rng.choice(SEARCH_TITLES + ['Software Engineer', 'Account Executive'])
+        jobs.append({
+            'title': rng.choice(['Senior ', '', 'Lead ']) + title,
+            'description': ' '.join(words).capitalize() + '.',
+            'location': rng.choice(LOCATIONS),
+        })
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=100000, help='number of synthetic postings')
+    args = parser.parse_args()
+
+    jobs = synthetic_jobs(args.jobs)
+    scorer = JobScorer()
+
+    start = time.perf_counter()
+    baseline = [legacy_score(job) for job in jobs]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = [scorer.score(job) for job in jobs]
+    single_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = scorer.score_batch(jobs)
+    batch_seconds = time.perf_counter() - start
+
+    # The old loop had no salary or recency criteria; these jobs state neither
+    offset = UNKNOWN_MATCH * (SCORING_WEIGHTS['salary_match'] + SCORING_WEIGHTS['recency_match'])
+    baseline = [score + offset for score in baseline]
+    mismatches = sum(1 for a, b, c in zip(baseline, single, batch.scores)
+                     if abs(a - b) > 1e-9 or abs(a - c) > 1e-9)
+    print(f"Scored {len(jobs)} jobs")
+    print(f"  per-job loop: {legacy_seconds:.3f}s ({len(jobs) / legacy_seconds:,.0f} jobs/s)")
+    print(f"  scorer.score: {single_seconds:.3f}s ({len(jobs) / single_seconds:,.0f} jobs/s)")
+    print(f"  batch scorer: {batch_seconds:.3f}s ({len(jobs) / batch_seconds:,.0f} jobs/s)")
+    print(f"  speed-up:     {legacy_seconds / batch_seconds:.1f}x")
+    print(f"  mismatched scores: {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
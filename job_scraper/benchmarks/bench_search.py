@@ -0,0 +1,98 @@
+"""
+Benchmark full-text job search over the store.
+
+Fills a throwaway store with a synthetic corpus (see benchmarks.corpus), then
+times JobStore.search() against scanning every stored job's title, company
+and description for the query words, and what keeping the index costs on
+writes.
+
+Usage:
+    python -m benchmarks.bench_search --jobs 100000
+"""
+
+import argparse
+import os
+import re
+import statistics
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.corpus import iter_chunks
+from benchmarks.suite import stored_jobs
+from src.config import PIPELINE_CONFIG
+from src.scoring import JobScorer
+from src.storage import JobStore, fts_query
+
+# Words, "phrases" and prefix* words, as fts_query() reads them
+QUERY_TOKEN = re.compile(r'"([^"]*)"|(\w+)(\*?)')
+
+QUERIES = ['python', 'salesforce crm', '"project management"', 'prog*', 'kubernetes', 'manager']
+
+
+def fill(store: JobStore, size: int, scorer: JobScorer) -> float:
+    """Write a scored corpus in pipeline-sized batches; return the write time."""
+    batch_size = PIPELINE_CONFIG['batch_size']
+    seconds = 0.0
+    for chunk in iter_chunks(size):
+        jobs = stored_jobs(chunk, scorer.score_batch(chunk).scores)
+        start = time.perf_counter()
+        for i in range(0, len(jobs), batch_size):
+            store.upsert_jobs(jobs[i:i + batch_size])
+        seconds += time.perf_counter() - start
+    return seconds
+
+
+def scan(jobs: List[Dict], text: str, limit: int = 20) -> List[Dict]:
+    """Jobs holding every query word or phrase, best score first, by reading each job's text."""
+    patterns = [re.compile(r'\b' + re.escape(phrase or word) + ('' if star else r'\b'), re.IGNORECASE)
+                for phrase, word, star in QUERY_TOKEN.findall(text)]
+    found = [job for job in jobs
+             if all(p.search(f"{job['title']} {job['company']} {job.get('description') or ''}")
+                    for p in patterns)]
+    return sorted(found, key=lambda job: -job['score'])[:limit]
+
+
+def timed(function, repeat: int) -> float:
+    """Median milliseconds of a call."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=100000, help='number of stored postings')
+    parser.add_argument('--repeat', type=int, default=20, help='runs per query')
+    args = parser.parse_args()
+
+    scorer = JobScorer()
+    with tempfile.TemporaryDirectory() as directory:
+        store = JobStore(os.path.join(directory, 'jobs.db'))
+        indexed_seconds = fill(store, args.jobs, scorer)
+        plain = JobStore(os.path.join(directory, 'plain.db'))
+        plain._connect().executescript(
+            'DROP TRIGGER jobs_fts_insert; DROP TRIGGER jobs_fts_update; DROP TRIGGER jobs_fts_delete;')
+        plain_seconds = fill(plain, args.jobs, scorer)
+        print(f"{store.count()} stored jobs")
+        print(f"  writes with the index    {args.jobs / indexed_seconds:9.0f} jobs/s")
+        print(f"  writes without it        {args.jobs / plain_seconds:9.0f} jobs/s")
+        start = time.perf_counter()
+        store.rebuild_search_index()
+        print(f"  rebuilding the index     {time.perf_counter() - start:9.2f}s")
+
+        jobs = store.query()
+        print(f"  {'query':24} {'matches':>8} {'search ms':>10} {'scan ms':>10}")
+        for text in QUERIES:
+            matches = store._connect().execute(
+                'SELECT COUNT(*) FROM jobs_fts WHERE jobs_fts MATCH ?', (fts_query(text),)).fetchone()[0]
+            search_ms = timed(lambda: store.search(text), args.repeat)
+            scan_ms = timed(lambda: scan(jobs, text), max(1, args.repeat // 10))
+            print(f"  {text:24} {matches:8d} {search_ms:10.2f} {scan_ms:10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark import and startup time of the web app and the scraper.
+
+Each case runs in a fresh interpreter, as a preforked web worker or a CLI
+invocation would, from a scratch directory so log and data files land
+there. Times exclude the bare interpreter start.
+
+Usage:
+    python -m benchmarks.bench_startup --repeat 7
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    'import src.scraper': 'import src.scraper',
+    'import app': 'import app',
+    'JobScraper()': 'from src.scraper import JobScraper; JobScraper()',
+    'first /jobs/top': 'import app; app.app.test_client().get("/jobs/top")',
+}
+
+
+def run(code: str, cwd: str, root: str) -> float:
+    env = dict(os.environ, PYTHONPATH=root)
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=7, help='runs per case, the median is reported')
+    parser.add_argument('--root', default=ROOT, help='job_scraper checkout to measure')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        bare = statistics.median(run('pass', directory, args.root) for _ in range(args.repeat))
+        print(f"interpreter start {bare * 1000:.0f} ms, median of {args.repeat} runs per case")
+        for name, code in CASES.items():
+            seconds = statistics.median(run(code, directory, args.root) for _ in range(args.repeat))
+            print(f"  {name:<20} {(seconds - bare) * 1000:7.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
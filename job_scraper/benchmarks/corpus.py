@@ -0,0 +1,245 @@
+"""
+Synthetic job corpora for the benchmark suite.
+
+Postings are generated deterministically from a seed, in chunks, so corpora
+from a thousand to a million postings can be streamed through every stage
+without holding them all in memory. Result pages wrap the postings in each
+board's card markup inside the page chrome of the saved fixture pages, so
+parsers see the same structure and page weight as a live scrape.
+"""
+
+import itertools
+import os
+import random
+from datetime import datetime, timedelta
+from html import escape
+from typing import Dict, Iterator, List
+
+from benchmarks.bench_dedup import ABBREVIATIONS, COMPANY_WORDS
+from benchmarks.bench_scoring import FILLER, LOCATIONS
+from src.config import (
+    REQUIRED_SKILLS, SEARCH_PARAMS, SEARCH_TITLES, TARGET_INDUSTRIES, TECHNICAL_SKILLS
+)
+from src.workers import Page
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+BOARDS = ('indeed', 'linkedin')
+LABELS = {'indeed': 'Indeed', 'linkedin': 'LinkedIn'}
+SEARCH_URLS = {
+    'indeed': 'https://www.indeed.com/jobs',
+    'linkedin': 'https://www.linkedin.com/jobs/search',
+}
+OTHER_TITLES = ['Software Engineer', 'Account Executive', 'Data Analyst', 'Office Manager']
+SYLLABLES = ['ba', 'co', 'de', 'fi', 'ga', 'lo', 'mi', 'nu', 'pe', 'ra', 'si', 'to', 'ven', 'dal', 'rek']
+VOCABULARY_SIZE = 5000
+
+
+def _vocabulary() -> List[str]:
+    """Pseudo-words with Zipf-like weights, so descriptions overlap like real ads do."""
+    rng = random.Random(42)
+    words = sorted({''.join(rng.choices(SYLLABLES, k=rng.randint(2, 4)))
+                    for _ in range(VOCABULARY_SIZE * 2)})
+    rng.shuffle(words)
+    return words[:VOCABULARY_SIZE]
+
+
+VOCABULARY = FILLER + _vocabulary()
+CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+
+
+def _description(rng: random.Random) -> List[str]:
+    """Bullet sentences mixing profile terms with common and rare words."""
+    terms = REQUIRED_SKILLS + TECHNICAL_SKILLS + TARGET_INDUSTRIES
+    bullets = []
+    for _ in range(rng.randint(3, 6)):
+        words = rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=rng.randint(8, 16))
+        words += rng.sample(terms, rng.randint(0, 2))
+        rng.shuffle(words)
+        bullets.append(' '.join(words).capitalize() + '.')
+    return bullets
+
+
+def _job_key(rng: random.Random, board: str) -> str:
+    """A board's own job id: Indeed job keys are hex, LinkedIn posting ids numeric."""
+    if board == 'indeed':
+        return format(rng.getrandbits(64), '016x')
+    return str(3_000_000_000 + rng.randrange(1_000_000_000))
+
+
+def _salary(rng: random.Random) -> str:
+    if rng.random() < 0.2:
+        return f'${rng.randint(30, 90)} an hour'
+    low = rng.randrange(60000, 180000, 1000)
+    return f'${low:,} - ${low + rng.randrange(10000, 50000, 1000):,} a year'
+
+
+def make_posting(rng: random.Random, board: str, number: int, now: datetime) -> Dict:
+    """
+    Generate one posting as its board would show it.
+
+    Args:
+        rng (random.Random): Source of randomness
+        board (str): 'indeed' or 'linkedin'
+        number (int): Position in the corpus, used for unique companies
+        now (datetime): Reference time for posting dates
+
+    Returns:
+        dict: Posting with the job fields plus 'board', 'job_key',
+            'bullets' and 'days_ago' used to render its card
+    """
+    days_ago = rng.randint(0, 45)
+    bullets = _description(rng)
+    job = {
+        'board': board,
+        'job_key': _job_key(rng, board),
+        'title': rng.choice(['Senior ', '', 'Lead ']) + rng.choice(SEARCH_TITLES + OTHER_TITLES),
+        'company': ' '.join(rng.sample(COMPANY_WORDS, 2)) + f' {number % 5000}',
+        'location': rng.choice(LOCATIONS),
+        'bullets': bullets,
+        'description': ' '.join(bullets),
+        'days_ago': days_ago,
+        'date_posted': (now - timedelta(days=days_ago)).date().isoformat(),
+        'source': LABELS[board],
+    }
+    if board == 'indeed' and rng.random() < 0.6:
+        job['salary'] = _salary(rng)
+    return job
+
+
+def repost(rng: random.Random, original: Dict) -> Dict:
+    """Copy a posting to another board with an abbreviated title and trimmed text."""
+    board = BOARDS[1 - BOARDS.index(original['board'])]
+    title = original['title']
+    for full, short in ABBREVIATIONS.items():
+        title = title.replace(full, short)
+    bullets = list(original['bullets'])
+    words = bullets[-1].split()
+    bullets[-1] = ' '.join(words[:max(1, len(words) - rng.randint(0, 3))])
+    return dict(original, board=board, source=LABELS[board], job_key=_job_key(rng, board),
+                title=title, bullets=bullets, description=' '.join(bullets))
+
+
+def iter_chunks(count: int, chunk_size: int = 10000, seed: int = 0,
+                repost_share: float = 0.05, now: datetime = None) -> Iterator[List[Dict]]:
+    """
+    Yield the postings of a corpus in chunks.
+
+    Every chunk is generated from its own seed, so the same corpus comes
+    out however much of it is consumed. About repost_share of the postings
+    repeat an earlier posting of the same chunk on the other board.
+
+    Args:
+        count (int): Postings in the corpus
+        chunk_size (int): Postings per chunk
+        seed (int): Corpus seed
+        repost_share (float): Share of postings that are cross-posts
+        now (datetime, optional): Reference time for posting dates,
+            defaults to the start of today
+
+    Yields:
+        list: Up to chunk_size postings, alternating between boards
+    """
+    now = now or datetime.combine(datetime.now().date(), datetime.min.time())
+    for start in range(0, count, chunk_size):
+        rng = random.Random(seed * 1_000_003 + start)
+        chunk = []
+        for number in range(start, min(start + chunk_size, count)):
+            if chunk and rng.random() < repost_share:
+                chunk.append(repost(rng, rng.choice(chunk)))
+            else:
+                chunk.append(make_posting(rng, BOARDS[number % 2], number, now))
+        yield chunk
+
+
+def indeed_card(job: Dict) -> str:
+    key = job['job_key']
+    title = escape(job['title'])
+    salary = ''
+    if job.get('salary'):
+        salary = ('<div class="metadata salary-snippet-container"><div class="salary-snippet">'
+                  f'<span>{escape(job["salary"])}</span></div></div>')
+    posted = 'Just posted' if not job['days_ago'] else f'Posted {job["days_ago"]} days ago'
+    bullets = ''.join(f'<li>{escape(bullet)}</li>' for bullet in job['bullets'])
+    return (
+        '<div class="cardOutline tapItem result job_seen_beacon"><table class="jobCard_mainContent" '
+        'role="presentation"><tbody><tr><td class="resultContent">\n'
+        '<div class="heading"><h2 class="jobTitle css-1h4a4n5 eu4oa1w0"><a class="jcs-JobTitle" '
+        f'data-jk="{key}" href="/rc/clk?jk={key}&amp;from=serp&amp;vjs=3" id="job_{key}">'
+        f'<span title="{title}">{title}</span></a></h2></div>\n'
+        f'<div class="company_location"><span class="companyName"><a href="/cmp/{key[:6]}">'
+        f'{escape(job["company"])}</a></span><div class="companyLocation">{escape(job["location"])}'
+        f'</div></div>\n{salary}</td></tr></tbody></table>\n'
+        '<table class="jobCardShelfContainer" role="presentation"><tbody><tr><td>'
+        f'<div class="job-snippet"><ul>{bullets}</ul></div>\n'
+        f'<span class="date">{posted}</span></td></tr></tbody></table></div>\n'
+    )
+
+
+def linkedin_card(job: Dict) -> str:
+    key = job['job_key']
+    title = escape(job['title'])
+    company = escape(job['company'])
+    return (
+        '<li><div class="base-card relative w-full hover:no-underline focus:no-underline '
+        'base-card--link base-search-card base-search-card--link job-search-card" '
+        f'data-entity-urn="urn:li:jobPosting:{key}" data-tracking-id="t{key[-6:]}">\n'
+        '<a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" '
+        f'href="https://www.linkedin.com/jobs/view/{key}/?refId=xyz&amp;trackingId=abc" '
+        'data-tracking-control-name="public_jobs_jserp-result_search-card">'
+        f'<span class="sr-only">{title}</span></a>\n'
+        '<div class="search-entity-media"><img class="artdeco-entity-image" '
+        f'data-delayed-url="https://media.licdn.com/logo{key[-4:]}.png" alt="{company}"></div>\n'
+        f'<div class="base-search-card__info"><h3 class="base-search-card__title">{title}</h3>\n'
+        '<h4 class="base-search-card__subtitle"><a class="hidden-nested-link" '
+        f'href="https://www.linkedin.com/company/c{key[-5:]}">{company}</a></h4>\n'
+        '<div class="base-search-card__metadata">'
+        f'<span class="job-search-card__location">{escape(job["location"])}</span>\n'
+        f'<time class="job-search-card__listdate" datetime="{job["date_posted"]}">'
+        f'{job["days_ago"]} days ago</time></div></div></div></li>\n'
+    )
+
+
+CARDS = {'indeed': indeed_card, 'linkedin': linkedin_card}
+# What the fixture pages put around their cards inside <main>
+LIST_MARKUP = {'indeed': ('', ''), 'linkedin': ('<ul class="jobs-search__results-list">', '</ul>')}
+_shells = {}
+
+
+def page_shell(board: str):
+    """The saved fixture page of a board, split around its result list."""
+    if board not in _shells:
+        with open(os.path.join(FIXTURES, f'{board}_search.html'), 'r') as f:
+            html = f.read()
+        head, rest = html.split('<main id="results">', 1)
+        _, tail = rest.split('</main>', 1)
+        opening, closing = LIST_MARKUP[board]
+        _shells[board] = (f'{head}<main id="results">{opening}', f'{closing}</main>{tail}')
+    return _shells[board]
+
+
+def render_page(board: str, jobs: List[Dict]) -> str:
+    """Render postings as one search result page of a board."""
+    head, tail = page_shell(board)
+    return head + ''.join(CARDS[board](job) for job in jobs) + tail
+
+
+def pages_for(chunk: List[Dict], offset: int = 0) -> List[Page]:
+    """
+    Lay a chunk of postings out as search result pages, page size per board.
+
+    Args:
+        chunk (list): Postings from iter_chunks()
+        offset (int): Position of the chunk in the corpus, keeps page URLs
+            unique across chunks
+
+    Returns:
+        list: Page records as the fetcher or the response cache would produce
+    """
+    pages = []
+    for board in BOARDS:
+        jobs = [job for job in chunk if job['board'] == board]
+        size = SEARCH_PARAMS[board]['page_size']
+        for i in range(0, len(jobs), size):
+            url = f"{SEARCH_URLS[board]}?q=bench&start={offset + i}"
+            pages.append(Page(board, url, render_page(board, jobs[i:i + size])))
+    return pages
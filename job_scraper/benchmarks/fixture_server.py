@@ -0,0 +1,122 @@
+"""
+Local HTTP server replaying the saved job board pages in benchmarks/fixtures.
+
+Search URLs under /indeed and /linkedin return the saved result pages, with
+LinkedIn posting links pointed back at this server, and /jobs/view/<id>
+returns a LinkedIn-style detail page. A fixed delay per response stands in
+for network latency. With vary_pages, every search query and `start` gets
+the postings under job ids of its own, so a scrape finds new jobs on every
+page and paginates to the end.
+
+Usage:
+    python -m benchmarks.fixture_server --port 8765 --latency 0.05 --vary-pages
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+LINKEDIN_ORIGIN = 'https://www.linkedin.com'
+DETAIL_PATH = re.compile(r'^/jobs/view/(\d+)')
+# Board job ids in the result pages: Indeed's hex job keys, LinkedIn's numeric posting ids
+INDEED_JOB_KEY = re.compile(r'((?:data-jk="|jk=))([0-9a-f]+)')
+LINKEDIN_POSTING_ID = re.compile(r'((?:jobPosting:|/jobs/view/))(\d+)')
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), 'r') as f:
+        return f.read()
+
+
+def page_job_id(job_id: str, page_key: str, digits: bool = False) -> str:
+    """A job id unique to one search page, derived from the fixture's id."""
+    digest = hashlib.sha1(f'{job_id}:{page_key}'.encode('utf-8')).hexdigest()[:15]
+    return str(int(digest, 16)) if digits else digest
+
+
+def make_handler(latency: float, vary_pages: bool = False):
+    pages = {
+        '/indeed': load_fixture('indeed_search.html'),
+        '/linkedin': load_fixture('linkedin_search.html'),
+    }
+    detail = load_fixture('linkedin_detail.html')
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(latency)
+            url = urlparse(self.path)
+            path = url.path
+            # Everything but the query and start of a search is the same on every page
+            query = parse_qs(url.query)
+            page_key = f"{query.get('q', query.get('keywords', ['']))[0]}:{query.get('start', ['0'])[0]}"
+            match = DETAIL_PATH.match(path)
+            if match:
+                body = detail.replace('{job_id}', match.group(1))
+            elif path.startswith('/linkedin'):
+                body = pages['/linkedin'].replace(LINKEDIN_ORIGIN, f"http://{self.headers['Host']}")
+                if vary_pages:
+                    body = LINKEDIN_POSTING_ID.sub(
+                        lambda m: m.group(1) + page_job_id(m.group(2), page_key, digits=True), body)
+            elif path.startswith('/indeed'):
+                body = pages['/indeed']
+                if vary_pages:
+                    body = INDEED_JOB_KEY.sub(lambda m: m.group(1) + page_job_id(m.group(2), page_key), body)
+            else:
+                self.send_error(404)
+                return
+            data = body.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return FixtureHandler
+
+
+def start_server(port: int = 0, latency: float = 0.0, vary_pages: bool = False) -> ThreadingHTTPServer:
+    """
+    Serve the fixtures from a daemon thread.
+
+    Args:
+        port (int): Port to listen on, 0 picks a free one
+        latency (float): Seconds to wait before each response
+        vary_pages (bool): Give every search query and page job ids of its own
+
+    Returns:
+        ThreadingHTTPServer: Running server; its base URL is
+            f'http://127.0.0.1:{server.server_port}'
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(latency, vary_pages))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.05, help='seconds per response')
+    parser.add_argument('--vary-pages', action='store_true', help='job ids of their own on every page')
+    args = parser.parse_args()
+    server = start_server(args.port, args.latency, args.vary_pages)
+    print(f"Serving fixtures on http://127.0.0.1:{server.server_port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,301 @@
+"""
+Run the offline benchmark suite over synthetic corpora and save the results.
+
+Each corpus size is pushed through every stage on its own: parsing result
+pages of both boards, batch scoring, near-duplicate detection, store writes,
+the backfill pipeline (parse, filter, dedupe, score and save on the process
+pool) and the web app's JSON and HTML endpoints over a store of that size.
+Corpora are generated in chunks from a seed (see benchmarks.corpus) and
+generation time is left out of every figure. Results are written as JSON
+named after the time and commit, so runs can be compared across commits.
+
+Usage:
+    python -m benchmarks.suite --sizes 1000 10000 100000
+    python -m benchmarks.suite --sizes 1000000 --stages parse score store
+    python -m benchmarks.suite --compare benchmarks/results/<earlier run>.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List
+
+from benchmarks.corpus import iter_chunks, pages_for
+from src.config import LOG_CONFIG, PIPELINE_CONFIG, SCHEDULER_CONFIG
+from src.features import add_features
+from src.utils.helpers import job_fingerprint
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+STAGES = ('parse', 'score', 'dedup', 'store', 'pipeline', 'flask')
+
+# Requests timed per endpoint; the cursor case is filled in with the first page's cursor
+ENDPOINTS = {
+    'top': '/jobs/top',
+    'top_100': '/jobs/top?limit=100',
+    'filtered': '/jobs/top?source=LinkedIn&min_score=0.3&location=CA',
+    'fields': '/jobs/top?limit=100&fields=title,company,score',
+    'next_page': '/jobs/top?limit=100&cursor={cursor}',
+    'search': '/jobs/search?q=python%20manager&fields=title,company,score',
+    'not_modified': '/jobs/top',
+    'index_html': '/',
+    'metrics': '/metrics',
+}
+
+
+def throughput(items: int, seconds: float, **extra) -> Dict:
+    return {'items': items, 'seconds': round(seconds, 4),
+            'per_second': round(items / seconds, 1) if seconds else None, **extra}
+
+
+def stored_jobs(chunk: List[Dict], scores: List[float]) -> List[Dict]:
+    """Postings as the scraper would store them: board ids, features, scores, no card-only fields."""
+    jobs = []
+    for posting, score in zip(chunk, scores):
+        job = {key: value for key, value in posting.items()
+               if key not in ('board', 'job_key', 'bullets', 'days_ago')}
+        job['job_id'] = posting['job_key']
+        job['id'] = job_fingerprint(job)
+        job['score'] = score
+        jobs.append(add_features(job))
+    return jobs
+
+
+def bench_parse(size: int, args) -> Dict:
+    from src.parsers import get_parsers
+
+    parsers = get_parsers()
+    seconds, pages, parsed, size_bytes = 0.0, 0, 0, 0
+    for offset, chunk in enumerate_chunks(size, args):
+        for page in pages_for(chunk, offset):
+            parser = parsers[page.source]
+            start = time.perf_counter()
+            jobs = [parser.parse_card(card) for card in parser.iter_cards(page.html)]
+            seconds += time.perf_counter() - start
+            pages += 1
+            parsed += sum(1 for job in jobs if job)
+            size_bytes += len(page.html)
+    assert parsed == size, f'parsed {parsed} of {size} postings'
+    return throughput(parsed, seconds, pages=pages,
+                      mb_per_second=round(size_bytes / seconds / 1e6, 2))
+
+
+def bench_score(size: int, args) -> Dict:
+    from src.scoring import JobScorer
+
+    scorer = JobScorer()
+    seconds = 0.0
+    for _, chunk in enumerate_chunks(size, args):
+        start = time.perf_counter()
+        scorer.score_batch(chunk)
+        seconds += time.perf_counter() - start
+    return throughput(size, seconds)
+
+
+def bench_dedup(size: int, args) -> Dict:
+    from src.dedup import NearDuplicateIndex
+
+    index = NearDuplicateIndex()
+    seconds, duplicates = 0.0, 0
+    for _, chunk in enumerate_chunks(size, args):
+        jobs = stored_jobs(chunk, [0.0] * len(chunk))
+        start = time.perf_counter()
+        duplicates += sum(1 for job in jobs if index.check(job))
+        seconds += time.perf_counter() - start
+    return throughput(size, seconds, duplicates=duplicates)
+
+
+def fill_store(store, size: int, args) -> float:
+    """Write a scored corpus to a store in pipeline-sized batches; return the write time."""
+    from src.scoring import JobScorer
+
+    scorer = JobScorer()
+    batch_size = PIPELINE_CONFIG['batch_size']
+    seconds = 0.0
+    for _, chunk in enumerate_chunks(size, args):
+        jobs = stored_jobs(chunk, scorer.score_batch(chunk).scores)
+        start = time.perf_counter()
+        for i in range(0, len(jobs), batch_size):
+            store.upsert_jobs(jobs[i:i + batch_size])
+        seconds += time.perf_counter() - start
+    return seconds
+
+
+def bench_store(size: int, args) -> Dict:
+    from src.storage import JobStore
+
+    store = JobStore(os.path.join('data', 'store_bench.db'))
+    seconds = fill_store(store, size, args)
+    start = time.perf_counter()
+    store.query(limit=100)
+    query_ms = (time.perf_counter() - start) * 1000
+    return throughput(store.count(), seconds, top_100_query_ms=round(query_ms, 2))
+
+
+def bench_pipeline(size: int, args) -> Dict:
+    from src.scraper import JobScraper
+
+    scraper = JobScraper(use_mock=False)
+    generation = [0.0]
+
+    def pages() -> Iterator:
+        for offset, chunk in enumerate_chunks(size, args):
+            start = time.perf_counter()
+            chunk_pages = pages_for(chunk, offset)
+            generation[0] += time.perf_counter() - start
+            yield from chunk_pages
+
+    start = time.perf_counter()
+    saved = sum(1 for _ in scraper.backfill(pages(), workers=args.workers))
+    seconds = time.perf_counter() - start - generation[0]
+    return throughput(size, seconds, saved=saved, stored=scraper.store.count())
+
+
+def bench_flask(size: int, args) -> Dict:
+    import app as web_app
+    from src.scraper import JobScraper
+
+    scraper = JobScraper(use_mock=True)
+    fill_store(scraper.store, size, args)
+    web_app._scraper = scraper
+    client = web_app.app.test_client()
+
+    first = client.get('/jobs/top?limit=100').get_json()
+    etag = client.get(ENDPOINTS['not_modified']).headers['ETag']
+    results = {}
+    for name, path in ENDPOINTS.items():
+        path = path.format(cursor=first['next_cursor'] or '')
+        headers = {'If-None-Match': etag} if name == 'not_modified' else {}
+        latencies = []
+        for _ in range(args.requests):
+            start = time.perf_counter()
+            response = client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code in (200, 304), f'{path}: {response.status_code}'
+        results[name] = {
+            'requests_per_second': round(len(latencies) / sum(latencies), 1),
+            'p50_ms': round(statistics.median(latencies) * 1000, 3),
+            'p95_ms': round(statistics.quantiles(latencies, n=20)[-1] * 1000, 3),
+        }
+    return results
+
+
+BENCHMARKS: Dict[str, Callable[[int, argparse.Namespace], Dict]] = {
+    'parse': bench_parse,
+    'score': bench_score,
+    'dedup': bench_dedup,
+    'store': bench_store,
+    'pipeline': bench_pipeline,
+    'flask': bench_flask,
+}
+
+
+def enumerate_chunks(size: int, args) -> Iterator:
+    """Yield (offset, chunk) over the corpus of a size."""
+    for i, chunk in enumerate(iter_chunks(size, args.chunk_size, args.seed)):
+        yield i * args.chunk_size, chunk
+
+
+def git_commit() -> str:
+    """Short commit of the checkout, marked dirty when it has local changes."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--', '.'], cwd=ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return commit + ('-dirty' if dirty else '')
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def headline(stage: str, result: Dict) -> str:
+    if stage == 'flask':
+        return '  '.join(f"{name} {value['requests_per_second']:.0f}/s"
+                         for name, value in result.items())
+    return f"{result['per_second']:12,.0f} jobs/s  {result['seconds']:8.2f}s"
+
+
+def compare(base: Dict, current: Dict) -> None:
+    """Print throughput of the current run relative to an earlier one."""
+    print(f"\nvs. {base['commit']} ({base['timestamp']})")
+    for size, stages in current['results'].items():
+        for stage, result in stages.items():
+            old = base['results'].get(size, {}).get(stage)
+            if not old:
+                continue
+            if stage == 'flask':
+                ratios = {name: value['requests_per_second'] / old[name]['requests_per_second']
+                          for name, value in result.items() if name in old}
+                line = '  '.join(f'{name} {ratio:.2f}x' for name, ratio in ratios.items())
+            else:
+                line = f"{result['per_second'] / old['per_second']:.2f}x"
+            print(f"  {size:>8} {stage:<9} {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help='corpus sizes in postings')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES))
+    parser.add_argument('--seed', type=int, default=0, help='corpus seed')
+    parser.add_argument('--chunk-size', type=int, default=10000, help='postings generated at a time')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='pipeline worker processes, defaults to the CPU count')
+    parser.add_argument('--requests', type=int, default=200, help='requests per web endpoint')
+    parser.add_argument('--output', default=None,
+                        help='result file, defaults to benchmarks/results/<time>-<commit>.json')
+    parser.add_argument('--compare', default=None, help='earlier result file to compare against')
+    args = parser.parse_args()
+
+    run = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'seed': args.seed,
+        'results': {},
+    }
+    # Stages run in scratch directories, so their data and caches start empty;
+    # per-job INFO logging is measured by bench_logging, not here
+    logs = tempfile.TemporaryDirectory()
+    LOG_CONFIG.update(directory=logs.name, level='WARNING')
+    SCHEDULER_CONFIG['interval'] = 0
+    sys.path.insert(0, ROOT)  # the web app is imported from inside a scratch directory
+    cwd = os.getcwd()
+    try:
+        for size in args.sizes:
+            results = run['results'][str(size)] = {}
+            for stage in args.stages:
+                with tempfile.TemporaryDirectory() as directory:
+                    os.chdir(directory)
+                    try:
+                        results[stage] = BENCHMARKS[stage](size, args)
+                    finally:
+                        os.chdir(cwd)
+                print(f"{size:>8} {stage:<9} {headline(stage, results[stage])}", flush=True)
+    finally:
+        os.chdir(cwd)
+        logs.cleanup()
+
+    output = args.output or os.path.join(
+        RESULTS, f"{datetime.now():%Y%m%d-%H%M%S}-{run['commit']}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(run, f, indent=2)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            compare(json.load(f), run)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+"""
+Command line entry point for re-parsing archived result pages.
+
+    python -m src.backfill                      # pages held in the HTTP cache
+    python -m src.backfill --dir pages/ -w 16   # saved <source>_*.html files
+"""
+
+import argparse
+import time
+
+from .scraper import JobScraper
+from .workers import read_page_directory
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--dir', help='Directory of saved <source>_*.html pages')
+    parser.add_argument('--base-url', help='URL relative job links in --dir pages resolve against')
+    parser.add_argument('-w', '--workers', type=int, help='Worker processes, defaults to CPU count')
+    args = parser.parse_args(argv)
+
+    scraper = JobScraper()
+    pages = read_page_directory(args.dir, args.base_url) if args.dir else None
+    start = time.perf_counter()
+    count = sum(1 for _ in scraper.backfill(pages, workers=args.workers))
+    print(f"Stored {count} new or changed jobs in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""
+Persistent HTTP response cache for the job scraper.
+Stores page bodies with their validators so stale pages can be revalidated
+with conditional requests instead of downloaded again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional
+
+from .config import CACHE_CONFIG
+from .logger import logger, log_error
+
+
+def cache_key(url: str, params: Dict = None) -> str:
+    """
+    Build a stable cache key from a URL and its query parameters.
+
+    Args:
+        url (str): Request URL
+        params (dict, optional): Query parameters
+
+    Returns:
+        str: Hex digest identifying the request
+    """
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+    raw = json.dumps([url, items], separators=(',', ':'))
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """
+    On-disk response cache with TTL expiry and size-based LRU eviction.
+
+    Each entry is a JSON file holding the body, ETag, Last-Modified and the
+    time it was last validated. File mtimes track recency of use for LRU.
+    """
+
+    def __init__(self, directory: str = None, fresh_for: float = None,
+                 ttl: float = None, max_bytes: int = None):
+        """
+        Args:
+            directory (str, optional): Cache directory
+            fresh_for (float, optional): Seconds an entry is served without revalidation
+            ttl (float, optional): Seconds after which an entry is discarded
+            max_bytes (int, optional): Total size cap before evicting least recently used
+        """
+        self.directory = directory or CACHE_CONFIG['directory']
+        self.fresh_for = CACHE_CONFIG['fresh_for'] if fresh_for is None else fresh_for
+        self.ttl = CACHE_CONFIG['ttl'] if ttl is None else ttl
+        self.max_bytes = max_bytes or CACHE_CONFIG['max_bytes']
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self._sizes = {
+            entry.name: entry.stat().st_size
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith('.json')
+        }
+        self._total = sum(self._sizes.values())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, url: str, params: Dict = None) -> Optional[Dict]:
+        """
+        Look up a cached response.
+
+        Args:
+            url (str): Request URL
+            params (dict, optional): Query parameters
+
+        Returns:
+            dict: Entry with body, etag, last_modified, validated_at and a
+                `fresh` flag, or None if missing or expired
+        """
+        key = cache_key(url, params)
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log_error(logger, e, {'cache_entry': path})
+            self._remove(key)
+            return None
+
+        age = time.time() - entry['validated_at']
+        if age > self.ttl:
+            self._remove(key)
+            return None
+        entry['fresh'] = age <= self.fresh_for
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict:
+        """Return If-None-Match/If-Modified-Since headers for a cached entry."""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, url: str, params: Dict, body: str, etag: str = None,
+            last_modified: str = None) -> None:
+        """
+        Store a response body with its validators.
+
+        Args:
+            url (str): Request URL
+            params (dict): Query parameters
+            body (str): Response text
+            etag (str, optional): ETag response header
+            last_modified (str, optional): Last-Modified response header
+        """
+        key = cache_key(url, params)
+        entry = {
+            'url': url,
+            'params': params or {},
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'validated_at': time.time(),
+        }
+        self._write(key, entry)
+
+    def revalidated(self, url: str, params: Dict, entry: Dict) -> None:
+        """
+        Mark an entry as confirmed current after a 304 response.
+
+        Args:
+            url (str): Request URL
+            params (dict): Query parameters
+            entry (dict): Entry returned by get()
+        """
+        entry = {k: v for k, v in entry.items() if k != 'fresh'}
+        entry['validated_at'] = time.time()
+        self._write(cache_key(url, params), entry)
+
+    def _write(self, key: str, entry: Dict) -> None:
+        path = self._path(key)
+        tmp_path = f'{path}.{threading.get_ident()}.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log_error(logger, e, {'cache_entry': path})
+            return
+        name = os.path.basename(path)
+        with self._lock:
+            self._total += size - self._sizes.get(name, 0)
+            self._sizes[name] = size
+        if self._total > self.max_bytes:
+            self._evict()
+
+    def _remove(self, key: str) -> None:
+        name = f'{key}.json'
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self._total -= self._sizes.pop(name, 0)
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under max_bytes."""
+        with self._lock:
+            names = list(self._sizes)
+        entries = []
+        for name in names:
+            try:
+                entries.append((os.path.getmtime(os.path.join(self.directory, name)), name))
+            except FileNotFoundError:
+                pass
+        entries.sort()
+        for _, name in entries:
+            if self._total <= self.max_bytes:
+                break
+            self._remove(name[:-len('.json')])
+
+    def iter_entries(self) -> Iterator[Dict]:
+        """
+        Yield every unexpired entry, e.g. to re-parse archived pages.
+
+        Yields:
+            dict: Entry with url, params, body, etag, last_modified and validated_at
+        """
+        with self._lock:
+            names = list(self._sizes)
+        now = time.time()
+        for name in names:
+            try:
+                with open(os.path.join(self.directory, name), 'r') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if now - entry['validated_at'] <= self.ttl:
+                yield entry
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            names = list(self._sizes)
+        for name in names:
+            self._remove(name[:-len('.json')])
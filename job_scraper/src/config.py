@@ -69,32 +69,138 @@ MAX_SALARY = 200000
 REQUEST_CONFIG = {
     'timeout': 30,
     'max_retries': 3,
-    'retry_delay': 5,
+    'rate': 2.0,  # requests per second per host
+    'burst': 4,  # requests allowed back to back per host
+    'backoff_base': 1.0,  # seconds, doubled on every retry
+    'backoff_max': 60,  # cap on a single backoff or Retry-After wait
+    'retry_statuses': [429, 500, 502, 503, 504],
     'headers': {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
 }
 
+# Use bundled mock data instead of contacting the real job boards
+USE_MOCK_DATA = True
+
+# Concurrent fetch configuration
+FETCH_CONFIG = {
+    'max_workers': 16,  # global limit on in-flight requests
+    'per_host_limit': 4,  # max in-flight requests per host
+    'max_pages': 10,  # result pages fetched per search title
+    'pool_hosts': 8  # hosts whose keep-alive connection pools stay open
+}
+
+# Streaming pipeline settings
+PIPELINE_CONFIG = {
+    'queue_size': 256,  # max items buffered between two stages
+    'batch_size': 100,  # jobs persisted per store write
+    'flush_interval': 1.0,  # seconds before a partial batch is persisted
+    'process_workers': None,  # parse/score processes for backfills, None = CPU count
+    'pages_per_worker': 4  # pages queued per worker process
+}
+
+# Detail page fetches for boards whose cards lack a description (LinkedIn)
+ENRICH_CONFIG = {
+    'enabled': True,
+    'max_workers': 8,  # concurrent detail fetches
+    'per_host_limit': 2  # concurrent detail fetches per host
+}
+
+# Near-duplicate detection across boards and reposts
+DEDUP_CONFIG = {
+    'enabled': True,
+    'num_perm': 64,  # MinHash signature length
+    'bands': 16,  # LSH bands; more bands catch less similar pairs
+    'shingle_size': 2,  # words per shingle
+    'threshold': 0.7  # estimated Jaccard similarity treated as a duplicate
+}
+
+# Background refresh settings for the web app
+SCHEDULER_CONFIG = {
+    'interval': 6 * 60 * 60,  # seconds between scheduled refreshes, 0 disables them
+    'history': 50,  # finished refreshes kept for status lookups
+    'lease_ttl': 300,  # seconds a refresh holds the cross-process refresh lease between renewals
+    'lease_poll': 5  # seconds between checks while another process holds the lease
+}
+
+# Parser backend per job board: 'lxml' (precompiled XPath) or 'soup' (BeautifulSoup)
+PARSER_CONFIG = {
+    'indeed': 'lxml',
+    'linkedin': 'lxml'
+}
+
+# Query parameter names and page sizes for each job board
+SEARCH_PARAMS = {
+    'indeed': {
+        'query': 'q',
+        'location': 'l',
+        'start': 'start',
+        'page_size': 10
+    },
+    'linkedin': {
+        'query': 'keywords',
+        'location': 'location',
+        'start': 'start',
+        'page_size': 25
+    }
+}
+
 # Refinement scoring weights (0-1)
 SCORING_WEIGHTS = {
     'title_match': 0.3,
     'skills_match': 0.25,
     'industry_match': 0.2,
     'location_match': 0.15,
-    'salary_match': 0.1
+    'salary_match': 0.1,  # share of the posted range inside MIN_SALARY-MAX_SALARY
+    'recency_match': 0.0  # falls from 1 when posted to 0 at MAX_JOB_AGE; off unless a weight is given
 }
 
-# Job post age limit (in days)
+# Job post age limit (in days); older jobs are dropped before scoring and pruned from storage
 MAX_JOB_AGE = 30
 
+# Candidate profiles besides the one above, scored against the same scrape
+PROFILE_CONFIG = {
+    'directory': 'profiles',  # one <name>.json of JobScorer settings per profile
+    'default': 'default'  # name of the profile defined in this file
+}
+
 # Output settings
 OUTPUT_DIRECTORY = 'data'
 JSON_FILENAME = 'jobs.json'
 CSV_FILENAME = 'jobs.csv'
+SEEN_INDEX_FILENAME = 'seen_jobs.json'
+
+# Job storage settings
+STORAGE_CONFIG = {
+    'database': 'data/jobs.db',
+    'export_json': False,  # also rewrite data/jobs.json after every save
+    'page_size': 100  # jobs rendered on the index page
+}
+
+# Full-text job search (/jobs/search)
+SEARCH_CONFIG = {
+    'column_weights': {'title': 4.0, 'company': 2.0, 'description': 1.0},  # BM25 weight per field
+    'score_weight': 0.5  # share of the relevance score in the ranking, the rest is text match
+}
+
+# HTTP response cache settings
+CACHE_CONFIG = {
+    'enabled': True,
+    'directory': 'data/http_cache',
+    'fresh_for': 300,  # seconds served from disk without revalidation
+    'ttl': 7 * 24 * 3600,  # seconds before an entry is discarded
+    'max_bytes': 200 * 1024 * 1024  # total size before LRU eviction
+}
 
 # Logging configuration
 LOG_CONFIG = {
+    'directory': 'logs',
     'filename': 'job_scraper.log',
+    'per_process': False,  # name each process's file after its pid; forked workers always do
     'level': 'INFO',
-    'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # console lines
+    'json': True,  # write the log file as JSON lines
+    'rotate_when': None,  # e.g. 'midnight' to rotate by time instead of size
+    'max_bytes': 10 * 1024 * 1024,  # log file size that triggers a size rotation
+    'backup_count': 5  # rotated files kept
 }
@@ -0,0 +1,201 @@
+"""
+Near-duplicate detection for job postings across boards and reposts.
+Postings are reduced to MinHash signatures over word shingles and bucketed
+with locality-sensitive hashing, so each new posting is only compared with
+the few stored postings sharing a bucket instead of with every posting.
+Postings without a description are never collapsed: their text is only the
+title, company and location, which different roles at one employer share.
+"""
+
+import operator
+import re
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from .config import DEDUP_CONFIG
+from .utils.helpers import clean_job_title
+
+_WORD = re.compile(r'\w+')
+
+# Shingle hashes are cut to 32 bits. They come from the built-in string hash,
+# which is salted per process; signatures are therefore rebuilt from the
+# store by each process and never persisted.
+_MASK = 0xFFFFFFFF
+
+
+class Duplicate(NamedTuple):
+    """A posting collapsed into an earlier canonical posting."""
+    canonical_id: str
+    id: str
+    source: str
+    url: str
+
+
+def job_text(job: Dict) -> str:
+    """Normalized text a posting's signature is built from."""
+    return ' '.join([
+        clean_job_title(job.get('title') or ''),
+        job.get('company') or '',
+        job.get('location') or '',
+        job.get('description') or '',
+    ]).lower()
+
+
+def source_entry(job: Dict) -> Dict[str, str]:
+    """The {'source', 'url'} record listed under a canonical job's 'sources'."""
+    return {'source': job.get('source') or '', 'url': job.get('url') or ''}
+
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH index of canonical postings.
+
+    Signatures use one-permutation hashing: every shingle is hashed once and
+    lands in one of `num_perm` bins that keep their minimum, which costs one
+    hash per shingle instead of one per shingle and permutation. Signatures
+    are cut into `bands` bands; postings sharing any band are candidates,
+    and candidates whose estimated Jaccard similarity reaches `threshold`
+    are duplicates.
+
+    Not thread-safe; the scraper only touches it from one thread at a time.
+    """
+
+    def __init__(self, num_perm: int = None, bands: int = None,
+                 shingle_size: int = None, threshold: float = None):
+        """
+        Args:
+            num_perm (int, optional): Signature length, defaults to DEDUP_CONFIG
+            bands (int, optional): LSH bands, must divide num_perm
+            shingle_size (int, optional): Words per shingle
+            threshold (float, optional): Minimum estimated Jaccard similarity
+        """
+        self.num_perm = num_perm or DEDUP_CONFIG['num_perm']
+        self.bands = bands or DEDUP_CONFIG['bands']
+        self.shingle_size = shingle_size or DEDUP_CONFIG['shingle_size']
+        self.threshold = DEDUP_CONFIG['threshold'] if threshold is None else threshold
+        if self.num_perm % self.bands:
+            raise ValueError(f"bands ({self.bands}) must divide num_perm ({self.num_perm})")
+        self.rows = self.num_perm // self.bands
+        self._signatures: Dict[str, array] = {}
+        # One bucket table per band, mapping a band hash to the ids in it
+        self._buckets = [{} for _ in range(self.bands)]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._signatures
+
+    def signature(self, job: Dict) -> array:
+        """
+        Compute a posting's MinHash signature.
+
+        Args:
+            job (dict): Job posting information
+
+        Returns:
+            array: num_perm unsigned 64-bit values
+        """
+        words = _WORD.findall(job_text(job))
+        k = self.shingle_size
+        if len(words) > k:
+            shingles = set(map(' '.join, zip(*(words[i:] for i in range(k)))))
+        else:
+            shingles = {' '.join(words)}
+
+        # Every step below runs in C: hash the shingles, pick each one's bin,
+        # and let dict() keep the last, i.e. smallest, hash per bin
+        num_perm = self.num_perm
+        hashes = sorted(map(_MASK.__and__, map(hash, shingles)), reverse=True)
+        bin_of = map(operator.rshift, map(operator.mul, hashes, repeat(num_perm)), repeat(32))
+        minimums = dict(zip(bin_of, hashes))
+        bins = list(map(minimums.get, range(num_perm), repeat(0)))
+
+        # Densify: an empty bin borrows the next filled bin's value (wrapping
+        # around), offset by the distance so borrowed values only match the
+        # same borrowing pattern
+        if len(minimums) < num_perm:
+            filled = sorted(minimums)
+            for i in set(range(num_perm)).difference(minimums):
+                j = bisect_left(filled, i)
+                following = filled[j] if j < len(filled) else filled[0] + num_perm
+                bins[i] = minimums[following % num_perm] + ((following - i) << 32)
+        return array('Q', bins)
+
+    def similarity(self, a: array, b: array) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return sum(map(int.__eq__, a, b)) / self.num_perm
+
+    def _band_keys(self, signature: array) -> Iterable[int]:
+        raw = signature.tobytes()
+        width = self.rows * signature.itemsize
+        return (hash(raw[i * width:(i + 1) * width]) for i in range(self.bands))
+
+    def find(self, signature: array, exclude: str = None) -> Optional[str]:
+        """
+        Return the id of the most similar indexed posting above the threshold.
+
+        Args:
+            signature (array): Signature from signature()
+            exclude (str, optional): Id to ignore, e.g. the posting itself
+
+        Returns:
+            str: Canonical job id, or None if the posting is not a duplicate
+        """
+        candidates = set()
+        for buckets, key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(buckets.get(key, ()))
+        candidates.discard(exclude)
+
+        best, best_similarity = None, self.threshold
+        for candidate in candidates:
+            similarity = self.similarity(signature, self._signatures[candidate])
+            if similarity >= best_similarity:
+                best, best_similarity = candidate, similarity
+        return best
+
+    def add(self, job_id: str, signature: array) -> None:
+        """Index a canonical posting, replacing its previous signature."""
+        if job_id in self._signatures:
+            self.remove(job_id)
+        self._signatures[job_id] = signature
+        for buckets, key in zip(self._buckets, self._band_keys(signature)):
+            buckets.setdefault(key, []).append(job_id)
+
+    def remove(self, job_id: str) -> None:
+        """Drop a posting from the index."""
+        signature = self._signatures.pop(job_id, None)
+        if signature is None:
+            return
+        for buckets, key in zip(self._buckets, self._band_keys(signature)):
+            bucket = buckets.get(key)
+            if bucket and job_id in bucket:
+                bucket.remove(job_id)
+                if not bucket:
+                    del buckets[key]
+
+    def check(self, job: Dict) -> Optional[Duplicate]:
+        """
+        Collapse a posting into an indexed near-duplicate, or index it as canonical.
+
+        A posting matching its own earlier version (same id) is canonical
+        and its signature is refreshed. A posting without a description is
+        indexed as canonical without being compared, so that it can be
+        checked again once enriched. New canonical postings get a 'sources'
+        list holding their own board and URL.
+
+        Args:
+            job (dict): Parsed job with its fingerprint as 'id'
+
+        Returns:
+            Duplicate: Where to record the posting's URL, or None if canonical
+        """
+        signature = self.signature(job)
+        canonical_id = self.find(signature, exclude=job['id']) if job.get('description') else None
+        if canonical_id is not None:
+            return Duplicate(canonical_id, job['id'], job.get('source') or '', job.get('url') or '')
+        job.setdefault('sources', [source_entry(job)])
+        self.add(job['id'], signature)
+        return None
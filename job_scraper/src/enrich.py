@@ -0,0 +1,149 @@
+"""
+Description enrichment from job detail pages.
+Boards such as LinkedIn leave the description off their result cards; this
+fetches each posting's detail page once, concurrently, and rescores only the
+postings that gained a description.
+"""
+
+import statistics
+import time
+from typing import Callable, Dict, List, Optional
+
+from .config import ENRICH_CONFIG
+from .features import add_features
+from .fetcher import ConcurrentFetcher, PageRequest
+from .logger import logger
+from .parsers.base import BaseParser
+from .seen_index import SeenJobsIndex
+from .storage import JobStore
+
+
+def latency_percentiles(latencies: List[float]) -> Dict[str, float]:
+    """
+    Summarize request latencies in milliseconds.
+
+    Args:
+        latencies (list): Latencies in seconds
+
+    Returns:
+        dict: p50, p90, p99 and max, empty if there were no requests
+    """
+    if not latencies:
+        return {}
+    if len(latencies) == 1:
+        cuts = latencies * 99
+    else:
+        cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+    return {
+        'p50': round(cuts[49] * 1000, 1),
+        'p90': round(cuts[89] * 1000, 1),
+        'p99': round(cuts[98] * 1000, 1),
+        'max': round(max(latencies) * 1000, 1),
+    }
+
+
+class DetailEnricher:
+    """
+    Fills in job descriptions that only a posting's detail page carries.
+
+    Detail pages go through the scraper's fetch function, so they share its
+    rate limiter, retries and response cache. The seen-jobs index records
+    every fetched detail page; later runs copy the description from the job
+    store instead of fetching again, unless the store has none for the job.
+    """
+
+    def __init__(self, fetch: Callable[[str, Dict], Optional[str]],
+                 parsers: Dict[str, BaseParser], seen: SeenJobsIndex, store: JobStore,
+                 score: Callable[[Dict], float],
+                 max_workers: int = None, per_host_limit: int = None):
+        """
+        Args:
+            fetch (callable): Function taking (url, params) and returning page text
+            parsers (dict): Board name to parser, as from get_parsers()
+            seen (SeenJobsIndex): Index recording fetched detail pages
+            store (JobStore): Store holding previously fetched descriptions
+            score (callable): Scores a job after its description changed
+            max_workers (int, optional): Concurrent detail fetches,
+                defaults to ENRICH_CONFIG['max_workers']
+            per_host_limit (int, optional): Concurrent fetches per host,
+                defaults to ENRICH_CONFIG['per_host_limit']
+        """
+        self.fetch = fetch
+        self.parsers = {parser.label: parser for parser in parsers.values() if parser.has_detail_page}
+        self.seen = seen
+        self.store = store
+        self.score = score
+        self.max_workers = max_workers or ENRICH_CONFIG['max_workers']
+        self.per_host_limit = per_host_limit or ENRICH_CONFIG['per_host_limit']
+        self.last_report = {}
+
+    def needs_detail(self, job: Dict) -> bool:
+        """Whether a job is missing a description its board's detail page has."""
+        return not job.get('description') and bool(job.get('url')) and job.get('source') in self.parsers
+
+    def enrich(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Add descriptions to the jobs that need one and rescore them.
+
+        Jobs are updated in place. Detail pages that could not be fetched
+        are left for the next run.
+
+        Args:
+            jobs (list): Scored jobs, typically the new ones from a scrape
+
+        Returns:
+            list: The jobs that gained a description, rescored
+        """
+        enriched, pending = [], {}
+        reused = 0
+        for job in jobs:
+            if not self.needs_detail(job):
+                continue
+            if self.seen.has_detail(job['id']):
+                stored = self.store.get(job['id'])
+                if stored and stored.get('description'):
+                    job['description'] = stored['description']
+                    add_features(job)
+                    job['score'] = self.score(job)
+                    enriched.append(job)
+                    reused += 1
+                    continue
+            pending.setdefault(job['url'], []).append(job)
+
+        latencies = []
+
+        def timed_fetch(url: str, params: Dict) -> Optional[str]:
+            start = time.perf_counter()
+            try:
+                return self.fetch(url, params)
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+        fetched = 0
+        requests = [PageRequest(jobs_[0]['source'], jobs_[0]['title'], 0, url, None)
+                    for url, jobs_ in pending.items()]
+        fetcher = ConcurrentFetcher(timed_fetch, self.max_workers, self.per_host_limit)
+        for page_request, html in fetcher.fetch_all(requests):
+            if html is None:
+                continue
+            fetched += 1
+            description = self.parsers[page_request.source].parse_detail(html)
+            for job in pending[page_request.url]:
+                self.seen.mark_detail(job['id'])
+                if description:
+                    # The description may state the salary the card did not
+                    job['description'] = description
+                    add_features(job)
+                    job['score'] = self.score(job)
+                    enriched.append(job)
+
+        self.last_report = {
+            'requested': len(requests),
+            'fetched': fetched,
+            'reused': reused,
+            'enriched': len(enriched),
+            'latency_ms': latency_percentiles(latencies),
+        }
+        if requests or reused:
+            logger.info("Detail enrichment: %s", self.last_report, extra=self.last_report)
+        return enriched
@@ -0,0 +1,120 @@
+"""
+Numeric job features computed once when a job is ingested.
+The salary range and posting time are parsed from the posting's text and
+stored with the job, so scoring, salary filters and pruning read numbers
+instead of parsing salary and date strings again.
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from .config import MAX_JOB_AGE
+from .utils.extraction import date_from, salary_from
+
+# Job fields holding features; absent when the posting does not say
+FEATURE_FIELDS = ('salary_min', 'salary_max', 'posted_at')
+
+DAY = 24 * 60 * 60
+
+
+def posted_timestamp(text: Optional[str], reference: Optional[str] = None) -> Optional[float]:
+    """
+    Parse an ISO or relative ("Posted 3 days ago") date to a POSIX timestamp.
+
+    Relative dates count back from the reference (when the job was found),
+    so the result does not drift when a stored job is processed again later.
+
+    Args:
+        text (str): Posting date as shown on the board
+        reference (str, optional): ISO time the job was found
+
+    Returns:
+        float: Timestamp, or None if the text is not a date
+    """
+    if not text:
+        return None
+    try:
+        return datetime.fromisoformat(text).timestamp()
+    except (TypeError, ValueError):
+        pass
+    now = None
+    if reference:
+        try:
+            now = datetime.fromisoformat(reference)
+        except ValueError:
+            pass
+    parsed = date_from(text.lower(), now)
+    return parsed.timestamp() if parsed else None
+
+
+def add_features(job: Dict) -> Dict:
+    """
+    Compute a job's numeric features and store them on it.
+
+    The salary comes from the salary field, else from the description. The
+    posting time comes from date_posted, else from date_found, so every job
+    found by the scraper has an age. A relative date_posted is rewritten as
+    the ISO time it stands for, so it still reads right in later days.
+    Features the posting does not state are left out, like any other
+    missing field.
+
+    Args:
+        job (dict): Parsed job, updated in place
+
+    Returns:
+        dict: The same job
+    """
+    salary = None
+    if job.get('salary'):
+        salary = salary_from(job['salary'], job['salary'].lower())
+    elif job.get('description'):
+        salary = salary_from(job['description'], job['description'].lower(), free_text=True)
+
+    date_posted = job.get('date_posted')
+    posted_at = posted_timestamp(date_posted, job.get('date_found'))
+    if posted_at is not None and not _is_iso(date_posted):
+        posted = datetime.fromtimestamp(posted_at).replace(microsecond=0)
+        job['date_posted'] = posted.isoformat()
+        posted_at = posted.timestamp()
+    if posted_at is None:
+        posted_at = posted_timestamp(job.get('date_found'))
+
+    features = {
+        'salary_min': salary['min'] if salary else None,
+        'salary_max': salary['max'] if salary else None,
+        'posted_at': posted_at,
+    }
+    for key, value in features.items():
+        if value is None:
+            job.pop(key, None)
+        else:
+            job[key] = value
+    return job
+
+
+def _is_iso(text: str) -> bool:
+    try:
+        datetime.fromisoformat(text)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def is_stale(job: Dict, now: float = None, max_age: float = None) -> bool:
+    """
+    Whether a job was posted longer ago than the age limit.
+
+    Args:
+        job (dict): Job with features from add_features()
+        now (float, optional): Current timestamp, defaults to now
+        max_age (float, optional): Age limit in days, defaults to MAX_JOB_AGE
+
+    Returns:
+        bool: True if the job is too old; jobs without a posting time never are
+    """
+    posted_at = job.get('posted_at')
+    if posted_at is None:
+        return False
+    max_age = MAX_JOB_AGE if max_age is None else max_age
+    return posted_at < (now or time.time()) - max_age * DAY
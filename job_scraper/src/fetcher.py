@@ -0,0 +1,172 @@
+"""
+Concurrent page fetching for the job scraper.
+Fans search requests out over a bounded thread pool with per-host concurrency limits.
+"""
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
+
+from .config import FETCH_CONFIG, SEARCH_PARAMS
+from .logger import logger, log_error
+
+
+class PageRequest(NamedTuple):
+    """A single search result page to fetch."""
+    source: str
+    title: str
+    page: int
+    url: str
+    params: Dict
+
+
+def build_page_requests(base_urls: Dict[str, str], titles: List[str],
+                        location: str, max_pages: int) -> List[PageRequest]:
+    """
+    Build one request per board, search title and result page.
+
+    Requests are interleaved by page so that the first pages of every search
+    are fetched before deeper pages of any single search.
+
+    Args:
+        base_urls (dict): Mapping of board name to search URL
+        titles (list): Job titles to search for
+        location (str): Location query string
+        max_pages (int): Number of result pages per search
+
+    Returns:
+        list: PageRequest entries for every combination
+    """
+    page_requests = []
+    for page in range(max_pages):
+        for source, url in base_urls.items():
+            names = SEARCH_PARAMS.get(source, SEARCH_PARAMS['indeed'])
+            for title in titles:
+                params = {
+                    names['query']: title,
+                    names['location']: location,
+                }
+                if page:
+                    params[names['start']] = page * names['page_size']
+                page_requests.append(PageRequest(source, title, page, url, params))
+    return page_requests
+
+
+def next_page_request(page_request: PageRequest) -> PageRequest:
+    """
+    Build the request for the result page following page_request.
+
+    Args:
+        page_request (PageRequest): Current page
+
+    Returns:
+        PageRequest: Request for the next page of the same search
+    """
+    names = SEARCH_PARAMS.get(page_request.source, SEARCH_PARAMS['indeed'])
+    page = page_request.page + 1
+    params = dict(page_request.params)
+    params[names['start']] = page * names['page_size']
+    return page_request._replace(page=page, params=params)
+
+
+class HostLimiter:
+    """
+    Politeness limiter bounding in-flight requests per host.
+    """
+
+    def __init__(self, max_concurrent: int):
+        """
+        Args:
+            max_concurrent (int): Max in-flight requests per host
+        """
+        self.max_concurrent = max_concurrent
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def _semaphore(self, host: str) -> threading.Semaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.max_concurrent)
+            return self._semaphores[host]
+
+    def acquire(self, host: str) -> None:
+        """Block until a request to host may start."""
+        self._semaphore(host).acquire()
+
+    def release(self, host: str) -> None:
+        """Mark a request to host as finished."""
+        self._semaphore(host).release()
+
+
+class ConcurrentFetcher:
+    """
+    Fetch many pages concurrently through a blocking fetch function.
+    """
+
+    def __init__(self, fetch: Callable[[str, Dict], Optional[str]],
+                 max_workers: int = None, per_host_limit: int = None):
+        """
+        Args:
+            fetch (callable): Function taking (url, params) and returning page text;
+                request pacing is left to the fetch function's rate limiter
+            max_workers (int, optional): Global concurrency limit
+            per_host_limit (int, optional): Max in-flight requests per host
+        """
+        self.fetch = fetch
+        self.max_workers = max_workers or FETCH_CONFIG['max_workers']
+        self.limiter = HostLimiter(per_host_limit or FETCH_CONFIG['per_host_limit'])
+        self._executor = None
+
+    def _fetch_one(self, page_request: PageRequest) -> Optional[str]:
+        host = urlparse(page_request.url).netloc
+        self.limiter.acquire(host)
+        try:
+            return self.fetch(page_request.url, page_request.params)
+        except Exception as e:
+            log_error(logger, e, {'url': page_request.url, 'params': page_request.params})
+            return None
+        finally:
+            self.limiter.release(host)
+
+    def __enter__(self) -> 'ConcurrentFetcher':
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+
+    def submit(self, page_request: PageRequest,
+               on_done: Callable[[PageRequest, Optional[str]], None]) -> None:
+        """
+        Fetch a page in the background; only valid inside a `with` block.
+
+        Args:
+            page_request (PageRequest): Page to fetch
+            on_done (callable): Called from the worker thread with
+                (page_request, page text or None on failure)
+        """
+        self._executor.submit(lambda: on_done(page_request, self._fetch_one(page_request)))
+
+    def fetch_all(self, page_requests: List[PageRequest]) -> Iterator[Tuple[PageRequest, Optional[str]]]:
+        """
+        Fetch all pages, yielding results in completion order.
+
+        Args:
+            page_requests (list): Pages to fetch
+
+        Yields:
+            tuple: (PageRequest, page text or None on failure)
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_one, page_request): page_request
+                for page_request in page_requests
+            }
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_request = futures.pop(future)
+                    content = future.result()
+                    yield page_request, content
@@ -0,0 +1,256 @@
+"""
+In-memory index over the job store for the web app.
+Jobs are loaded once, kept sorted by score with secondary indexes by source,
+company and location, and reloaded only when the store's version changes.
+Reloads after the first run in the background, and queries keep being
+served from the previous snapshot meanwhile, so a scrape writing batch
+after batch never makes a request wait for a full reload.
+"""
+
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from heapq import merge
+from itertools import islice, takewhile
+from sys import intern
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .logger import logger, log_error
+from .records import JobBatch
+from .scoring import TermMatcher
+from .storage import JobStore
+
+# Rows per snapshot whose job dicts are kept after being served
+SERVED_CACHE_SIZE = 10000
+
+
+class _Snapshot:
+    """
+    Immutable view of the store at one version.
+
+    Rows are ordered like JobStore.query(order_by='score'): score descending,
+    then id, and held as a JobBatch of slotted records. Secondary indexes map
+    a lowercased key to the ascending row positions holding it, so every
+    posting list is itself in score order.
+    """
+
+    def __init__(self, jobs: List[Dict], version: int):
+        self.version = version
+        self.batch = JobBatch.from_dicts(jobs)
+        self.jobs = self.batch.records
+        # Negated scores ascend with position, so bisect finds score cutoffs
+        self.neg_scores = array('d', (-(job.score or 0.0) for job in self.jobs))
+        # Lowercased filter keys per row, for checking filters that do not drive a query;
+        # interned, since boards, companies and locations repeat across many rows
+        self.sources = [intern((job.source or '').lower()) for job in self.jobs]
+        self.companies = [intern((job.company or '').lower()) for job in self.jobs]
+        self.locations = [intern((job.location or '').lower()) for job in self.jobs]
+        self.by_source = self._postings(self.sources)
+        self.by_company = self._postings(self.companies)
+        self.by_location = self._postings(self.locations)
+        # Job dicts already served, by row; the top pages are requested over and over
+        self._dicts: Dict[int, Dict] = {}
+
+    def job_dict(self, position: int) -> Dict:
+        """Return the job dict of a row, shared with earlier callers."""
+        job = self._dicts.get(position)
+        if job is None:
+            job = self.jobs[position].to_dict()
+            if len(self._dicts) < SERVED_CACHE_SIZE:
+                self._dicts[position] = job
+        return job
+
+    def position_after(self, cursor: Tuple[float, str]) -> int:
+        """Return the first row position ordered after a (score, id) cursor."""
+        score, job_id = cursor
+        return bisect_right(self.jobs, (-score, job_id),
+                            key=lambda job: (-(job.score or 0.0), job.id))
+
+    @staticmethod
+    def _postings(keys: List[str]) -> Dict[str, List[int]]:
+        postings = defaultdict(list)
+        for position, key in enumerate(keys):
+            postings[key].append(position)
+        return postings
+
+
+class JobIndex:
+    """
+    Score-ordered in-memory job index that stays in sync with a JobStore.
+
+    Each query costs one version lookup in SQLite; the full reload only
+    happens after the store was written to, on a background thread, while
+    queries are answered from the snapshot being replaced. Only the first
+    query loads in the calling thread. Jobs are held as slotted records;
+    the job dicts returned are shared between callers and must be treated
+    as read-only.
+    """
+
+    def __init__(self, store: JobStore, profile: str = None):
+        """
+        Args:
+            store (JobStore): Store to mirror
+            profile (str, optional): Profile whose scores rank the jobs,
+                defaults to the default profile
+        """
+        self.store = store
+        self.profile = profile
+        self._lock = threading.Lock()  # guards _reloading
+        self._load_lock = threading.Lock()  # one load at a time
+        self._reloading = False
+        self._snapshot = None
+
+    def _current(self) -> _Snapshot:
+        """Return the snapshot to serve, starting a background reload if the store moved on."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.refresh()
+        if snapshot.version == self.store.version():
+            return snapshot
+        with self._lock:
+            if not self._reloading:
+                self._reloading = True
+                threading.Thread(target=self._reload, name='job-index-reload', daemon=True).start()
+        return snapshot
+
+    def _reload(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            log_error(logger, e, {'profile': self.profile})
+        finally:
+            with self._lock:
+                self._reloading = False
+
+    def refresh(self) -> _Snapshot:
+        """
+        Bring the snapshot up to date with the store in the calling thread.
+
+        The scraper calls this when a scrape ends, so the first requests
+        after it see the new jobs.
+
+        Returns:
+            _Snapshot: The current snapshot
+        """
+        with self._load_lock:
+            # The version is read first, so writes during the load only cause another reload
+            version = self.store.version()
+            if self._snapshot is None or self._snapshot.version != version:
+                self._snapshot = _Snapshot(self.store.query(order_by='score', profile=self.profile),
+                                           version)
+                logger.debug("Loaded %d jobs into the job index", len(self._snapshot.jobs))
+            return self._snapshot
+
+    def version(self) -> int:
+        """Store version of the snapshot queries are answered from, for ETags."""
+        return self._current().version
+
+    def _positions(self, snapshot: _Snapshot, source: str = None, company: str = None,
+                   location: str = None, min_score: float = None,
+                   titles: Sequence[str] = None, min_salary: float = None,
+                   max_salary: float = None,
+                   after: Tuple[float, str] = None) -> Iterable[int]:
+        """
+        Lazily yield matching row positions in score order.
+
+        The narrowest indexed filter's posting lists drive the walk and the
+        remaining filters are checked per row, so fetching the first k matches
+        touches roughly k rows instead of every match.
+        """
+        start = snapshot.position_after(after) if after else 0
+        end = len(snapshot.jobs)
+        if min_score is not None:
+            end = bisect_right(snapshot.neg_scores, -min_score)
+        end = max(start, end)
+
+        # Filters without an index are only ever checked per row
+        checks = []
+        if titles:
+            matcher = TermMatcher(titles)
+            checks.append(lambda p: matcher.any(snapshot.jobs[p].title.lower()))
+        if min_salary is not None or max_salary is not None:
+            lows, highs = snapshot.batch.salary_min, snapshot.batch.salary_max
+            low = float('-inf') if min_salary is None else min_salary
+            high = float('inf') if max_salary is None else max_salary
+            # Keep jobs whose range overlaps the requested one, and jobs without a
+            # salary (NaN, which fails every comparison)
+            checks.append(lambda p: not (highs[p] < low or lows[p] > high))
+
+        # (posting lists, row check) for each filter given
+        filters = []
+        if source:
+            key = source.lower()
+            filters.append(([snapshot.by_source.get(key, [])],
+                            lambda p, key=key: snapshot.sources[p] == key))
+        if company:
+            key = company.lower()
+            filters.append(([snapshot.by_company.get(key, [])],
+                            lambda p, key=key: snapshot.companies[p] == key))
+        if location:
+            # Locations match by substring like the store, so every key containing it counts
+            needle = location.lower()
+            filters.append(([postings for key, postings in snapshot.by_location.items() if needle in key],
+                            lambda p: needle in snapshot.locations[p]))
+        if not filters:
+            driver = range(start, end)
+        else:
+            filters.sort(key=lambda f: sum(map(len, f[0])))
+            postings = filters[0][0]
+            if len(postings) == 1:
+                driver = self._slice(postings[0], start, end)
+            else:
+                driver = takewhile(lambda p: p < end,
+                                   merge(*(self._slice(lst, start, end) for lst in postings)))
+            checks = [check for _, check in filters[1:]] + checks
+        if not checks:
+            return driver
+        return (p for p in driver if all(check(p) for check in checks))
+
+    @staticmethod
+    def _slice(postings: List[int], start: int, end: int) -> Iterable[int]:
+        """Lazily yield the posting list entries in [start, end) without copying."""
+        return map(postings.__getitem__,
+                   range(bisect_left(postings, start), bisect_left(postings, end)))
+
+    def query(self, source: str = None, company: str = None, location: str = None,
+              min_score: float = None, titles: Sequence[str] = None,
+              min_salary: float = None, max_salary: float = None,
+              after: Tuple[float, str] = None, limit: Optional[int] = None,
+              offset: int = 0) -> List[Dict]:
+        """
+        Return the best scoring jobs matching the filters.
+
+        Takes the same filters as JobStore.query() plus title and salary
+        filters, always ordered by score.
+
+        Args:
+            source (str, optional): Job board name, case-insensitive
+            company (str, optional): Company name, case-insensitive
+            location (str, optional): Substring of the location
+            min_score (float, optional): Minimum relevance score
+            titles (list, optional): Keep jobs whose title contains any of these
+            min_salary (float, optional): Keep jobs whose salary range reaches this
+            max_salary (float, optional): Keep jobs whose salary range starts below this;
+                jobs without a parseable salary pass both salary filters
+            after (tuple, optional): (score, id) of the last job of the previous
+                page, for keyset pagination that stays stable across reloads
+            limit (int, optional): Max jobs to return, all if None
+            offset (int): Number of jobs to skip
+
+        Returns:
+            list: Job dictionaries, best first
+        """
+        snapshot = self._current()
+        positions = self._positions(snapshot, source, company, location, min_score,
+                                    titles, min_salary, max_salary, after)
+        stop = None if limit is None else offset + limit
+        return [snapshot.job_dict(p) for p in islice(positions, offset, stop)]
+
+    def count(self, **filters) -> int:
+        """Count jobs matching the same filters as query()."""
+        snapshot = self._current()
+        positions = self._positions(snapshot, **filters)
+        if isinstance(positions, range):
+            return len(positions)
+        return sum(1 for _ in positions)
@@ -1,58 +1,174 @@
 """
 Logging configuration for the job scraper.
-Sets up logging with both file and console handlers.
+Records are handed to a queue and written by a listener thread to the console
+and a rotating log file of JSON lines, so scraping threads never wait on log
+I/O. Worker processes write log files of their own. Importing this module only looks the logger up; handlers are added by
+setup_logger(), which the scraper calls when it is constructed.
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
 from .config import LOG_CONFIG
 
+# Running QueueListeners, stopped by stop_logging()
+_listeners = []
+
+# Attributes every LogRecord has; any other attribute came in through `extra`
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line.
+    
+    Fields passed with `extra=` become top-level keys, so records can be
+    filtered by job id, source or page without parsing the message.
+    """
+    
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key in record.__dict__.keys() - _RECORD_ATTRS:
+            entry[key] = record.__dict__[key]
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue records without QueueHandler's full format and copy.
+    
+    Only the message arguments are merged, so later changes to them (e.g. a
+    job dict being rescored) cannot leak into the record; formatting,
+    timestamps and tracebacks are left to the listener thread.
+    """
+    
+    def prepare(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+class _RotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Size-rotating file handler that formats each record once.
+    
+    The stock handler formats every record a second time and seeks to the
+    end of the file to decide whether to roll over; this one counts what it
+    writes (in characters, which is close enough for a rotation threshold).
+    """
+    
+    _size = None
+    
+    def emit(self, record):
+        try:
+            line = self.format(record) + self.terminator
+            if self._size is None:
+                self._size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+            if self.maxBytes and self._size and self._size + len(line) > self.maxBytes:
+                self.doRollover()
+                self._size = 0
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(line)
+            self.stream.flush()
+            self._size += len(line)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+def _log_path(per_process):
+    """Path of the log file, e.g. logs/job_scraper.4242.log for process 4242 when per_process."""
+    filename = LOG_CONFIG['filename']
+    if per_process:
+        stem, extension = os.path.splitext(filename)
+        filename = f'{stem}.{os.getpid()}{extension}'
+    return os.path.join(LOG_CONFIG['directory'], filename)
+
+def _file_handler(per_process=None):
+    """
+    Build the rotating file handler described by LOG_CONFIG.
+    
+    Args:
+        per_process (bool, optional): Write a file named after this process,
+            defaults to LOG_CONFIG['per_process']
+    """
+    os.makedirs(LOG_CONFIG['directory'], exist_ok=True)
+    path = _log_path(LOG_CONFIG['per_process'] if per_process is None else per_process)
+    if LOG_CONFIG['rotate_when']:
+        handler = logging.handlers.TimedRotatingFileHandler(
+            path, when=LOG_CONFIG['rotate_when'], backupCount=LOG_CONFIG['backup_count'],
+            encoding='utf-8', delay=True
+        )
+    else:
+        handler = _RotatingFileHandler(
+            path, maxBytes=LOG_CONFIG['max_bytes'], backupCount=LOG_CONFIG['backup_count'],
+            encoding='utf-8', delay=True
+        )
+    if LOG_CONFIG['json']:
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(LOG_CONFIG['format']))
+    return handler
+
 def setup_logger(name='job_scraper'):
     """
     Configure and return a logger instance with both file and console handlers.
     
+    The logger itself only enqueues records; a QueueListener thread formats
+    and writes them, and is stopped (flushing the queue) at exit. Every
+    process rotates its own file: a forked worker switches to a file named
+    after its pid, as does every process when LOG_CONFIG['per_process'] is set.
+    
     Args:
         name (str): Name of the logger instance
-        
+    
     Returns:
         logging.Logger: Configured logger instance
     """
-    # Create logger
     logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(LOG_CONFIG['level'])
     
     # Prevent adding handlers multiple times
     if logger.handlers:
         return logger
-        
-    # Create logs directory if it doesn't exist
-    logs_dir = 'logs'
-    if not os.path.exists(logs_dir):
-        os.makedirs(logs_dir)
-    
-    # Create file handler with timestamp in filename
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    file_handler = logging.FileHandler(
-        os.path.join(logs_dir, f'job_scraper_{timestamp}.log')
-    )
-    file_handler.setLevel(LOG_CONFIG['level'])
-    
-    # Create console handler
+    
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(LOG_CONFIG['level'])
+    console_handler.setFormatter(logging.Formatter(LOG_CONFIG['format']))
+    handlers = [_file_handler(), console_handler]
     
-    # Create formatter
-    formatter = logging.Formatter(LOG_CONFIG['format'])
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    if not _listeners:
+        atexit.register(stop_logging)
+    _listeners.append(listener)
+    queue_handler = _QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    def log_directly():
+        # A forked worker process inherits the queue but not the listener
+        # thread, and must not rotate or interleave lines with its parent's file
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.addHandler(_file_handler(per_process=True))
+        logger.addHandler(console_handler)
     
+    os.register_at_fork(after_in_child=log_directly)
     return logger
 
+def stop_logging():
+    """Write out every queued record and stop the listener threads."""
+    while _listeners:
+        _listeners.pop().stop()
+
 def log_error(logger, error, context=None):
     """
     Log an error with optional context information.
@@ -62,10 +178,10 @@ def log_error(logger, error, context=None):
         error (Exception): The error to log
         context (dict, optional): Additional context information
     """
-    error_msg = f"Error: {str(error)}"
     if context:
-        error_msg += f"\nContext: {context}"
-    logger.error(error_msg)
+        logger.error("Error: %s\nContext: %s", error, context, extra={'context': context})
+    else:
+        logger.error("Error: %s", error)
 
 def log_job_found(logger, job_info):
     """
@@ -75,8 +191,11 @@ def log_job_found(logger, job_info):
         logger (logging.Logger): Logger instance
         job_info (dict): Information about the found job
     """
-    logger.info(f"Found job: {job_info.get('title')} at {job_info.get('company')}")
-    logger.debug(f"Job details: {job_info}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Found job: %s at %s", job_info.get('title'), job_info.get('company'),
+                    extra={'job_id': job_info.get('id'), 'source': job_info.get('source')})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Job details: %s", job_info)
 
 def log_scraping_progress(logger, source, page, total_jobs):
     """
@@ -88,7 +207,8 @@ def log_scraping_progress(logger, source, page, total_jobs):
         page (int): Current page number
         total_jobs (int): Total jobs found so far
     """
-    logger.info(f"Scraping {source} - Page {page} - Total jobs found: {total_jobs}")
+    logger.info("Scraping %s - Page %s - Total jobs found: %s", source, page, total_jobs,
+                extra={'source': source, 'page': page, 'total_jobs': total_jobs})
 
 def log_refinement_result(logger, job_id, score, criteria):
     """
@@ -100,8 +220,10 @@ def log_refinement_result(logger, job_id, score, criteria):
         score (float): Refinement score
         criteria (dict): Scoring criteria details
     """
-    logger.debug(f"Job {job_id} refinement score: {score}")
-    logger.debug(f"Scoring criteria: {criteria}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Job %s refinement score: %s", job_id, score,
+                     extra={'job_id': job_id, 'score': score, 'criteria': criteria})
+        logger.debug("Scoring criteria: %s", criteria)
 
-# Create a default logger instance
-logger = setup_logger()
+# The shared logger; configured by setup_logger()
+logger = logging.getLogger('job_scraper')
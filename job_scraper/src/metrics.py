@@ -0,0 +1,375 @@
+"""
+Scrape pipeline metrics.
+Counters and histograms labelled by job board, rendered in the Prometheus
+text exposition format for the web app's /metrics route and diffed into a
+summary after every scrape run.
+
+Each process observes its own scrapes. After every run they are added to
+totals kept in the job store (see ScrapeMetrics.save()), so /metrics reports
+the same figures whichever worker process serves it.
+"""
+
+import json
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Upper bounds in seconds; fetches wait on the network, the rest on the CPU
+FETCH_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+CPU_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels_text(names: Sequence[str], values: Tuple, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def add_states(total, delta, sign: int = 1):
+    """
+    Add one metrics state to another, see ScrapeMetrics.state().
+
+    States are dicts and lists nested around numbers; whatever one of them
+    lacks counts as zero.
+
+    Args:
+        total: State to add to, left unchanged
+        delta: State to add
+        sign (int): 1 to add delta, -1 to subtract it
+
+    Returns:
+        The sum, shaped like delta merged into total
+    """
+    if isinstance(delta, dict):
+        total = total or {}
+        result = dict(total)
+        for key, value in delta.items():
+            result[key] = add_states(total.get(key), value, sign)
+        return result
+    if isinstance(delta, list):
+        total = total or [0] * len(delta)
+        return [add_states(old, new, sign) for old, new in zip(total, delta)]
+    return (total or 0) + sign * delta
+
+
+class Counter:
+    """
+    Monotonic counter with optional labels.
+    """
+
+    kind = 'counter'
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        """
+        Args:
+            name (str): Metric name
+            help_text (str): One-line description
+            labels (list, optional): Label names, passed to inc() as keywords
+        """
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(labels[name] for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self) -> Dict[Tuple, float]:
+        """Return the value per label tuple."""
+        with self._lock:
+            return dict(self._values)
+
+    def render(self, values: Dict[Tuple, float] = None) -> List[str]:
+        """Render the values, as from snapshot(), defaulting to this counter's."""
+        values = self.snapshot() if values is None else values
+        return [f'{self.name}{_labels_text(self.labels, key)} {_number(value)}'
+                for key, value in sorted(values.items())]
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram with optional labels.
+    """
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float],
+                 labels: Sequence[str] = ()):
+        """
+        Args:
+            name (str): Metric name
+            help_text (str): One-line description
+            buckets (list): Ascending bucket upper bounds; +Inf is implied
+            labels (list, optional): Label names, passed to observe() as keywords
+        """
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(buckets) + (math.inf,)
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        # Per label tuple: [per-bucket counts (not cumulative), sum]
+        self._values: Dict[Tuple, list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(labels[name] for name in self.labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observe the wall time spent in a with-block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def snapshot(self) -> Dict[Tuple, Tuple[List[int], float]]:
+        """Return (per-bucket counts, sum) per label tuple."""
+        with self._lock:
+            return {key: (list(counts), total) for key, (counts, total) in self._values.items()}
+
+    def quantile(self, q: float, counts: Sequence[int]) -> Optional[float]:
+        """
+        Estimate a quantile from per-bucket counts by interpolating inside its bucket.
+
+        Args:
+            q (float): Quantile between 0 and 1
+            counts (list): Per-bucket counts, as from snapshot()
+
+        Returns:
+            float: Estimated value, None without observations
+        """
+        total = sum(counts)
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(counts):
+            if count and seen + count >= rank:
+                low = self.buckets[i - 1] if i else 0.0
+                high = self.buckets[i] if i < len(self.buckets) - 1 else low
+                return low + (high - low) * (rank - seen) / count
+            seen += count
+        return self.buckets[-2]
+
+    def render(self, values: Dict[Tuple, Tuple[List[int], float]] = None) -> List[str]:
+        """Render the values, as from snapshot(), defaulting to this histogram's."""
+        values = self.snapshot() if values is None else values
+        lines = []
+        for key, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = 'le="' + _number(bound) + '"'
+                lines.append(f'{self.name}_bucket{_labels_text(self.labels, key, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_labels_text(self.labels, key)} {_number(total)}')
+            lines.append(f'{self.name}_count{_labels_text(self.labels, key)} {cumulative}')
+        return lines
+
+
+class ScrapeMetrics:
+    """
+    The scraper's metrics: fetch, parse, score and save stages per board.
+
+    Observations are cheap (a perf_counter pair and a short lock), so they
+    stay on in production.
+    """
+
+    def __init__(self, request_stats=None):
+        """
+        Args:
+            request_stats (RequestStats, optional): Retry, throttle and cache
+                counters kept by the rate limiter, included in render()
+        """
+        self.request_stats = request_stats
+        self.fetch_seconds = Histogram(
+            'job_scraper_fetch_seconds', 'HTTP response latency per attempt',
+            FETCH_BUCKETS, ['board'])
+        self.fetch_bytes = Counter(
+            'job_scraper_fetch_bytes_total', 'Response body bytes downloaded', ['board'])
+        self.fetches = Counter(
+            'job_scraper_fetches_total', 'Page fetches by outcome', ['board', 'outcome'])
+        self.parse_seconds = Histogram(
+            'job_scraper_parse_seconds', 'Time parsing one result page',
+            CPU_BUCKETS, ['board'])
+        self.jobs_parsed = Counter(
+            'job_scraper_jobs_parsed_total', 'New or changed jobs parsed', ['board'])
+        self.jobs_stale = Counter(
+            'job_scraper_jobs_stale_total', 'Parsed jobs dropped as older than MAX_JOB_AGE', ['board'])
+        self.score_seconds = Histogram(
+            'job_scraper_score_seconds', 'Time scoring one job', CPU_BUCKETS, ['board'])
+        self.save_seconds = Histogram(
+            'job_scraper_save_seconds', 'Time writing one batch to the job store', CPU_BUCKETS)
+        self.jobs_saved = Counter(
+            'job_scraper_jobs_saved_total', 'Jobs written to the job store')
+        self.jobs_pruned = Counter(
+            'job_scraper_jobs_pruned_total', 'Stored jobs deleted as older than MAX_JOB_AGE')
+        self.run_seconds = Histogram(
+            'job_scraper_run_seconds', 'Duration of a whole scrape run',
+            (1, 5, 15, 30, 60, 120, 300, 600, 1800))
+        self.metrics = [self.fetch_seconds, self.fetch_bytes, self.fetches, self.parse_seconds,
+                        self.jobs_parsed, self.jobs_stale, self.score_seconds,
+                        self.save_seconds, self.jobs_saved, self.jobs_pruned, self.run_seconds]
+        # state() as of the last save(), already part of the stored totals
+        self._saved: Dict = {}
+
+    def state(self) -> Dict:
+        """
+        Everything observed by this process, as JSON-ready data.
+
+        Returns:
+            dict: Metric name -> JSON list of label values -> counter value
+                or [per-bucket counts, sum], with the request counters under
+                'requests'
+        """
+        state = {
+            metric.name: {json.dumps(key): list(value) if isinstance(value, tuple) else value
+                          for key, value in metric.snapshot().items()}
+            for metric in self.metrics
+        }
+        if self.request_stats is not None:
+            stats = self.request_stats.snapshot()
+            stats['retries_by_status'] = {str(status): count
+                                          for status, count in stats['retries_by_status'].items()}
+            state['requests'] = stats
+        return state
+
+    def save(self, store) -> None:
+        """
+        Add what this process observed since the last save to the totals in the job store.
+
+        Args:
+            store (JobStore): Store shared by every worker process
+        """
+        state = self.state()
+        store.add_metrics(add_states(state, self._saved, -1))
+        self._saved = state
+
+    def render(self, shared: Dict = None) -> str:
+        """
+        Return every metric in the Prometheus text exposition format.
+
+        Args:
+            shared (dict, optional): Totals saved by every process, from
+                JobStore.metrics(), to which this process's unsaved
+                observations are added; without them, only this process's
+                observations are rendered
+        """
+        state = self.state()
+        if shared is not None:
+            state = add_states(shared, add_states(state, self._saved, -1))
+        lines = []
+        for metric in self.metrics:
+            values = {tuple(json.loads(key)): tuple(value) if isinstance(value, list) else value
+                      for key, value in state.get(metric.name, {}).items()}
+            lines.append(f'# HELP {metric.name} {metric.help}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(metric.render(values))
+        stats = state.get('requests')
+        if stats is not None:
+            lines += [
+                '# HELP job_scraper_requests_sent_total HTTP requests sent, including retries',
+                '# TYPE job_scraper_requests_sent_total counter',
+                f"job_scraper_requests_sent_total {stats['requests_sent']}",
+                '# HELP job_scraper_throttled_seconds_total Time spent waiting on rate limits and backoff',
+                '# TYPE job_scraper_throttled_seconds_total counter',
+                f"job_scraper_throttled_seconds_total {_number(float(stats['throttled_seconds']))}",
+                '# HELP job_scraper_retries_total Retried requests by status code or error',
+                '# TYPE job_scraper_retries_total counter',
+            ]
+            lines += [f'job_scraper_retries_total{{status="{status}"}} {count}'
+                      for status, count in sorted(stats['retries_by_status'].items(), key=str)]
+            lines += [
+                '# HELP job_scraper_cache_total Response cache lookups by outcome',
+                '# TYPE job_scraper_cache_total counter',
+            ]
+            lines += [f'job_scraper_cache_total{{outcome="{outcome}"}} {count}'
+                      for outcome, count in sorted(stats['cache'].items())]
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> Dict:
+        """Capture every metric, to diff against later with summary()."""
+        return {metric.name: metric.snapshot() for metric in self.metrics}
+
+    def summary(self, before: Dict) -> Dict:
+        """
+        Summarize what was observed since a snapshot() was taken.
+
+        Args:
+            before (dict): Snapshot from the start of the run
+
+        Returns:
+            dict: Per-board fetch, parse and score figures plus save totals,
+                with latencies in milliseconds
+        """
+        after = self.snapshot()
+
+        def counter_delta(metric):
+            old = before.get(metric.name, {})
+            return {key: value - old.get(key, 0) for key, value in after[metric.name].items()
+                    if value - old.get(key, 0)}
+
+        def histogram_delta(metric):
+            old = before.get(metric.name, {})
+            deltas = {}
+            for key, (counts, total) in after[metric.name].items():
+                old_counts, old_total = old.get(key, ([0] * len(counts), 0.0))
+                counts = [new - prev for new, prev in zip(counts, old_counts)]
+                if any(counts):
+                    deltas[key] = (counts, total - old_total)
+            return deltas
+
+        def timing(metric, counts, total):
+            count = sum(counts)
+            return {
+                'count': count,
+                'total_ms': round(total * 1000, 1),
+                'mean_ms': round(total / count * 1000, 2),
+                'p50_ms': round(metric.quantile(0.5, counts) * 1000, 2),
+                'p90_ms': round(metric.quantile(0.9, counts) * 1000, 2),
+            }
+
+        boards = {}
+        for metric, field in ((self.fetch_seconds, 'fetch'), (self.parse_seconds, 'parse'),
+                              (self.score_seconds, 'score')):
+            for (board,), (counts, total) in histogram_delta(metric).items():
+                boards.setdefault(board, {})[field] = timing(metric, counts, total)
+        for (board,), value in counter_delta(self.fetch_bytes).items():
+            boards.setdefault(board, {})['bytes'] = int(value)
+        for (board,), value in counter_delta(self.jobs_parsed).items():
+            boards.setdefault(board, {})['jobs_parsed'] = int(value)
+        for (board,), value in counter_delta(self.jobs_stale).items():
+            boards.setdefault(board, {})['jobs_stale'] = int(value)
+        for (board, outcome), value in counter_delta(self.fetches).items():
+            boards.setdefault(board, {}).setdefault('fetches', {})[outcome] = int(value)
+
+        save = histogram_delta(self.save_seconds).get(())
+        return {
+            'boards': boards,
+            'save': timing(self.save_seconds, *save) if save else None,
+            'jobs_saved': int(counter_delta(self.jobs_saved).get((), 0)),
+            'jobs_pruned': int(counter_delta(self.jobs_pruned).get((), 0)),
+        }
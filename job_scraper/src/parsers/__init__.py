@@ -0,0 +1,48 @@
+"""
+Job board specific parsers for search result pages.
+Each board has a BeautifulSoup parser and an lxml/XPath parser sharing one
+interface; PARSER_CONFIG selects the backend per board.
+"""
+
+from importlib import import_module
+from typing import Dict, Type
+
+from ..config import PARSER_CONFIG
+from .base import BaseParser
+
+# (module, class name) per board and backend. Backend modules are imported
+# when a parser is first built, so importing this package does not load
+# bs4 or lxml.
+PARSERS = {
+    ('indeed', 'soup'): ('.soup', 'SoupIndeedParser'),
+    ('linkedin', 'soup'): ('.soup', 'SoupLinkedInParser'),
+    ('indeed', 'lxml'): ('.xpath', 'XPathIndeedParser'),
+    ('linkedin', 'lxml'): ('.xpath', 'XPathLinkedInParser'),
+}
+
+
+def parser_class(source: str, backend: str) -> Type[BaseParser]:
+    """Import and return the parser class for a board and backend."""
+    module, name = PARSERS[(source, backend)]
+    return getattr(import_module(module, __name__), name)
+
+
+def get_parser(source: str, backend: str = None) -> BaseParser:
+    """
+    Build the parser for a job board.
+
+    Args:
+        source (str): Board name, e.g. 'indeed'
+        backend (str, optional): 'lxml' or 'soup', defaults to PARSER_CONFIG
+
+    Returns:
+        BaseParser: Parser instance
+    """
+    backend = backend or PARSER_CONFIG.get(source, 'soup')
+    return parser_class(source, backend)()
+
+
+def get_parsers(backends: Dict[str, str] = None) -> Dict[str, BaseParser]:
+    """Build one parser per configured board, keyed by board name."""
+    backends = backends or PARSER_CONFIG
+    return {source: get_parser(source, backend) for source, backend in backends.items()}
@@ -0,0 +1,68 @@
+"""
+Common interface for job board parsers.
+"""
+
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+# Card fields whose change makes a posting changed, in hashing order. The
+# relative posting date ("Posted 3 days ago") is left out: it changes every
+# day on its own, and add_features() already turns it into a fixed date.
+CONTENT_FIELDS = ('title', 'company', 'location', 'salary', 'description')
+
+# Separates fields in card_content(); not whitespace, so content_hash() keeps it
+CONTENT_SEPARATOR = ' | '
+
+
+class BaseParser:
+    """
+    Parses the job cards of one board's search result pages.
+
+    Cards are yielded first so callers can read a card's job id and content
+    and skip already known postings before paying for a full parse.
+    """
+
+    # Board key used in fingerprints and BASE_URLS
+    source = ''
+    # Board name stored on parsed jobs
+    label = ''
+    # Tag and class of the element wrapping a single job card
+    card_tag = 'div'
+    card_class = ''
+    # Whether cards lack the description, which then lives on a detail page
+    has_detail_page = False
+
+    def iter_cards(self, html: str) -> Iterator[Any]:
+        """Yield the job card elements of a result page."""
+        raise NotImplementedError
+
+    def card_job_id(self, card) -> Optional[str]:
+        """Return the board's own job id for a card, or None."""
+        raise NotImplementedError
+
+    def card_content(self, card) -> str:
+        """
+        Return the card's CONTENT_FIELDS as text, used to detect changed postings.
+
+        Both backends read the same text for a card, so the content hashes in
+        the seen-jobs index do not depend on the configured parser.
+        """
+        raise NotImplementedError
+
+    def parse_card(self, card) -> Optional[Dict]:
+        """Parse a card into a job dictionary, or None if it is malformed."""
+        raise NotImplementedError
+
+    def parse_detail(self, html: str) -> Optional[str]:
+        """Return the description from a posting's detail page, or None."""
+        return None
+
+
+# Classes of the element holding the description on a LinkedIn posting page
+LINKEDIN_DESCRIPTION_CLASSES = ('show-more-less-html__markup', 'description__text')
+
+
+def job_id_from_url(url: str) -> Optional[str]:
+    """Extract Indeed's `jk` job key from a posting URL."""
+    return parse_qs(urlparse(url).query).get('jk', [None])[0]
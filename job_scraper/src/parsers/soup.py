@@ -0,0 +1,172 @@
+"""
+BeautifulSoup parsers for job board result pages.
+Only the job card subtrees are built, using a SoupStrainer.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from ..logger import logger, log_error
+from .base import (
+    CONTENT_FIELDS, CONTENT_SEPARATOR, LINKEDIN_DESCRIPTION_CLASSES, BaseParser, job_id_from_url
+)
+
+
+def class_token(class_name: str):
+    """
+    SoupStrainer attribute filter matching one class among several.
+
+    While parsing, the strainer sees the raw class attribute string rather
+    than the split list used by find_all, so a plain string would only match
+    elements whose class is exactly class_name.
+    """
+    def matches(value) -> bool:
+        if not value:
+            return False
+        classes = value.split() if isinstance(value, str) else value
+        return class_name in classes
+    return matches
+
+
+class SoupParser(BaseParser):
+    """BeautifulSoup parser building only the job card subtrees."""
+
+    # Field name -> (tag, class) of the element holding it, for card_content()
+    content_elements = {}
+
+    def __init__(self):
+        self.strainer = SoupStrainer(self.card_tag, {'class': class_token(self.card_class)})
+
+    def iter_cards(self, html: str) -> Iterator:
+        soup = BeautifulSoup(html, 'html.parser', parse_only=self.strainer)
+        return iter(soup.find_all(self.card_tag, {'class': self.card_class}, recursive=False))
+
+    def card_content(self, card) -> str:
+        values = []
+        for name in CONTENT_FIELDS:
+            if name in self.content_elements:
+                tag, class_name = self.content_elements[name]
+                element = card.find(tag, {'class': class_name})
+                values.append(element.get_text(strip=True) if element else '')
+        return CONTENT_SEPARATOR.join(values)
+
+
+class SoupIndeedParser(SoupParser):
+    source = 'indeed'
+    label = 'Indeed'
+    card_class = 'job_seen_beacon'
+    content_elements = {
+        'title': ('h2', 'jobTitle'),
+        'company': ('span', 'companyName'),
+        'location': ('div', 'companyLocation'),
+        'salary': ('div', 'salary-snippet'),
+        'description': ('div', 'job-snippet'),
+    }
+
+    def card_job_id(self, card) -> Optional[str]:
+        link = card.find(attrs={'data-jk': True})
+        if link:
+            return link['data-jk']
+        link = card.find('a', href=True)
+        if link:
+            return job_id_from_url(link['href'])
+        return None
+
+    def parse_card(self, card) -> Optional[Dict]:
+        """Parse job information from Indeed HTML element."""
+        try:
+            title = card.find('h2', {'class': 'jobTitle'}).get_text(strip=True)
+            company = card.find('span', {'class': 'companyName'}).get_text(strip=True)
+            location = card.find('div', {'class': 'companyLocation'}).get_text(strip=True)
+            description = card.find('div', {'class': 'job-snippet'}).get_text(strip=True)
+            
+            job_info = {
+                'title': title,
+                'company': company,
+                'location': location,
+                'description': description,
+                'source': self.label,
+                'date_found': datetime.now().isoformat(),
+            }
+            
+            job_id = self.card_job_id(card)
+            if job_id:
+                job_info['job_id'] = job_id
+            link = card.find('a', href=True)
+            if link:
+                job_info['url'] = link['href']
+            
+            # Try to extract salary if available
+            salary_elem = card.find('div', {'class': 'salary-snippet'})
+            if salary_elem:
+                job_info['salary'] = salary_elem.get_text(strip=True)
+            
+            # "Posted 3 days ago"; add_features() turns it into a date
+            date_elem = card.find('span', {'class': 'date'})
+            if date_elem:
+                job_info['date_posted'] = date_elem.get_text(strip=True)
+            
+            return job_info
+        except Exception as e:
+            log_error(logger, e, {'element': str(card)})
+            return None
+
+
+class SoupLinkedInParser(SoupParser):
+    source = 'linkedin'
+    label = 'LinkedIn'
+    card_class = 'base-search-card'
+    has_detail_page = True
+    content_elements = {
+        'title': ('h3', 'base-search-card__title'),
+        'company': ('h4', 'base-search-card__subtitle'),
+        'location': ('span', 'job-search-card__location'),
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.description_strainer = SoupStrainer('div', {'class': lambda value: any(
+            class_token(name)(value) for name in LINKEDIN_DESCRIPTION_CLASSES
+        )})
+
+    def card_job_id(self, card) -> Optional[str]:
+        urn = card.get('data-entity-urn')
+        return urn.rsplit(':', 1)[-1] if urn else None
+
+    def parse_card(self, card) -> Optional[Dict]:
+        """Parse job information from LinkedIn HTML element."""
+        try:
+            title = card.find('h3', {'class': 'base-search-card__title'}).get_text(strip=True)
+            company = card.find('h4', {'class': 'base-search-card__subtitle'}).get_text(strip=True)
+            location = card.find('span', {'class': 'job-search-card__location'}).get_text(strip=True)
+            
+            job_info = {
+                'title': title,
+                'company': company,
+                'location': location,
+                'description': '',  # LinkedIn requires additional request for description
+                'source': self.label,
+                'date_found': datetime.now().isoformat(),
+            }
+            
+            job_id = self.card_job_id(card)
+            if job_id:
+                job_info['job_id'] = job_id
+            link = card.find('a', {'class': 'base-card__full-link'}, href=True)
+            if link:
+                job_info['url'] = link['href']
+            time_elem = card.find('time')
+            if time_elem:
+                job_info['date_posted'] = time_elem.get('datetime') or time_elem.get_text(strip=True)
+            
+            return job_info
+        except Exception as e:
+            log_error(logger, e, {'element': str(card)})
+            return None
+
+    def parse_detail(self, html: str) -> Optional[str]:
+        soup = BeautifulSoup(html, 'html.parser', parse_only=self.description_strainer)
+        element = soup.find('div')
+        return element.get_text(' ', strip=True) if element else None
@@ -0,0 +1,176 @@
+"""
+lxml parsers for job board result pages.
+Field lookups are precompiled XPath expressions evaluated against each card.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+from lxml import etree, html as lxml_html
+
+from ..logger import logger, log_error
+from .base import (
+    CONTENT_FIELDS, CONTENT_SEPARATOR, LINKEDIN_DESCRIPTION_CLASSES, BaseParser, job_id_from_url
+)
+
+
+def has_class(tag: str, class_name: str) -> str:
+    """XPath step matching a tag whose class attribute contains class_name."""
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+def first_text(elements) -> Optional[str]:
+    """
+    Text of the first element, matching BeautifulSoup's get_text(strip=True).
+    """
+    if not elements:
+        return None
+    return ''.join(text.strip() for text in elements[0].itertext())
+
+
+class XPathParser(BaseParser):
+    """lxml parser with XPath expressions compiled once per class."""
+
+    # Field name -> XPath relative to the card, filled in by subclasses
+    fields = {}
+
+    def __init__(self):
+        self.html_parser = lxml_html.HTMLParser(encoding='utf-8')
+        self.find_cards = etree.XPath('//' + has_class(self.card_tag, self.card_class))
+        self.find_fields = {name: etree.XPath(path) for name, path in self.fields.items()}
+
+    def iter_cards(self, html: str) -> Iterator:
+        if not html.strip():
+            return iter(())
+        root = lxml_html.document_fromstring(html.encode('utf-8'), parser=self.html_parser)
+        return iter(self.find_cards(root))
+
+    def card_content(self, card) -> str:
+        return CONTENT_SEPARATOR.join(self.field(card, name) or ''
+                                      for name in CONTENT_FIELDS if name in self.find_fields)
+
+    def field(self, card, name: str) -> Optional[str]:
+        return first_text(self.find_fields[name](card))
+
+
+class XPathIndeedParser(XPathParser):
+    source = 'indeed'
+    label = 'Indeed'
+    card_class = 'job_seen_beacon'
+    fields = {
+        'title': './/' + has_class('h2', 'jobTitle'),
+        'company': './/' + has_class('span', 'companyName'),
+        'location': './/' + has_class('div', 'companyLocation'),
+        'description': './/' + has_class('div', 'job-snippet'),
+        'salary': './/' + has_class('div', 'salary-snippet'),
+        'date_posted': './/' + has_class('span', 'date'),
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.find_job_key = etree.XPath('.//*[@data-jk]/@data-jk')
+        self.find_href = etree.XPath('.//a[@href]/@href')
+
+    def card_job_id(self, card) -> Optional[str]:
+        job_keys = self.find_job_key(card)
+        if job_keys:
+            return str(job_keys[0])
+        hrefs = self.find_href(card)
+        return job_id_from_url(hrefs[0]) if hrefs else None
+
+    def parse_card(self, card) -> Optional[Dict]:
+        """Parse job information from Indeed HTML element."""
+        try:
+            job_info = {
+                'title': self.field(card, 'title'),
+                'company': self.field(card, 'company'),
+                'location': self.field(card, 'location'),
+                'description': self.field(card, 'description'),
+                'source': self.label,
+                'date_found': datetime.now().isoformat(),
+            }
+            if None in job_info.values():
+                raise ValueError('Indeed job card is missing a required field')
+            
+            job_id = self.card_job_id(card)
+            if job_id:
+                job_info['job_id'] = job_id
+            hrefs = self.find_href(card)
+            if hrefs:
+                job_info['url'] = str(hrefs[0])
+            
+            salary = self.field(card, 'salary')
+            if salary is not None:
+                job_info['salary'] = salary
+            
+            # "Posted 3 days ago"; add_features() turns it into a date
+            date_posted = self.field(card, 'date_posted')
+            if date_posted is not None:
+                job_info['date_posted'] = date_posted
+            
+            return job_info
+        except Exception as e:
+            log_error(logger, e, {'element': etree.tostring(card, encoding='unicode')})
+            return None
+
+
+class XPathLinkedInParser(XPathParser):
+    source = 'linkedin'
+    label = 'LinkedIn'
+    card_class = 'base-search-card'
+    has_detail_page = True
+    fields = {
+        'title': './/' + has_class('h3', 'base-search-card__title'),
+        'company': './/' + has_class('h4', 'base-search-card__subtitle'),
+        'location': './/' + has_class('span', 'job-search-card__location'),
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.find_href = etree.XPath('.//' + has_class('a', 'base-card__full-link') + '/@href')
+        self.find_time = etree.XPath('.//time')
+        self.find_description = etree.XPath(' | '.join(
+            '//' + has_class('div', name) for name in LINKEDIN_DESCRIPTION_CLASSES
+        ))
+
+    def card_job_id(self, card) -> Optional[str]:
+        urn = card.get('data-entity-urn')
+        return urn.rsplit(':', 1)[-1] if urn else None
+
+    def parse_card(self, card) -> Optional[Dict]:
+        """Parse job information from LinkedIn HTML element."""
+        try:
+            job_info = {
+                'title': self.field(card, 'title'),
+                'company': self.field(card, 'company'),
+                'location': self.field(card, 'location'),
+                'description': '',  # LinkedIn requires additional request for description
+                'source': self.label,
+                'date_found': datetime.now().isoformat(),
+            }
+            if None in job_info.values():
+                raise ValueError('LinkedIn job card is missing a required field')
+            
+            job_id = self.card_job_id(card)
+            if job_id:
+                job_info['job_id'] = job_id
+            hrefs = self.find_href(card)
+            if hrefs:
+                job_info['url'] = str(hrefs[0])
+            times = self.find_time(card)
+            if times:
+                job_info['date_posted'] = times[0].get('datetime') or first_text(times)
+            
+            return job_info
+        except Exception as e:
+            log_error(logger, e, {'element': etree.tostring(card, encoding='unicode')})
+            return None
+
+    def parse_detail(self, html: str) -> Optional[str]:
+        if not html.strip():
+            return None
+        root = lxml_html.document_fromstring(html.encode('utf-8'), parser=self.html_parser)
+        elements = self.find_description(root)
+        if not elements:
+            return None
+        return ' '.join(text.strip() for text in elements[0].itertext() if text.strip())
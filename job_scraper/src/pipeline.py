@@ -0,0 +1,89 @@
+"""
+Building blocks for the streaming scrape pipeline.
+Stages run in their own threads and hand items downstream through bounded
+queues, so a slow stage applies backpressure instead of letting results pile
+up in memory.
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator
+
+from .logger import logger, log_error
+
+# Marks the end of a stage's output
+DONE = object()
+
+# How often blocked queue operations wake up to check for cancellation
+POLL_INTERVAL = 0.1
+
+
+class Pipeline:
+    """
+    Owns the stop flag and threads shared by a set of connected stages.
+    """
+
+    def __init__(self):
+        self.stop = threading.Event()
+        self._threads = []
+
+    def put(self, q: queue.Queue, item: Any) -> bool:
+        """
+        Put an item on a bounded queue, giving up if the pipeline is stopped.
+
+        Returns:
+            bool: False if the pipeline was stopped before the item was queued
+        """
+        while not self.stop.is_set():
+            try:
+                q.put(item, timeout=POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def drain(self, q: queue.Queue) -> Iterator[Any]:
+        """Yield items from a queue until DONE arrives or the pipeline stops."""
+        while not self.stop.is_set():
+            try:
+                item = q.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if item is DONE:
+                return
+            yield item
+
+    def stage(self, name: str, func: Callable[[Any], Iterable[Any]],
+              inbox: queue.Queue, outbox: queue.Queue) -> None:
+        """
+        Start a thread mapping every inbox item to zero or more outbox items.
+
+        Args:
+            name (str): Thread name, used in error context
+            func (callable): Takes one item and returns an iterable of results
+            inbox (queue.Queue): Items to process, terminated by DONE
+            outbox (queue.Queue): Receives results, then DONE
+        """
+        def run():
+            try:
+                for item in self.drain(inbox):
+                    for result in func(item):
+                        if not self.put(outbox, result):
+                            return
+            except Exception as e:
+                log_error(logger, e, {'stage': name})
+            self.put(outbox, DONE)
+
+        self.start(name, run)
+
+    def start(self, name: str, target: Callable[[], None]) -> None:
+        """Run target in a daemon thread owned by the pipeline."""
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop every stage and wait for the threads to exit."""
+        self.stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
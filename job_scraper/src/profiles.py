@@ -0,0 +1,154 @@
+"""
+Candidate profiles scored against one shared scrape.
+The profile in config.py is the default; every other profile is a JSON file
+of JobScorer settings in PROFILE_CONFIG['directory'], named after the file.
+One scrape searches the titles of every profile, and each job's feature
+vector covers the terms of every profile, so scoring a job for another
+profile is a weighted sum rather than another fetch, parse and text scan.
+"""
+
+import json
+import os
+from functools import cached_property
+from typing import Dict, Iterator, List, Tuple
+
+from .config import PROFILE_CONFIG, SCORING_WEIGHTS
+from .logger import logger, log_error
+from .scoring import JobScorer, TermSet
+
+# Name of the profile defined in config.py, whose scores are the jobs' own
+DEFAULT_PROFILE = PROFILE_CONFIG['default']
+
+# Keys a profile file may set, as JobScorer arguments; missing ones default to config.py
+PROFILE_FIELDS = ('titles', 'required_skills', 'technical_skills', 'industries', 'location',
+                  'min_salary', 'max_salary', 'weights', 'max_age')
+
+
+def profile_scorer(settings: Dict) -> JobScorer:
+    """
+    Build the scorer for a profile's settings.
+
+    Weights the settings leave out keep their SCORING_WEIGHTS value.
+
+    Args:
+        settings (dict): Values for some of PROFILE_FIELDS
+
+    Returns:
+        JobScorer: Scorer for the profile
+
+    Raises:
+        ValueError: If the settings hold unknown keys, unknown or non-numeric
+            weights, or an incomplete location
+    """
+    unknown = set(settings) - set(PROFILE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown profile settings: {', '.join(sorted(unknown))}")
+    location = settings.get('location')
+    if location is not None and not {'city', 'state'} <= set(location):
+        raise ValueError("Profile location needs a 'city' and a 'state'")
+    weights = settings.get('weights')
+    if weights is not None:
+        unknown = set(weights) - set(SCORING_WEIGHTS)
+        if unknown:
+            raise ValueError(f"Unknown profile weights: {', '.join(sorted(unknown))}")
+        if not all(isinstance(value, (int, float)) for value in weights.values()):
+            raise ValueError("Profile weights must be numbers")
+        settings = {**settings, 'weights': {**SCORING_WEIGHTS, **weights}}
+    return JobScorer(**settings)
+
+
+def load_profiles(directory: str = None) -> Dict[str, JobScorer]:
+    """
+    Load the default profile and every profile file.
+
+    Files that cannot be read or hold invalid settings are logged and
+    skipped, so one bad profile does not stop the others from scraping.
+
+    Args:
+        directory (str, optional): Profile directory, defaults to PROFILE_CONFIG['directory']
+
+    Returns:
+        dict: Profile name -> scorer, the default profile first
+    """
+    directory = directory or PROFILE_CONFIG['directory']
+    scorers = {DEFAULT_PROFILE: JobScorer()}
+    if not os.path.isdir(directory):
+        return scorers
+    for filename in sorted(os.listdir(directory)):
+        name, extension = os.path.splitext(filename)
+        if extension != '.json':
+            continue
+        path = os.path.join(directory, filename)
+        if name == DEFAULT_PROFILE:
+            log_error(logger, f"Profile {name} is set in config.py", {'file': path})
+            continue
+        try:
+            with open(path, 'r') as f:
+                scorers[name] = profile_scorer(json.load(f))
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            log_error(logger, e, {'file': path})
+    return scorers
+
+
+class ProfileSet:
+    """
+    The named profiles one scrape is scored for.
+    """
+
+    def __init__(self, scorers: Dict[str, JobScorer] = None):
+        """
+        Args:
+            scorers (dict, optional): Profile name -> scorer, including
+                DEFAULT_PROFILE; defaults to load_profiles()
+        """
+        self.scorers = load_profiles() if scorers is None else scorers
+        self.default = self.scorers[DEFAULT_PROFILE]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.scorers
+
+    def __len__(self) -> int:
+        return len(self.scorers)
+
+    def __getitem__(self, name: str) -> JobScorer:
+        """Return a profile's scorer, raising ValueError for unknown names."""
+        try:
+            return self.scorers[name]
+        except KeyError:
+            raise ValueError(f"Unknown profile: {name}") from None
+
+    def names(self) -> List[str]:
+        """Return the profile names, the default profile first."""
+        return list(self.scorers)
+
+    def others(self) -> Iterator[Tuple[str, JobScorer]]:
+        """Yield (name, scorer) for every profile but the default one."""
+        return ((name, scorer) for name, scorer in self.scorers.items() if name != DEFAULT_PROFILE)
+
+    @cached_property
+    def terms(self) -> TermSet:
+        """The terms of every profile, which shared feature vectors are built from."""
+        keys = set()
+        for scorer in self.scorers.values():
+            keys |= scorer.term_keys
+        return TermSet(keys)
+
+    @cached_property
+    def scoring_keys(self) -> Dict[str, str]:
+        """Profile name -> JobScorer.scoring_key, see JobStore.scored_with()."""
+        return {name: scorer.scoring_key for name, scorer in self.scorers.items()}
+
+    def searches(self) -> List[Tuple[str, List[str]]]:
+        """
+        Group the search titles of every profile by location.
+
+        Returns:
+            list: (location query, titles) pairs; a title wanted by several
+                profiles in one location is searched once
+        """
+        searches: Dict[str, List[str]] = {}
+        for scorer in self.scorers.values():
+            location = f"{scorer.location['city']}, {scorer.location['state']}"
+            titles = searches.setdefault(location, [])
+            titles += [title for title in scorer.titles if title not in titles]
+        return list(searches.items())
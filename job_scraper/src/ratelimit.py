@@ -0,0 +1,195 @@
+"""
+Per-host rate limiting and retry backoff for the job scraper.
+Provides a shared token-bucket limiter and request counters for tuning.
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from .config import REQUEST_CONFIG
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `burst` requests at once, refilled at `rate` per second.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate (float): Tokens added per second
+            burst (int): Bucket capacity
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def reserve(self, now: float) -> float:
+        """
+        Take one token, returning how long the caller must wait before using it.
+
+        Tokens may go negative so concurrent callers queue up fairly instead of
+        all waking at once when the bucket refills.
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            float: Seconds to wait
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.paused_until - now)
+
+
+class RateLimiter:
+    """
+    Thread-safe collection of token buckets, one per host.
+    """
+
+    def __init__(self, rate: float = None, burst: int = None, stats: 'RequestStats' = None):
+        """
+        Args:
+            rate (float, optional): Requests per second per host
+            burst (int, optional): Requests allowed back to back per host
+            stats (RequestStats, optional): Counters to record throttled time in
+        """
+        self.rate = rate or REQUEST_CONFIG['rate']
+        self.burst = burst or REQUEST_CONFIG['burst']
+        self.stats = stats
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    def acquire(self, host: str) -> float:
+        """
+        Block until a request to host is allowed.
+
+        Args:
+            host (str): Host name
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        with self._lock:
+            wait = self._bucket(host).reserve(time.monotonic())
+        if wait > 0:
+            time.sleep(wait)
+            if self.stats:
+                self.stats.record_throttle(wait)
+        return wait
+
+    def pause(self, host: str, seconds: float) -> None:
+        """
+        Hold back every request to host for the given number of seconds.
+
+        Args:
+            host (str): Host name
+            seconds (float): Pause duration
+        """
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.paused_until = max(bucket.paused_until, time.monotonic() + seconds)
+
+
+class RequestStats:
+    """
+    Thread-safe counters describing request traffic.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+        self.throttled_seconds = 0.0
+        self.retries_by_status = Counter()
+        self.cache = Counter()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests_sent += 1
+
+    def record_throttle(self, seconds: float) -> None:
+        with self._lock:
+            self.throttled_seconds += seconds
+
+    def record_retry(self, status) -> None:
+        """
+        Args:
+            status (int or str): HTTP status code, or error class name
+        """
+        with self._lock:
+            self.retries_by_status[status] += 1
+
+    def record_cache(self, outcome: str) -> None:
+        """
+        Args:
+            outcome (str): 'hit', 'revalidated' or 'miss'
+        """
+        with self._lock:
+            self.cache[outcome] += 1
+
+    def snapshot(self) -> Dict:
+        """Return a copy of the counters."""
+        with self._lock:
+            return {
+                'requests_sent': self.requests_sent,
+                'throttled_seconds': round(self.throttled_seconds, 3),
+                'retries_by_status': dict(self.retries_by_status),
+                'cache': dict(self.cache),
+            }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Args:
+        value (str): Header value
+
+    Returns:
+        float: Seconds to wait, or None if missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, retry_after: float = None) -> float:
+    """
+    Exponential backoff with full jitter, overridden by a server Retry-After.
+
+    Args:
+        attempt (int): Zero-based attempt number that just failed
+        retry_after (float, optional): Server-requested delay in seconds
+
+    Returns:
+        float: Seconds to wait before the next attempt
+    """
+    if retry_after is not None:
+        return min(retry_after, REQUEST_CONFIG['backoff_max'])
+    ceiling = min(REQUEST_CONFIG['backoff_max'], REQUEST_CONFIG['backoff_base'] * 2 ** attempt)
+    return random.uniform(0, ceiling)
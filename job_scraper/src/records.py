@@ -0,0 +1,166 @@
+"""
+Compact job records for large in-memory job sets.
+A Job keeps its fields in __slots__, including the numeric salary and
+posting time features computed at ingest, and a JobBatch keeps the salary
+range of many jobs in contiguous arrays for filtering. Records serialize
+back to the job dicts stored in the job store and the JSON export.
+"""
+
+import math
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List
+
+from .features import FEATURE_FIELDS, add_features
+
+# Stored job fields with a slot of their own, in JSON output order; 'job_id'
+# is the board's own id and 'sources' lists the postings merged into a job
+FIELDS = ('id', 'job_id', 'title', 'company', 'location', 'source', 'url', 'description',
+          'salary', 'date_posted', 'date_found', 'score', 'sources') + FEATURE_FIELDS
+
+# Marks a missing number in the float columns of a JobBatch
+MISSING = math.nan
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Job:
+    """
+    A job posting with slotted fields.
+
+    Reads also work like a dict (job['title'], job.get('salary')), so code
+    written against job dicts accepts Job records. Fields other than the
+    stored columns are kept in `extra` and read as attributes too.
+    """
+
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, id: str, job_id: str = None, title: str = '', company: str = '',
+                 location: str = '', source: str = '', url: str = None, description: str = '',
+                 salary: str = None, date_posted: str = None, date_found: str = None,
+                 score: float = None, sources: List[Dict[str, str]] = None,
+                 salary_min: float = None, salary_max: float = None, posted_at: float = None,
+                 extra: Dict[str, Any] = None):
+        """
+        Args:
+            id (str): Job fingerprint
+            job_id (str, optional): The board's own job id
+            title, company, location, source, url, description (str): Posting fields
+            salary (str, optional): Salary text as shown on the board
+            date_posted (str, optional): ISO or relative posting date
+            date_found (str, optional): ISO time the scraper found the job
+            score (float, optional): Relevance score
+            sources (list, optional): {'source', 'url'} of every posting merged into this job
+            salary_min, salary_max (float, optional): Annual salary range from add_features()
+            posted_at (float, optional): Posting timestamp from add_features()
+            extra (dict, optional): Any other fields, serialized unchanged
+        """
+        self.id = id
+        self.job_id = job_id
+        self.title = title
+        self.company = _intern(company)
+        self.location = _intern(location)
+        self.source = _intern(source)
+        self.url = url
+        self.description = description
+        self.salary = salary
+        self.date_posted = date_posted
+        self.date_found = date_found
+        self.score = score
+        self.sources = sources
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.posted_at = posted_at
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Job':
+        """Build a record from a job dict as stored by JobStore."""
+        if 'posted_at' not in data:  # stored before features were computed at ingest, or undated
+            data = add_features(dict(data))
+        extra = {_intern(key): value for key, value in data.items() if key not in FIELDS}
+        return cls(**{key: data[key] for key in FIELDS if key in data}, extra=extra)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the job dict this record was built from; fields that are None are left out."""
+        data = {}
+        for key in FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __getattr__(self, name):
+        # Only reached for names that are not slots
+        extra = object.__getattribute__(self, 'extra')
+        if extra and name in extra:
+            return extra[name]
+        raise AttributeError(name)
+
+    def __getitem__(self, key: str):
+        if key in FIELDS:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __repr__(self) -> str:
+        return f'Job(id={self.id!r}, title={self.title!r}, score={self.score!r})'
+
+
+class JobBatch:
+    """
+    Jobs held as records plus float columns for their salary range.
+
+    Missing salaries are NaN in the columns, so range checks over the columns
+    keep jobs without one without testing for None per job.
+    """
+
+    def __init__(self, jobs: Iterable[Job] = ()):
+        """
+        Args:
+            jobs (iterable, optional): Job records
+        """
+        self.records: List[Job] = []
+        self.salary_min = array('d')
+        self.salary_max = array('d')
+        self.extend(jobs)
+
+    @classmethod
+    def from_dicts(cls, jobs: Iterable[Dict[str, Any]]) -> 'JobBatch':
+        """Build a batch from job dicts."""
+        return cls(Job.from_dict(job) for job in jobs)
+
+    def append(self, job: Job) -> None:
+        self.records.append(job)
+        self.salary_min.append(MISSING if job.salary_min is None else job.salary_min)
+        self.salary_max.append(MISSING if job.salary_max is None else job.salary_max)
+
+    def extend(self, jobs: Iterable[Job]) -> None:
+        for job in jobs:
+            self.append(job)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, position: int) -> Job:
+        return self.records[position]
+
+    def __iter__(self) -> Iterator[Job]:
+        return iter(self.records)
@@ -0,0 +1,143 @@
+"""
+Rescoring of stored jobs after profiles or their weights change.
+
+    python -m src.rescore           # bring every stored score up to date
+    python -m src.rescore --force   # also when nothing changed, e.g. to refresh recency
+
+Each stored job keeps one feature vector (see scoring.FeatureVector) shared
+by every profile, keyed by the hash of the TermSet of every term looked for
+in the job so far. When only weights change or terms are dropped, the
+vectors are reused and every score is a weighted sum. When terms are added,
+the jobs holding them are looked up in SQL (see JobStore.jobs_containing()),
+only those jobs' text is read to extend their vectors, and only vectors that
+gained a match are written back. Only scores that changed are written.
+"""
+
+import argparse
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from .logger import logger
+from .profiles import ProfileSet
+from .scoring import FeatureVector, TermSet
+from .storage import JobStore
+
+# Jobs whose text is loaded from the store at a time
+TEXT_BATCH = 1000
+
+
+def rescore(store: JobStore, profiles: ProfileSet, now: float = None) -> Dict:
+    """
+    Rescore every stored job for every profile and cache the vectors needed.
+
+    Scores of profiles not in the set are deleted.
+
+    Args:
+        store (JobStore): Store holding the jobs
+        profiles (ProfileSet): Profiles with their current settings and weights
+        now (float, optional): Timestamp jobs are aged against, defaults to now
+
+    Returns:
+        dict: Counts of jobs rescored from a cached vector without reading
+            text, searched for added terms, and matched against every term
+            for lack of a usable vector, of scores that changed, plus the
+            profiles, the terms added and the time taken
+    """
+    start = time.perf_counter()
+    now = now or time.time()
+    wanted = profiles.terms
+
+    # TermSet hash of cached vectors -> (terms they lack, terms they cover
+    # once those are looked for), or None if the hash is unknown
+    plans: Dict[str, Optional[Tuple[TermSet, TermSet]]] = {}
+    # TermSet hash of cached vectors -> ids of the jobs holding any of the
+    # terms they lack, or None if those cannot be looked up
+    holding: Dict[str, Optional[Set[str]]] = {}
+    vectors: List[Tuple[str, FeatureVector]] = []
+    # job id -> (vector, its plan) to extend, or None to build a vector
+    pending: Dict[str, Optional[Tuple[FeatureVector, Tuple[TermSet, TermSet]]]] = {}
+    for job_id, terms_hash, vector in store.vectors():
+        if vector is not None and terms_hash != wanted.hash:
+            if terms_hash not in plans:
+                terms = store.term_set(terms_hash)
+                plans[terms_hash] = (TermSet(wanted.keys - terms.keys), terms | wanted) if terms is not None else None
+                if plans[terms_hash] is not None and plans[terms_hash][0].keys:
+                    holding[terms_hash] = store.jobs_containing(plans[terms_hash][0].keys)
+            plan = plans[terms_hash]
+            if plan is None:
+                vector = None
+            elif plan[0].keys and (holding[terms_hash] is None or job_id in holding[terms_hash]):
+                pending[job_id] = (vector, plan)
+                continue
+        if vector is None:
+            pending[job_id] = None
+            continue
+        # Includes vectors lacking added terms the job does not hold
+        vectors.append((job_id, vector))
+    cached = len(vectors)
+
+    searched = built = 0
+    rebuilt: Dict[TermSet, List[Tuple[str, FeatureVector]]] = {}
+    ids = list(pending)
+    for i in range(0, len(ids), TEXT_BATCH):
+        jobs = store.scoring_fields(ids[i:i + TEXT_BATCH])
+        for job_id, job in jobs.items():
+            previous = pending[job_id]
+            if previous is None:
+                vector = wanted.vector(job)
+                rebuilt.setdefault(wanted, []).append((job_id, vector))
+                built += 1
+            else:
+                (added, covered), vector = previous[1], previous[0]
+                extended = added.extend(vector, job)
+                if extended is not vector:
+                    rebuilt.setdefault(covered, []).append((job_id, extended))
+                vector = extended
+                searched += 1
+            vectors.append((job_id, vector))
+
+    for terms, rows in rebuilt.items():
+        store.save_vectors(terms, rows)
+    store.relabel_vectors({old: plan[1] for old, plan in plans.items()
+                           if plan is not None and plan[1].hash != old})
+    written = 0
+    for name, scorer in profiles.scorers.items():
+        stored = store.scores(name)
+        scores = [(job_id, scorer.score_vector(vector, now)) for job_id, vector in vectors]
+        written += store.set_scores([(job_id, score) for job_id, score in scores
+                                     if stored.get(job_id) != score], scorer.scoring_key, name)
+    store.retain_profiles(profiles.names())
+    report = {
+        'jobs': len(vectors),
+        'profiles': profiles.names(),
+        'cached': cached,
+        'searched': searched,
+        'built': built,
+        'scores_written': written,
+        'added_terms': sorted(set().union(*(plan[0].keys for plan in plans.values() if plan))),
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+    logger.info("Rescored %d jobs for %d profiles in %.2fs (%d from cached vectors, "
+                "%d searched for added terms, %d vectors built, %d scores changed)",
+                report['jobs'], len(profiles), report['seconds'], cached, searched, built, written)
+    return report
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--force', action='store_true',
+                        help='Rescore even if no profile or weight changed')
+    args = parser.parse_args(argv)
+
+    store, profiles = JobStore(), ProfileSet()
+    if not args.force and store.scored_with() == profiles.scoring_keys:
+        print("Stored scores already match the profiles and weights")
+        return
+    report = rescore(store, profiles)
+    print(f"Rescored {report['jobs']} jobs for {len(profiles)} profiles in {report['seconds']:.2f}s: "
+          f"{report['cached']} from cached vectors, {report['searched']} searched for added terms, "
+          f"{report['built']} vectors built, {report['scores_written']} scores changed")
+
+
+if __name__ == '__main__':
+    main()
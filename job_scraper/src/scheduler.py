@@ -0,0 +1,231 @@
+"""
+Background refresh scheduling for the job scraper.
+Scrapes run one at a time on a worker thread so web requests only enqueue
+work and poll for its status instead of waiting for the scrape to finish.
+Every preforked web worker has its own scheduler; a lease in the job store
+lets only one of them scrape at a time, and the stored run summaries keep
+their timers from each running the scheduled refresh.
+"""
+
+import itertools
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+
+from .config import SCHEDULER_CONFIG
+from .logger import logger, log_error
+
+# Refresh states, in the order a refresh moves through them
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+# Name of the job store lease held while a scrape runs
+REFRESH_LEASE = 'refresh'
+
+
+class Refresh:
+    """
+    A single requested scrape and its progress.
+    """
+
+    def __init__(self, refresh_id: str, reason: str):
+        """
+        Args:
+            refresh_id (str): Identifier returned to clients
+            reason (str): What triggered the refresh, e.g. 'manual' or 'scheduled'
+        """
+        self.id = refresh_id
+        self.reason = reason
+        self.status = QUEUED
+        self.jobs_found = 0
+        self.error = None
+        self.enqueued_at = datetime.now()
+        self.started_at = None
+        self.finished_at = None
+
+    def to_dict(self) -> Dict:
+        """Return the refresh as a JSON-serializable dict."""
+        def iso(value):
+            return value.isoformat() if value else None
+
+        return {
+            'id': self.id,
+            'reason': self.reason,
+            'status': self.status,
+            'jobs_found': self.jobs_found,
+            'error': self.error,
+            'enqueued_at': iso(self.enqueued_at),
+            'started_at': iso(self.started_at),
+            'finished_at': iso(self.finished_at),
+        }
+
+
+class RefreshScheduler:
+    """
+    Runs scraper refreshes on a single background thread.
+
+    Requests made while a refresh is queued or running are folded into it,
+    so concurrent clicks never start overlapping scrapes on the shared
+    scraper. Across processes sharing the job store, a scrape runs only
+    while holding the store's refresh lease; a refresh that finds another
+    process scraping waits for that run and reports it instead of scraping
+    again. A timer enqueues a refresh once no process has finished one for
+    SCHEDULER_CONFIG['interval'] seconds.
+    """
+
+    def __init__(self, scraper, interval: Optional[float] = None, history: int = None):
+        """
+        Args:
+            scraper (JobScraper): Scraper whose scrape_jobs() is run
+            interval (float, optional): Seconds between scheduled refreshes,
+                defaults to SCHEDULER_CONFIG['interval']; 0 or None disables them
+            history (int, optional): Finished refreshes kept for status lookups
+        """
+        self.scraper = scraper
+        self.interval = SCHEDULER_CONFIG['interval'] if interval is None else interval
+        self.history = history or SCHEDULER_CONFIG['history']
+        self.lease_ttl = SCHEDULER_CONFIG['lease_ttl']
+        # Lease owner, unique across the processes sharing the store
+        self._owner = f'{os.getpid()}-{uuid.uuid4().hex[:8]}'
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._refreshes = OrderedDict()
+        self._active = None
+        self._ids = itertools.count(1)
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self) -> 'RefreshScheduler':
+        """Start the worker and, if an interval is set, the timer thread."""
+        if self._threads:
+            return self
+        self._threads.append(threading.Thread(target=self._work, name='refresh-worker', daemon=True))
+        if self.interval:
+            self._threads.append(threading.Thread(target=self._tick, name='refresh-timer', daemon=True))
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop scheduling; a refresh already running finishes in the background."""
+        self._stop.set()
+        self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def enqueue(self, reason: str = 'manual') -> Refresh:
+        """
+        Request a refresh, reusing the one already queued or running.
+
+        Args:
+            reason (str): What triggered the refresh
+
+        Returns:
+            Refresh: The refresh that will cover this request
+        """
+        with self._lock:
+            if self._active is not None:
+                return self._active
+            refresh = Refresh(f"{int(time.time())}-{next(self._ids)}", reason)
+            self._active = refresh
+            self._refreshes[refresh.id] = refresh
+            while len(self._refreshes) > self.history:
+                self._refreshes.popitem(last=False)
+        self._queue.put(refresh)
+        logger.info("Refresh %s queued (%s)", refresh.id, reason)
+        return refresh
+
+    def get(self, refresh_id: str) -> Optional[Refresh]:
+        """Return a known refresh by id, or None."""
+        with self._lock:
+            return self._refreshes.get(refresh_id)
+
+    def latest(self) -> Optional[Refresh]:
+        """Return the most recently requested refresh, or None."""
+        with self._lock:
+            return next(reversed(self._refreshes.values()), None)
+
+    def _run(self, refresh: Refresh) -> None:
+        def progress(jobs_found: int) -> None:
+            refresh.jobs_found = jobs_found
+
+        refresh.status = RUNNING
+        refresh.started_at = datetime.now()
+        store = self.scraper.store
+        try:
+            if store.acquire_lease(REFRESH_LEASE, self._owner, self.lease_ttl):
+                refresh.jobs_found = len(self._scrape(progress))
+            else:
+                logger.info("Refresh %s waits for a refresh running in another process", refresh.id)
+                while not store.acquire_lease(REFRESH_LEASE, self._owner, self.lease_ttl):
+                    time.sleep(SCHEDULER_CONFIG['lease_poll'])
+                store.release_lease(REFRESH_LEASE, self._owner)
+                runs = store.runs(1)
+                refresh.jobs_found = runs[0].get('jobs_found', 0) if runs else 0
+            refresh.status = DONE
+        except Exception as e:
+            log_error(logger, e, {'refresh': refresh.id})
+            refresh.error = str(e)
+            refresh.status = FAILED
+        refresh.finished_at = datetime.now()
+        logger.info("Refresh %s %s with %d jobs", refresh.id, refresh.status, refresh.jobs_found)
+
+    def _scrape(self, progress) -> list:
+        """Scrape while holding the refresh lease, renewing it until the scrape ends."""
+        store = self.scraper.store
+        finished = threading.Event()
+
+        def renew() -> None:
+            while not finished.wait(self.lease_ttl / 3):
+                try:
+                    store.acquire_lease(REFRESH_LEASE, self._owner, self.lease_ttl)
+                except Exception as e:
+                    log_error(logger, e, {'lease': REFRESH_LEASE})
+
+        renewer = threading.Thread(target=renew, name='refresh-lease', daemon=True)
+        renewer.start()
+        try:
+            return self.scraper.scrape_jobs(progress=progress)
+        finally:
+            finished.set()
+            renewer.join()
+            store.release_lease(REFRESH_LEASE, self._owner)
+
+    def _last_run_finished(self) -> Optional[float]:
+        """Return when the latest stored scrape run finished, in any process, or None."""
+        try:
+            runs = self.scraper.store.runs(1)
+        except Exception as e:
+            log_error(logger, e, {'file': self.scraper.store.path})
+            return None
+        finished_at = runs[0].get('finished_at') if runs else None
+        return datetime.fromisoformat(finished_at).timestamp() if finished_at else None
+
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            refresh = self._queue.get()
+            if refresh is None:
+                return
+            try:
+                self._run(refresh)
+            finally:
+                with self._lock:
+                    self._active = None
+
+    def _tick(self) -> None:
+        due = time.time() + self.interval
+        while not self._stop.wait(max(0.0, due - time.time())):
+            finished = self._last_run_finished()
+            if finished is not None and time.time() - finished < self.interval:
+                # Another process refreshed meanwhile; count the interval from its run
+                due = finished + self.interval
+                continue
+            self.enqueue('scheduled')
+            due = time.time() + self.interval
@@ -0,0 +1,384 @@
+"""
+Batch relevance scoring for job postings.
+Precompiles every profile term once so each posting's text is lowercased a
+single time and scanned with C-level substring search. Salary and recency
+are scored from the numeric features stored at ingest (see features.py).
+
+A job's FeatureVector records which profile terms it matched, so stored
+jobs can be rescored after a weight change without reading their text, and
+after a term change by matching only the terms that are new. A TermSet
+builds vectors over the terms of several profiles at once.
+"""
+
+import hashlib
+import json
+import time
+from array import array
+from functools import cached_property
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .config import (
+    SEARCH_TITLES, REQUIRED_SKILLS, TECHNICAL_SKILLS, TARGET_INDUSTRIES, LOCATION,
+    SCORING_WEIGHTS, MIN_SALARY, MAX_SALARY, MAX_JOB_AGE
+)
+from .features import DAY
+
+# Score of salary or recency for a job that does not state it
+UNKNOWN_MATCH = 0.5
+
+# Prefixes of term keys: the job field a profile term is looked for in
+TITLE_TERM = 't:'
+TEXT_TERM = 'd:'
+PLACE_TERM = 'l:'
+_TERM_FIELDS = ((TITLE_TERM, 'title'), (TEXT_TERM, 'description'), (PLACE_TERM, 'location'))
+
+
+def _job_fields(job: Dict) -> Tuple:
+    """The fields scoring reads from a job dict; features may be missing."""
+    return (job['title'], job['description'], job['location'],
+            job.get('salary_min'), job.get('salary_max'), job.get('posted_at'))
+
+
+class TermMatcher:
+    """
+    Case-insensitive substring matcher for a fixed list of terms.
+
+    Terms are lowercased once up front and tested with `str.__contains__`
+    mapped over the list, which in CPython beats a combined alternation
+    regex: `re` tries every alternative at every offset, while substring
+    search skips ahead in C.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        """
+        Args:
+            terms (iterable): Terms to look for; duplicates are kept so counts
+                match the configured lists
+        """
+        self.terms: Tuple[str, ...] = tuple(term.lower() for term in terms)
+
+    def count(self, text: str) -> int:
+        """Return how many terms occur in already lowercased text."""
+        return sum(map(text.__contains__, self.terms))
+
+    def any(self, text: str) -> bool:
+        """Return whether any term occurs in already lowercased text."""
+        return any(map(text.__contains__, self.terms))
+
+    def find(self, text: str) -> List[str]:
+        """Return the terms occurring in already lowercased text."""
+        return [term for term in self.terms if term in text]
+
+
+class BatchScores(NamedTuple):
+    """Scores and per-criterion breakdowns for a batch, aligned with its input."""
+    scores: array
+    title_match: array
+    skills_match: array
+    industry_match: array
+    location_match: array
+    salary_match: array
+    recency_match: array
+
+    def criteria(self, i: int) -> Dict[str, float]:
+        """Return the criteria breakdown for the i-th job as a dict."""
+        return {
+            'title_match': self.title_match[i],
+            'skills_match': self.skills_match[i],
+            'industry_match': self.industry_match[i],
+            'location_match': self.location_match[i],
+            'salary_match': self.salary_match[i],
+            'recency_match': self.recency_match[i],
+        }
+
+
+class FeatureVector(NamedTuple):
+    """
+    What scoring needs to know about a job besides the profile and weights.
+
+    Every criterion follows from the matched terms and the numeric features,
+    so scoring a vector reads no text. Matches of terms a profile does not
+    use are ignored by it, so a vector stays valid for profiles that drop
+    terms, and only needs terms added by a profile looked for.
+    """
+    matches: FrozenSet[str]  # term keys found in the job, e.g. 'd:salesforce'
+    salary_min: Optional[float]
+    salary_max: Optional[float]
+    posted_at: Optional[float]
+
+
+class TermSet:
+    """
+    Term keys looked for in jobs together, e.g. the terms of several
+    profiles, so one pass over a job's text builds a vector all of them
+    can score.
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        """
+        Args:
+            keys (iterable): Term keys, see JobScorer.term_keys
+        """
+        self.keys: FrozenSet[str] = frozenset(keys)
+        # Prefix -> (term, key) pairs, so each job field is lowercased once
+        self._groups = _group_terms(self.keys)
+
+    @cached_property
+    def hash(self) -> str:
+        """Key of the feature vectors built from these terms, see JobStore.save_vectors()."""
+        return _digest(sorted(self.keys))
+
+    def __or__(self, other: 'TermSet') -> 'TermSet':
+        return TermSet(self.keys | other.keys)
+
+    def match(self, job: Dict) -> FrozenSet[str]:
+        """Return the term keys that occur in the job's fields."""
+        matches = []
+        for prefix, field in _TERM_FIELDS:
+            terms = self._groups.get(prefix)
+            if terms:
+                text = job[field].lower()
+                matches += [key for term, key in terms if term in text]
+        return frozenset(matches)
+
+    def vector(self, job: Dict) -> FeatureVector:
+        """
+        Build a job's feature vector.
+
+        Args:
+            job (dict): Job posting information, with features from add_features()
+
+        Returns:
+            FeatureVector: These terms found in the job, and its numeric features
+        """
+        return FeatureVector(self.match(job), job.get('salary_min'),
+                             job.get('salary_max'), job.get('posted_at'))
+
+    def extend(self, vector: FeatureVector, job: Dict) -> FeatureVector:
+        """
+        Look for these terms in a job and add the ones found to its vector.
+
+        Args:
+            vector (FeatureVector): Vector built from other terms
+            job (dict): Job posting information
+
+        Returns:
+            FeatureVector: The vector with the matches among these terms added
+        """
+        found = self.match(job)
+        return vector._replace(matches=vector.matches | found) if found else vector
+
+
+class JobScorer:
+    """
+    Scores jobs against a candidate profile using precompiled term matchers.
+    """
+
+    def __init__(self, titles: Sequence[str] = None, required_skills: Sequence[str] = None,
+                 technical_skills: Sequence[str] = None, industries: Sequence[str] = None,
+                 location: Dict = None, weights: Dict[str, float] = None,
+                 min_salary: float = None, max_salary: float = None, max_age: float = None):
+        """
+        Args:
+            titles (list, optional): Target job titles, defaults to SEARCH_TITLES
+            required_skills (list, optional): Defaults to REQUIRED_SKILLS
+            technical_skills (list, optional): Defaults to TECHNICAL_SKILLS
+            industries (list, optional): Defaults to TARGET_INDUSTRIES
+            location (dict, optional): City/state preference, defaults to LOCATION
+            weights (dict, optional): Criterion weights, defaults to SCORING_WEIGHTS
+            min_salary (float, optional): Wanted annual salary, defaults to MIN_SALARY
+            max_salary (float, optional): Defaults to MAX_SALARY
+            max_age (float, optional): Posting age in days at which recency
+                reaches 0, defaults to MAX_JOB_AGE
+        """
+        self.titles = SEARCH_TITLES if titles is None else titles
+        self.required_skills = REQUIRED_SKILLS if required_skills is None else required_skills
+        self.technical_skills = TECHNICAL_SKILLS if technical_skills is None else technical_skills
+        self.industries = TARGET_INDUSTRIES if industries is None else industries
+        self.location = LOCATION if location is None else location
+        self.weights = SCORING_WEIGHTS if weights is None else weights
+        self.min_salary = MIN_SALARY if min_salary is None else min_salary
+        self.max_salary = MAX_SALARY if max_salary is None else max_salary
+        self.max_age = MAX_JOB_AGE if max_age is None else max_age
+
+        self._titles = TermMatcher(self.titles)
+        self._required = TermMatcher(self.required_skills)
+        self._technical = TermMatcher(self.technical_skills)
+        self._industries = TermMatcher(self.industries)
+        self._city = self.location['city'].lower()
+        self._state = self.location['state'].lower()
+
+    def _criteria(self, title: str, description: str, location: str,
+                  salary_min: Optional[float], salary_max: Optional[float],
+                  posted_at: Optional[float], now: float) -> Tuple[float, ...]:
+        description = description.lower()
+        title_match = 1 if self._titles.any(title.lower()) else 0
+        skills_match = 0.0
+        if self._required.terms:
+            skills_match += self._required.count(description) / len(self._required.terms) * 0.7
+        if self._technical.terms:
+            skills_match += self._technical.count(description) / len(self._technical.terms) * 0.3
+        industry_match = 1 if self._industries.any(description) else 0
+        location = location.lower()
+        location_match = 1 if self._city in location and self._state in location else 0
+        return (title_match, skills_match, industry_match, location_match,
+                self._salary_match(salary_min, salary_max), self._recency_match(posted_at, now))
+
+    def _salary_match(self, salary_min: Optional[float], salary_max: Optional[float]) -> float:
+        """Share of the job's salary range inside the wanted range."""
+        if salary_min is None or salary_max is None:
+            return UNKNOWN_MATCH
+        overlap = min(salary_max, self.max_salary) - max(salary_min, self.min_salary)
+        if salary_max <= salary_min:  # a single figure
+            return 1 if overlap >= 0 else 0
+        return max(0.0, overlap) / (salary_max - salary_min)
+
+    def _recency_match(self, posted_at: Optional[float], now: float) -> float:
+        """1 for a job posted now, falling linearly to 0 at max_age days old."""
+        if posted_at is None:
+            return UNKNOWN_MATCH
+        if not self.max_age:
+            return 1
+        return min(1.0, max(0.0, 1 - (now - posted_at) / (self.max_age * DAY)))
+
+    def _combine(self, title_match, skills_match, industry_match, location_match,
+                 salary_match, recency_match) -> float:
+        weights = self.weights
+        return (title_match * weights['title_match']
+                + skills_match * weights['skills_match']
+                + industry_match * weights['industry_match']
+                + location_match * weights['location_match']
+                + salary_match * weights.get('salary_match', 0)
+                + recency_match * weights.get('recency_match', 0))
+
+    @cached_property
+    def term_keys(self) -> FrozenSet[str]:
+        """Every term of the profile as a key naming the job field it is looked for in."""
+        return frozenset(
+            [TITLE_TERM + term for term in self._titles.terms]
+            + [TEXT_TERM + term for matcher in (self._required, self._technical, self._industries)
+               for term in matcher.terms]
+            + [PLACE_TERM + self._city, PLACE_TERM + self._state])
+
+    @cached_property
+    def _keys(self) -> Tuple[Tuple[str, ...], ...]:
+        """Term keys of titles, required skills, technical skills and industries, duplicates kept."""
+        return (tuple(TITLE_TERM + term for term in self._titles.terms),
+                tuple(TEXT_TERM + term for term in self._required.terms),
+                tuple(TEXT_TERM + term for term in self._technical.terms),
+                tuple(TEXT_TERM + term for term in self._industries.terms))
+
+    @cached_property
+    def _place_keys(self) -> FrozenSet[str]:
+        return frozenset((PLACE_TERM + self._city, PLACE_TERM + self._state))
+
+    @cached_property
+    def profile(self) -> Dict:
+        """The profile settings feature vectors depend on; weights and max_age are not among them."""
+        return {
+            'titles': list(self.titles),
+            'required_skills': list(self.required_skills),
+            'technical_skills': list(self.technical_skills),
+            'industries': list(self.industries),
+            'location': {'city': self.location['city'], 'state': self.location['state']},
+            'min_salary': self.min_salary,
+            'max_salary': self.max_salary,
+        }
+
+    @cached_property
+    def profile_hash(self) -> str:
+        """Changes whenever the profile settings do."""
+        return _digest(self.profile)
+
+    @cached_property
+    def scoring_key(self) -> str:
+        """Changes whenever a stored job's score would, apart from the passing of time."""
+        return f"{self.profile_hash}-{_digest([self.weights, self.max_age])}"
+
+    @cached_property
+    def terms(self) -> 'TermSet':
+        """The profile's terms as a TermSet, which builds its feature vectors."""
+        return TermSet(self.term_keys)
+
+    def vector(self, job: Dict) -> FeatureVector:
+        """
+        Build a job's feature vector.
+
+        Args:
+            job (dict): Job posting information, with features from add_features()
+
+        Returns:
+            FeatureVector: Terms of this profile found in the job and its numeric features
+        """
+        return self.terms.vector(job)
+
+    def score_vector(self, vector: FeatureVector, now: float = None) -> float:
+        """
+        Score a job from its feature vector: a weighted sum, no text is read.
+
+        Args:
+            vector (FeatureVector): Vector holding every term of this profile
+                the job matches
+            now (float, optional): Timestamp the job is aged against, defaults to now
+
+        Returns:
+            float: Score between 0 and 1, equal to score() of the job
+        """
+        # Same arithmetic as _criteria(), so both give identical scores
+        matches = vector.matches
+        title_keys, required_keys, technical_keys, industry_keys = self._keys
+        title_match = 1 if any(map(matches.__contains__, title_keys)) else 0
+        skills_match = 0.0
+        if required_keys:
+            skills_match += sum(map(matches.__contains__, required_keys)) / len(required_keys) * 0.7
+        if technical_keys:
+            skills_match += sum(map(matches.__contains__, technical_keys)) / len(technical_keys) * 0.3
+        industry_match = 1 if any(map(matches.__contains__, industry_keys)) else 0
+        location_match = 1 if self._place_keys <= matches else 0
+        return self._combine(title_match, skills_match, industry_match, location_match,
+                             self._salary_match(vector.salary_min, vector.salary_max),
+                             self._recency_match(vector.posted_at, now or time.time()))
+
+    def score(self, job: Dict) -> float:
+        """
+        Score a single job.
+
+        Args:
+            job (dict): Job posting information, with features from add_features()
+
+        Returns:
+            float: Score between 0 and 1
+        """
+        return self._combine(*self._criteria(*_job_fields(job), time.time()))
+
+    def score_batch(self, jobs: List[Dict], now: float = None) -> BatchScores:
+        """
+        Score many jobs at once.
+
+        Args:
+            jobs (list): Job postings
+            now (float, optional): Timestamp every job is aged against, defaults to now
+
+        Returns:
+            BatchScores: Arrays of scores and criteria, one entry per job
+        """
+        now = now or time.time()
+        result = BatchScores(*(array('d', bytes(8 * len(jobs))) for _ in BatchScores._fields))
+        for i, job in enumerate(jobs):
+            criteria = self._criteria(*_job_fields(job), now)
+            result.scores[i] = self._combine(*criteria)
+            (result.title_match[i], result.skills_match[i], result.industry_match[i],
+             result.location_match[i], result.salary_match[i], result.recency_match[i]) = criteria
+        return result
+
+
+def _group_terms(keys: Iterable[str]) -> Dict[str, List[Tuple[str, str]]]:
+    """Group term keys by prefix as (term, key) pairs."""
+    groups = {}
+    for key in keys:
+        groups.setdefault(key[:2], []).append((key[2:], key))
+    return groups
+
+
+def _digest(value) -> str:
+    return hashlib.sha1(json.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()[:16]
@@ -3,46 +3,150 @@ Core scraping functionality for the job search tool.
 Includes job refinement and scoring based on candidate's profile.
 """
 
-import requests
 import json
+import logging
 import os
-from datetime import datetime
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional
-from fake_useragent import UserAgent
+import queue
+from datetime import datetime, timedelta
+from functools import cached_property
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 import time
-import random
+from urllib.parse import urljoin, urlparse
 
 from .config import (
-    BASE_URLS, SEARCH_TITLES, REQUIRED_SKILLS, 
-    TECHNICAL_SKILLS, TARGET_INDUSTRIES, LOCATION,
-    REQUEST_CONFIG, SCORING_WEIGHTS, OUTPUT_DIRECTORY
+    BASE_URLS, REQUEST_CONFIG, OUTPUT_DIRECTORY,
+    USE_MOCK_DATA, FETCH_CONFIG, CACHE_CONFIG, STORAGE_CONFIG, JSON_FILENAME,
+    PIPELINE_CONFIG, DEDUP_CONFIG, ENRICH_CONFIG
 )
-from .logger import logger, log_job_found, log_error, log_scraping_progress, log_refinement_result
+from .cache import ResponseCache
+from .dedup import Duplicate, NearDuplicateIndex, source_entry
+from .enrich import DetailEnricher
+from .features import add_features, is_stale
+from .fetcher import ConcurrentFetcher, PageRequest, build_page_requests, next_page_request
+from .parsers import get_parsers
+from .pipeline import DONE, Pipeline
+from .ratelimit import RateLimiter, RequestStats, backoff_delay, parse_retry_after
+from .profiles import DEFAULT_PROFILE, ProfileSet
+from .rescore import rescore
+from .scoring import JobScorer
+from .seen_index import SeenJobsIndex
+from .job_index import JobIndex
+from .metrics import ScrapeMetrics
+from .storage import JobStore
+from .utils.helpers import content_hash, job_fingerprint
+from .utils.user_agents import user_agents
+from .workers import Page, ParsePool
+from .logger import logger, setup_logger, log_job_found, log_error, log_scraping_progress, log_refinement_result
 
 class JobScraper:
-    def __init__(self):
-        """Initialize the job scraper with necessary configurations."""
-        self.session = requests.Session()
-        self.ua = UserAgent()
+    def __init__(self, base_urls: Dict[str, str] = None, use_mock: bool = None,
+                 max_pages: int = None):
+        """
+        Initialize the job scraper with necessary configurations.
+        
+        Args:
+            base_urls (dict, optional): Board name to search URL, defaults to BASE_URLS
+            use_mock (bool, optional): Serve mock data, defaults to USE_MOCK_DATA
+            max_pages (int, optional): Result pages per search title
+        """
+        setup_logger()
         self.jobs = []
+        self.base_urls = base_urls or BASE_URLS
+        self.use_mock = USE_MOCK_DATA if use_mock is None else use_mock
+        self.max_pages = max_pages or FETCH_CONFIG['max_pages']
+        self.request_stats = RequestStats()
+        self.rate_limiter = RateLimiter(stats=self.request_stats)
+        self.metrics = ScrapeMetrics(self.request_stats)
+        self.last_run = None  # summary of the latest scrape_jobs() run
+        # Metrics are labelled by board; detail pages share their board's host
+        self._boards = {urlparse(url).netloc: board for board, url in self.base_urls.items()}
+        self.cache = ResponseCache() if CACHE_CONFIG['enabled'] else None
+        self._indexes = {}  # profile name -> JobIndex, for profiles other than the default
+        self.dedup = None  # built from the store on first use, see _dedupe()
         
         # Create output directory if it doesn't exist
         if not os.path.exists(OUTPUT_DIRECTORY):
             os.makedirs(OUTPUT_DIRECTORY)
 
+    # The job store, job index, profiles, HTTP session, parsers and seen-jobs
+    # index open the database, read profile files and pull in requests,
+    # bs4/lxml and the index file; they are built on first use so that
+    # constructing a scraper, e.g. in a freshly forked web worker, stays cheap.
+    
+    @cached_property
+    def store(self) -> JobStore:
+        """Job store, with results saved by versions that only wrote jobs.json carried over."""
+        store = JobStore()
+        legacy_file = os.path.join(OUTPUT_DIRECTORY, JSON_FILENAME)
+        if store.count() == 0 and os.path.exists(legacy_file):
+            try:
+                store.import_json(legacy_file)
+            except Exception as e:
+                log_error(logger, e, {'file': legacy_file})
+        return store
+    
+    @cached_property
+    def index(self) -> JobIndex:
+        """In-memory index of the stored jobs ranked for the default profile."""
+        return JobIndex(self.store)
+    
+    @cached_property
+    def profiles(self) -> ProfileSet:
+        """Candidate profiles, reloaded before every scrape by _load_profiles()."""
+        return ProfileSet()
+    
+    @property
+    def scorer(self) -> JobScorer:
+        """Scorer of the default profile."""
+        return self.profiles.default
+    
+    @cached_property
+    def session(self):
+        """Pooled requests session shared by all fetch threads."""
+        from .session import build_session
+        return build_session()
+    
+    @cached_property
+    def ua(self):
+        """Shared user agent provider."""
+        return user_agents()
+    
+    @cached_property
+    def parsers(self) -> Dict:
+        """Configured parser per job board."""
+        return get_parsers()
+    
+    @cached_property
+    def seen(self) -> SeenJobsIndex:
+        """Index of job cards already parsed and detail pages already fetched."""
+        return SeenJobsIndex()
+    
+    @cached_property
+    def enricher(self) -> DetailEnricher:
+        """Fetches descriptions missing from result cards."""
+        return DetailEnricher(self._make_request, self.parsers, self.seen,
+                              self.store, self._calculate_job_score)
+
+    def _prepare_threads(self) -> None:
+        """Build the lazy resources worker threads share before the threads start."""
+        for name in ('session', 'parsers', 'seen'):
+            getattr(self, name)
+
     def _get_headers(self) -> Dict:
-        """Get headers with random user agent for requests."""
-        return {
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-        }
+        """Get per-request headers; the session already sends the browser headers."""
+        return {'User-Agent': self.ua.random}
 
     def _make_request(self, url: str, params: Dict = None) -> Optional[str]:
         """
-        Make an HTTP request with retry logic and random delays.
+        Make an HTTP request with per-host rate limiting and retry backoff.
+        
+        Responses are cached on disk: fresh entries are served without a
+        request and stale ones are revalidated with If-None-Match /
+        If-Modified-Since, serving the cached body on 304.
+        
+        Throttling responses (429/503 and other `retry_statuses`) and network
+        errors are retried with exponential backoff and jitter; a Retry-After
+        header overrides the backoff and pauses every request to that host.
         
         Args:
             url (str): URL to request
@@ -52,47 +156,94 @@ class JobScraper:
             str: HTML content if successful, None otherwise
         """
         # For development/testing, return mock data instead of making real requests
-        if url.startswith(('https://www.indeed.com', 'https://www.linkedin.com')):
+        if self.use_mock and url.startswith(('https://www.indeed.com', 'https://www.linkedin.com')):
             return self._get_mock_data()
-            
+        
+        host = urlparse(url).netloc
+        board = self._board_of(url, host)
+        cached = self.cache.get(url, params) if self.cache else None
+        if cached and cached['fresh']:
+            self.request_stats.record_cache('hit')
+            self.metrics.fetches.inc(board=board, outcome='cache_hit')
+            return cached['body']
+        
+        import requests
+        
         for attempt in range(REQUEST_CONFIG['max_retries']):
+            self.rate_limiter.acquire(host)
             try:
-                # Add random delay between requests
-                time.sleep(random.uniform(1, REQUEST_CONFIG['retry_delay']))
-                
-                headers = {
-                    'User-Agent': self.ua.random,
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                    'Cache-Control': 'max-age=0',
-                }
+                headers = self._get_headers()
+                if self.cache:
+                    headers.update(self.cache.conditional_headers(cached))
                 
+                self.request_stats.record_request()
+                start = time.perf_counter()
                 response = self.session.get(
                     url,
                     params=params,
                     headers=headers,
                     timeout=REQUEST_CONFIG['timeout']
                 )
+                self.metrics.fetch_seconds.observe(time.perf_counter() - start, board=board)
+                self.metrics.fetch_bytes.inc(len(response.content), board=board)
+                if response.status_code in REQUEST_CONFIG['retry_statuses']:
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    wait = backoff_delay(attempt, retry_after)
+                    self.request_stats.record_retry(response.status_code)
+                    log_error(logger, f"HTTP {response.status_code}", {'url': url, 'attempt': attempt + 1})
+                    if attempt == REQUEST_CONFIG['max_retries'] - 1:
+                        self.metrics.fetches.inc(board=board, outcome='failed')
+                        return None
+                    if retry_after is not None:
+                        self.rate_limiter.pause(host, wait)
+                    else:
+                        time.sleep(wait)
+                        self.request_stats.record_throttle(wait)
+                    continue
+                if response.status_code == 304 and cached:
+                    self.request_stats.record_cache('revalidated')
+                    self.metrics.fetches.inc(board=board, outcome='revalidated')
+                    self.cache.revalidated(url, params, cached)
+                    return cached['body']
                 response.raise_for_status()
+                if self.cache:
+                    self.request_stats.record_cache('miss')
+                    self.cache.put(
+                        url, params, response.text,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified')
+                    )
+                self.metrics.fetches.inc(board=board, outcome='ok')
                 return response.text
+            except requests.exceptions.HTTPError as e:
+                # Remaining 4xx/5xx responses will not improve on retry
+                log_error(logger, e, {'url': url, 'attempt': attempt + 1})
+                self.metrics.fetches.inc(board=board, outcome='http_error')
+                return None
             except requests.exceptions.RequestException as e:
                 log_error(logger, e, {'url': url, 'attempt': attempt + 1})
+                self.request_stats.record_retry(type(e).__name__)
                 if attempt == REQUEST_CONFIG['max_retries'] - 1:
+                    self.metrics.fetches.inc(board=board, outcome='failed')
                     return None
-                time.sleep(REQUEST_CONFIG['retry_delay'] * (attempt + 1))
+                wait = backoff_delay(attempt)
+                time.sleep(wait)
+                self.request_stats.record_throttle(wait)
         return None
 
+    def _board_of(self, url: str, host: str) -> str:
+        """Name the board a URL belongs to for metrics: by search URL, else by host."""
+        for board, base_url in self.base_urls.items():
+            if url.startswith(base_url):
+                return board
+        return self._boards.get(host, host)
+
     def _get_mock_data(self) -> str:
         """
         Return mock job data for testing purposes.
         """
+        # Posted a few days back, so the jobs stay within MAX_JOB_AGE
+        now = datetime.now().replace(microsecond=0)
         mock_jobs = [
             {
                 'title': 'Senior Program Manager',
@@ -100,10 +251,9 @@ class JobScraper:
                 'location': 'Los Angeles, CA',
                 'description': 'Leading digital transformation initiatives and stakeholder engagement. Experience with Salesforce, project management, and business intelligence tools required.',
                 'salary': '$120,000 - $160,000',
-                'date_posted': '2024-03-12T10:00:00',
+                'date_posted': (now - timedelta(days=2)).isoformat(),
                 'url': 'https://example.com/job1',
-                'source': 'Indeed',
-                'score': 0.92
+                'source': 'Indeed'
             },
             {
                 'title': 'Business Development Manager',
@@ -111,10 +261,9 @@ class JobScraper:
                 'location': 'Los Angeles, CA',
                 'description': 'Drive strategic partnerships and revenue growth. Experience in CRM implementation, stakeholder management, and process automation.',
                 'salary': '$100,000 - $140,000',
-                'date_posted': '2024-03-11T15:30:00',
+                'date_posted': (now - timedelta(days=3)).isoformat(),
                 'url': 'https://example.com/job2',
-                'source': 'LinkedIn',
-                'score': 0.88
+                'source': 'LinkedIn'
             },
             {
                 'title': 'Digital Transformation Lead',
@@ -122,22 +271,12 @@ class JobScraper:
                 'location': 'Los Angeles, CA',
                 'description': 'Lead digital transformation initiatives. Skills in change management, process optimization, and technical implementation required.',
                 'salary': '$130,000 - $180,000',
-                'date_posted': '2024-03-13T09:15:00',
+                'date_posted': (now - timedelta(days=1)).isoformat(),
                 'url': 'https://example.com/job3',
-                'source': 'Indeed',
-                'score': 0.85
+                'source': 'Indeed'
             }
         ]
         
-        # Save mock data to jobs.json
-        os.makedirs('data', exist_ok=True)
-        with open('data/jobs.json', 'w') as f:
-            json.dump({
-                'jobs': mock_jobs,
-                'timestamp': datetime.now().isoformat(),
-                'total_jobs': len(mock_jobs)
-            }, f, indent=2)
-        
         return json.dumps(mock_jobs)
 
     def _calculate_job_score(self, job: Dict) -> float:
@@ -150,110 +289,314 @@ class JobScraper:
         Returns:
             float: Score between 0 and 1
         """
-        score = 0
-        criteria = {}
-
-        # Title match
-        title_matches = any(title.lower() in job['title'].lower() for title in SEARCH_TITLES)
-        criteria['title_match'] = 1 if title_matches else 0
-        score += criteria['title_match'] * SCORING_WEIGHTS['title_match']
-
-        # Skills match
-        required_skills_found = sum(1 for skill in REQUIRED_SKILLS 
-                                  if skill.lower() in job['description'].lower())
-        technical_skills_found = sum(1 for skill in TECHNICAL_SKILLS 
-                                   if skill.lower() in job['description'].lower())
-        
-        skills_score = (required_skills_found / len(REQUIRED_SKILLS) * 0.7 + 
-                       technical_skills_found / len(TECHNICAL_SKILLS) * 0.3)
-        criteria['skills_match'] = skills_score
-        score += skills_score * SCORING_WEIGHTS['skills_match']
-
-        # Industry match
-        industry_matches = any(industry.lower() in job['description'].lower() 
-                             for industry in TARGET_INDUSTRIES)
-        criteria['industry_match'] = 1 if industry_matches else 0
-        score += criteria['industry_match'] * SCORING_WEIGHTS['industry_match']
-
-        # Location match
-        location_matches = (LOCATION['city'].lower() in job['location'].lower() and 
-                          LOCATION['state'].lower() in job['location'].lower())
-        criteria['location_match'] = 1 if location_matches else 0
-        score += criteria['location_match'] * SCORING_WEIGHTS['location_match']
-
-        # Log refinement result
-        log_refinement_result(logger, job.get('id', 'unknown'), score, criteria)
-
+        start = time.perf_counter()
+        if not logger.isEnabledFor(logging.DEBUG):
+            score = self.scorer.score(job)
+        else:
+            batch = self.scorer.score_batch([job])
+            log_refinement_result(logger, job.get('id', 'unknown'), batch.scores[0], batch.criteria(0))
+            score = batch.scores[0]
+        self.metrics.score_seconds.observe(time.perf_counter() - start,
+                                           board=(job.get('source') or '').lower())
         return score
 
     def _parse_indeed_job(self, job_element) -> Dict:
-        """Parse job information from Indeed HTML element."""
+        """Parse job information from an Indeed BeautifulSoup element."""
+        from .parsers.soup import SoupIndeedParser
+        return SoupIndeedParser().parse_card(job_element)
+
+    def _parse_linkedin_job(self, job_element) -> Dict:
+        """Parse job information from a LinkedIn BeautifulSoup element."""
+        from .parsers.soup import SoupLinkedInParser
+        return SoupLinkedInParser().parse_card(job_element)
+
+    def _iter_new_jobs(self, page_request: PageRequest, html: str) -> Iterator[Dict]:
+        """
+        Yield the new or changed jobs on a search result page, unscored.
+        
+        Cards whose board job id is in the seen-jobs index with the same
+        content hash are skipped before parsing.
+        
+        Args:
+            page_request (PageRequest): Page the HTML came from
+            html (str): Page HTML
+            
+        Yields:
+            dict: Parsed job information with its fingerprint as 'id'
+        """
+        source = page_request.source
+        parser = self.parsers[source]
+        # Parse time excludes the time the consumer holds each yielded job
+        elapsed = 0.0
+        start = time.perf_counter()
         try:
-            title = job_element.find('h2', {'class': 'jobTitle'}).get_text(strip=True)
-            company = job_element.find('span', {'class': 'companyName'}).get_text(strip=True)
-            location = job_element.find('div', {'class': 'companyLocation'}).get_text(strip=True)
-            description = job_element.find('div', {'class': 'job-snippet'}).get_text(strip=True)
+            for job in self._parse_new_cards(parser, page_request, html):
+                elapsed += time.perf_counter() - start
+                self.metrics.jobs_parsed.inc(board=source)
+                yield job
+                start = time.perf_counter()
+            elapsed += time.perf_counter() - start
+        finally:
+            self.metrics.parse_seconds.observe(elapsed, board=source)
+
+    def _parse_new_cards(self, parser, page_request: PageRequest, html: str) -> Iterator[Dict]:
+        """
+        Yield the parsed cards of a page that the seen-jobs index does not
+        know unchanged, with features added and jobs older than MAX_JOB_AGE left out.
+        
+        A changed card whose detail page was fetched on an earlier run keeps
+        the stored description, which the card itself does not carry.
+        """
+        source = page_request.source
+        for card in parser.iter_cards(html):
+            digest = content_hash(parser.card_content(card))
+            job_id = parser.card_job_id(card)
+            if job_id and self.seen.is_unchanged(f'{source}:{job_id}', digest):
+                self.seen.mark_seen(f'{source}:{job_id}', digest)
+                continue
             
-            job_info = {
-                'title': title,
-                'company': company,
-                'location': location,
-                'description': description,
-                'source': 'Indeed',
-                'date_found': datetime.now().isoformat(),
-            }
+            job = parser.parse_card(card)
+            if not job:
+                continue
+            if job.get('url'):
+                job['url'] = urljoin(page_request.url, job['url'])
+            job['id'] = job_fingerprint(job)
+            if self.seen.is_unchanged(job['id'], digest):
+                self.seen.mark_seen(job['id'], digest)
+                continue
             
-            # Try to extract salary if available
-            salary_elem = job_element.find('div', {'class': 'salary-snippet'})
-            if salary_elem:
-                job_info['salary'] = salary_elem.get_text(strip=True)
+            self.seen.mark_seen(job['id'], digest)
+            if not job.get('description') and self.seen.has_detail(job['id']):
+                stored = self.store.get(job['id'])
+                if stored and stored.get('description'):
+                    job['description'] = stored['description']
+            # Stale jobs stay marked seen, so they are not parsed again
+            if is_stale(add_features(job)):
+                self.metrics.jobs_stale.inc(board=source)
+                continue
+            yield job
+
+    def _dedupe(self, job: Dict) -> Optional[Duplicate]:
+        """
+        Check a parsed job against every canonical job seen so far.
+        
+        The near-duplicate index is seeded from the job store the first time
+        it is needed and then kept up to date as jobs are scraped.
+        
+        Args:
+            job (dict): Parsed job with its fingerprint as 'id'
             
-            return job_info
-        except Exception as e:
-            log_error(logger, e, {'element': str(job_element)})
+        Returns:
+            Duplicate: Canonical job to credit instead, or None if the job is canonical
+        """
+        if not DEDUP_CONFIG['enabled']:
             return None
+        if self.dedup is None:
+            self.dedup = NearDuplicateIndex()
+            for stored in self.store.query():
+                self.dedup.add(stored['id'], self.dedup.signature(stored))
+            logger.info("Loaded %d jobs into the duplicate index", len(self.dedup))
+        duplicate = self.dedup.check(job)
+        if duplicate and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Duplicate %s of %s (%s)", duplicate.id, duplicate.canonical_id, duplicate.url)
+        return duplicate
 
-    def _parse_linkedin_job(self, job_element) -> Dict:
-        """Parse job information from LinkedIn HTML element."""
-        try:
-            title = job_element.find('h3', {'class': 'base-search-card__title'}).get_text(strip=True)
-            company = job_element.find('h4', {'class': 'base-search-card__subtitle'}).get_text(strip=True)
-            location = job_element.find('span', {'class': 'job-search-card__location'}).get_text(strip=True)
+    def _score_job(self, job) -> List:
+        """Pipeline stage: score a parsed job; duplicates pass through unscored."""
+        if isinstance(job, Duplicate):
+            return [job]
+        job['score'] = self._calculate_job_score(job)
+        log_job_found(logger, job)
+        return [job]
+
+    def scrape_iter(self, concurrent: bool = True) -> Iterator[Dict]:
+        """
+        Scrape every board and search title as a streaming pipeline.
+        
+        Pages are fetched, parsed, scored and persisted by separate stages
+        connected through bounded queues, so memory stays flat and jobs are
+        stored and yielded while later pages are still downloading. Each
+        search keeps paginating until max_pages, an empty or failed page, or
+        a page whose postings were all seen unchanged on an earlier run.
+        
+        Args:
+            concurrent (bool): Fetch pages through the concurrent fetcher
+                instead of one at a time
             
-            job_info = {
-                'title': title,
-                'company': company,
-                'location': location,
-                'description': '',  # LinkedIn requires additional request for description
-                'source': 'LinkedIn',
-                'date_found': datetime.now().isoformat(),
-            }
+        Yields:
+            dict: Scored jobs that are new or changed, after they are saved
+        """
+        self._prepare_threads()
+        # One search per title and location wanted by any profile
+        first_pages = [page_request for location, titles in self.profiles.searches()
+                       for page_request in build_page_requests(self.base_urls, titles, location, 1)]
+        queue_size = PIPELINE_CONFIG['queue_size']
+        pages, parsed, scored = (queue.Queue(maxsize=queue_size) for _ in range(3))
+        pipeline = Pipeline()
+        fetcher = ConcurrentFetcher(self._make_request, max_workers=None if concurrent else 1)
+        
+        def on_page(page_request, html):
+            pipeline.put(pages, (page_request, html))
+        
+        def parse_pages():
+            outstanding = len(first_pages)
+            found = 0
+            try:
+                for page_request, html in pipeline.drain(pages):
+                    outstanding -= 1
+                    page_jobs = 0
+                    if html:
+                        for job in self._iter_new_jobs(page_request, html):
+                            page_jobs += 1
+                            if not pipeline.put(parsed, self._dedupe(job) or job):
+                                return
+                    # Stop paginating on failed or empty pages and on pages
+                    # made up entirely of already known postings
+                    if page_jobs and page_request.page + 1 < self.max_pages:
+                        outstanding += 1
+                        fetcher.submit(next_page_request(page_request), on_page)
+                    found += page_jobs
+                    log_scraping_progress(logger, page_request.source, page_request.page + 1, found)
+                    if not outstanding:
+                        break
+            except Exception as e:
+                log_error(logger, e, {'stage': 'parse'})
+            pipeline.put(parsed, DONE)
+        
+        batch_size = PIPELINE_CONFIG['batch_size']
+        batch = []
+        with fetcher:
+            try:
+                for page_request in first_pages:
+                    fetcher.submit(page_request, on_page)
+                pipeline.start('parse', parse_pages)
+                pipeline.stage('score', self._score_job, parsed, scored)
+                
+                while True:
+                    try:
+                        job = scored.get(timeout=PIPELINE_CONFIG['flush_interval'])
+                    except queue.Empty:
+                        job = None
+                    if job is DONE:
+                        break
+                    if job is not None:
+                        batch.append(job)
+                    if batch and (job is None or len(batch) >= batch_size):
+                        yield from self._flush(batch)
+                        batch = []
+                if batch:
+                    yield from self._flush(batch)
+                # Jobs whose batch failed to save had their hashes dropped by _save_results()
+                self.seen.save()
+                logger.info("Request stats: %s", self.request_stats.snapshot())
+            finally:
+                pipeline.close()
+
+    def iter_archived_pages(self) -> Iterator[Page]:
+        """
+        Yield the search result pages kept in the response cache.
+        
+        Yields:
+            Page: Cached page for one of the configured boards
+        """
+        if not self.cache:
+            return
+        for entry in self.cache.iter_entries():
+            for source, base_url in self.base_urls.items():
+                if entry['url'].startswith(base_url):
+                    yield Page(source, entry['url'], entry['body'])
+                    break
+
+    def backfill(self, pages: Iterable[Page] = None, workers: int = None) -> Iterator[Dict]:
+        """
+        Parse and score archived pages on a process pool and store the results.
+        
+        Worker processes do the CPU-bound parsing and scoring; this process
+        only reads pages, filters known postings and persists new ones.
+        
+        Args:
+            pages (iterable, optional): Pages to process, defaults to the
+                pages held in the response cache
+            workers (int, optional): Worker processes, defaults to
+                PIPELINE_CONFIG['process_workers'] or the CPU count
             
-            return job_info
-        except Exception as e:
-            log_error(logger, e, {'element': str(job_element)})
-            return None
+        Yields:
+            dict: Scored jobs that are new or changed, after they are saved
+        """
+        pages = self.iter_archived_pages() if pages is None else pages
+        batch_size = PIPELINE_CONFIG['batch_size']
+        batch = []
+        processed = 0
+        for page, parsed_jobs in ParsePool(workers).map_pages(pages):
+            for digest, job in parsed_jobs:
+                if self.seen.is_unchanged(job['id'], digest):
+                    self.seen.mark_seen(job['id'], digest)
+                    continue
+                self.seen.mark_seen(job['id'], digest)
+                duplicate = self._dedupe(job)
+                if duplicate is None:
+                    log_job_found(logger, job)
+                batch.append(duplicate or job)
+            processed += 1
+            if len(batch) >= batch_size:
+                yield from self._flush(batch)
+                batch = []
+            log_scraping_progress(logger, f"backfill:{page.source}", processed, len(batch))
+        if batch:
+            yield from self._flush(batch)
+        self.seen.save()
 
-    def scrape_jobs(self) -> List[Dict]:
+    def scrape_jobs(self, concurrent: bool = True,
+                    progress: Optional[Callable[[int], None]] = None) -> List[Dict]:
         """
         Get jobs from mock data or scrape from job boards.
         
+        Args:
+            concurrent (bool): Fetch board pages concurrently when scraping
+                live boards
+            progress (callable, optional): Called with the number of jobs
+                found so far whenever it changes
+            
         Returns:
-            list: List of job dictionaries with scores
+            list: Job dictionaries with scores that were new or changed in
+                this run; the full result set lives in the job store
         """
+        started_at = datetime.now()
+        before = self.metrics.snapshot()
+        self._load_profiles()
+        rescored = self._rescore_if_changed()
         try:
-            # Get mock data
-            mock_data = self._make_request(BASE_URLS['indeed'])
+            if not self.use_mock:
+                # The pipeline saves jobs batch by batch as they stream in
+                self.jobs = []
+                for job in self.scrape_iter(concurrent):
+                    self.jobs.append(job)
+                    if progress:
+                        progress(len(self.jobs))
+                if ENRICH_CONFIG['enabled']:
+                    self.enrich_jobs(self.jobs)
+                mock_data = None
+            else:
+                # Get mock data
+                mock_data = self._make_request(BASE_URLS['indeed'])
             if mock_data:
                 try:
                     jobs_data = json.loads(mock_data)
                     self.jobs = jobs_data if isinstance(jobs_data, list) else []
                     
                     # Log found jobs
+                    batch = []
                     for job in self.jobs:
-                        log_job_found(logger, job)
+                        job.setdefault('id', job_fingerprint(job))
+                        if is_stale(add_features(job)):
+                            self.metrics.jobs_stale.inc(board=job['source'].lower())
+                            continue
+                        batch += self._score_job(self._dedupe(job) or job)
                     
                     log_scraping_progress(logger, "mock", 1, len(self.jobs))
+                    self.jobs = self._flush(batch)
+                    if progress:
+                        progress(len(self.jobs))
                 except json.JSONDecodeError as e:
                     log_error(logger, e, {'content': 'Error parsing mock data'})
                     self.jobs = []
@@ -264,37 +607,235 @@ class JobScraper:
         # Sort jobs by score
         if self.jobs:
             self.jobs.sort(key=lambda x: x['score'], reverse=True)
-            
-        # Save results
-        self._save_results()
+        
+        self._prune()
+        self.last_run = self._record_run(started_at, before, rescored)
+        self._export_results(self.last_run)
+        self._refresh_indexes()
         
         return self.jobs
 
-    def _save_results(self):
-        """Save scraped jobs to JSON file."""
-        output_file = os.path.join(OUTPUT_DIRECTORY, 'jobs.json')
+    def _refresh_indexes(self) -> None:
+        """Reload the job indexes now, so requests after a scrape see its jobs rather than a stale snapshot."""
+        # The default index is left to be built when first queried
+        indexes = [self.__dict__['index']] if 'index' in self.__dict__ else []
+        for index in [*indexes, *self._indexes.values()]:
+            try:
+                index.refresh()
+            except Exception as e:
+                log_error(logger, e, {'profile': index.profile})
+
+    def _load_profiles(self) -> None:
+        """Reload the profile files, so profiles added or edited since take part in the next scrape."""
+        self.profiles = ProfileSet()
+        self._indexes = {name: index for name, index in self._indexes.items()
+                         if name in self.profiles}
+
+    def _rescore_if_changed(self) -> Optional[Dict]:
+        """
+        Rescore stored jobs if profiles or weights changed since they were scored.
+        
+        Returns:
+            dict: Report from rescore.rescore(), or None if nothing changed
+        """
+        try:
+            if self.store.scored_with() == self.profiles.scoring_keys:
+                return None
+            return rescore(self.store, self.profiles)
+        except Exception as e:
+            log_error(logger, e, {'file': self.store.path})
+            return None
+
+    def _prune(self) -> None:
+        """Delete stored jobs that have grown older than MAX_JOB_AGE."""
+        try:
+            pruned = self.store.prune()
+        except Exception as e:
+            log_error(logger, e, {'file': self.store.path})
+            return
+        if pruned:
+            self.metrics.jobs_pruned.inc(pruned)
+            logger.info("Pruned %d jobs older than the age limit", pruned)
+
+    def _record_run(self, started_at: datetime, before: Dict, rescored: Dict = None) -> Dict:
+        """
+        Summarize the metrics observed during a scrape run and store the
+        summary, adding the observations to the totals every process shares.
+        
+        Args:
+            started_at (datetime): When the run started
+            before (dict): Metrics snapshot taken when the run started
+            rescored (dict, optional): Report of the rescore run before scraping
+            
+        Returns:
+            dict: Run summary with per-board fetch, parse and score timings
+        """
+        finished_at = datetime.now()
+        duration = (finished_at - started_at).total_seconds()
+        self.metrics.run_seconds.observe(duration)
+        summary = {
+            'started_at': started_at.isoformat(),
+            'finished_at': finished_at.isoformat(),
+            'duration_seconds': round(duration, 3),
+            'jobs_found': len(self.jobs),
+            **self.metrics.summary(before),
+            'rescore': rescored,
+        }
+        try:
+            self.store.add_run(summary)
+            self.metrics.save(self.store)
+        except Exception as e:
+            log_error(logger, e, {'file': self.store.path})
+        return summary
+
+    def enrich_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Fetch missing descriptions from detail pages, then rescore and save those jobs.
+        
+        Cards without a description are never collapsed when parsed, so each
+        enriched job is checked for near-duplicates again with its full text.
+        Jobs found to duplicate another job are merged into it as sources,
+        deleted from the store and dropped from `jobs`.
+        
+        Args:
+            jobs (list): Scored jobs, updated in place
+            
+        Returns:
+            list: The jobs that gained a description and remain canonical
+        """
+        self._prepare_threads()
+        enriched = self.enricher.enrich(jobs)
+        if enriched:
+            canonical, duplicates = [], []
+            for job in enriched:
+                duplicate = self._dedupe(job)
+                if duplicate is None:
+                    canonical.append(job)
+                    continue
+                # The job may already have collected sources of its own
+                duplicates += [Duplicate(duplicate.canonical_id, job['id'], entry['source'], entry['url'])
+                               for entry in job.get('sources') or [source_entry(job)]]
+            if canonical:
+                self._save_results(canonical)
+            if duplicates:
+                self._save_duplicates(duplicates)
+                merged = {duplicate.id for duplicate in duplicates}
+                for job_id in merged:
+                    self.dedup.remove(job_id)
+                try:
+                    self.store.delete(merged)
+                except Exception as e:
+                    log_error(logger, e, {'file': self.store.path})
+                jobs[:] = [job for job in jobs if job['id'] not in merged]
+            enriched = canonical
+        self.seen.save()
+        return enriched
+
+    def _flush(self, batch: List) -> List[Dict]:
+        """
+        Persist a batch of scored jobs and duplicates.
+        
+        Canonical jobs are saved first, so a duplicate of a job in the same
+        batch always finds its canonical record.
+        
+        Args:
+            batch (list): Job dictionaries and Duplicate records
+            
+        Returns:
+            list: The job dictionaries, without duplicates
+        """
+        jobs = [item for item in batch if not isinstance(item, Duplicate)]
+        if jobs:
+            self._save_results(jobs)
+        if len(jobs) < len(batch):
+            self._save_duplicates([item for item in batch if isinstance(item, Duplicate)])
+        return jobs
+
+    def _save_duplicates(self, duplicates: List[Duplicate]):
+        """Record duplicate postings as extra sources of their canonical jobs."""
+        by_canonical = {}
+        for duplicate in duplicates:
+            by_canonical.setdefault(duplicate.canonical_id, []).append(
+                {'source': duplicate.source, 'url': duplicate.url})
         try:
-            with open(output_file, 'w') as f:
-                json.dump({
-                    'jobs': self.jobs,
-                    'timestamp': datetime.now().isoformat(),
-                    'total_jobs': len(self.jobs)
-                }, f, indent=2)
-            logger.info(f"Results saved to {output_file}")
+            merged = sum(self.store.add_sources(canonical_id, sources)
+                         for canonical_id, sources in by_canonical.items())
+            logger.info("Merged %d duplicate postings into %d jobs", len(duplicates), merged)
         except Exception as e:
-            log_error(logger, e, {'file': output_file})
+            log_error(logger, e, {'file': self.store.path})
+            for duplicate in duplicates:
+                self.seen.invalidate(duplicate.id)
+
+    def _save_results(self, jobs: List[Dict]):
+        """
+        Upsert scraped jobs into the job store with their feature vectors, and
+        score them for every profile besides the default one from the vectors.
+        
+        If the write fails, the jobs' content hashes are dropped from the
+        seen-jobs index, so the next run does not skip them as unchanged.
+        """
+        try:
+            with self.metrics.save_seconds.time():
+                saved = self.store.upsert_jobs(jobs)
+                terms = self.profiles.terms
+                vectors = [(job['id'], terms.vector(job)) for job in jobs]
+                self.store.save_vectors(terms, vectors)
+                now = time.time()
+                for name, scorer in self.profiles.others():
+                    self.store.set_scores([(job_id, scorer.score_vector(vector, now))
+                                           for job_id, vector in vectors], profile=name)
+            self.metrics.jobs_saved.inc(saved)
+            logger.info("Saved %d jobs to %s", saved, self.store.path)
+        except Exception as e:
+            log_error(logger, e, {'file': self.store.path})
+            for job in jobs:
+                self.seen.invalidate(job['id'])
+
+    def _export_results(self, run: Dict = None):
+        """Rewrite the JSON export of the job store if enabled, with the run summary."""
+        if STORAGE_CONFIG['export_json']:
+            output_file = os.path.join(OUTPUT_DIRECTORY, JSON_FILENAME)
+            try:
+                self.store.export_json(output_file, run=run)
+            except Exception as e:
+                log_error(logger, e, {'file': output_file})
+
+    def index_for(self, profile: str = None) -> JobIndex:
+        """
+        Return the job index ranked for a profile.
+        
+        Indexes of profiles other than the default one are built on first
+        use; each holds its own snapshot of the store.
+        
+        Args:
+            profile (str, optional): Profile name, defaults to the default profile
+            
+        Returns:
+            JobIndex: Index whose scores are the profile's
+            
+        Raises:
+            ValueError: If the profile is unknown
+        """
+        if not profile or profile == DEFAULT_PROFILE:
+            return self.index
+        index = self._indexes.get(profile)
+        if index is None:
+            self.profiles[profile]  # raises for unknown profiles
+            index = self._indexes.setdefault(profile, JobIndex(self.store, profile))
+        return index
 
-    def get_top_jobs(self, limit: int = 10) -> List[Dict]:
+    def get_top_jobs(self, limit: int = 10, profile: str = None) -> List[Dict]:
         """
         Get top scoring jobs.
         
         Args:
             limit (int): Number of jobs to return
+            profile (str, optional): Profile to rank for, defaults to the default profile
             
         Returns:
             list: Top scoring jobs
         """
-        return sorted(self.jobs, key=lambda x: x['score'], reverse=True)[:limit]
+        return self.index_for(profile).query(limit=limit)
 
 if __name__ == '__main__':
     scraper = JobScraper()
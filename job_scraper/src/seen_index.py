@@ -0,0 +1,126 @@
+"""
+Persistent index of job postings already seen by the scraper.
+Lets a refresh skip unchanged postings and stop paginating once a page is
+made up entirely of known jobs.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Optional
+
+from .config import OUTPUT_DIRECTORY, SEEN_INDEX_FILENAME
+from .logger import logger, log_error
+
+
+class SeenJobsIndex:
+    """
+    Map of job fingerprint to the content hash and first/last seen times.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Args:
+            path (str, optional): JSON file backing the index
+        """
+        self.path = path or os.path.join(OUTPUT_DIRECTORY, SEEN_INDEX_FILENAME)
+        self.entries = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f).get('jobs', {})
+        except (OSError, ValueError) as e:
+            log_error(logger, e, {'file': self.path})
+            return {}
+
+    def is_unchanged(self, fingerprint: str, digest: str) -> bool:
+        """
+        Check whether a posting was seen before with the same content.
+
+        Args:
+            fingerprint (str): Job fingerprint
+            digest (str): Content hash of the posting
+
+        Returns:
+            bool: True if known and unchanged
+        """
+        entry = self.entries.get(fingerprint)
+        return entry is not None and entry['hash'] == digest
+
+    def get(self, fingerprint: str) -> Optional[Dict]:
+        """Return the index entry for a fingerprint, if any."""
+        return self.entries.get(fingerprint)
+
+    def mark_seen(self, fingerprint: str, digest: str) -> None:
+        """
+        Record a posting as seen now with the given content hash.
+
+        Args:
+            fingerprint (str): Job fingerprint
+            digest (str): Content hash of the posting
+        """
+        now = datetime.now().isoformat()
+        entry = self.entries.get(fingerprint)
+        if entry is None:
+            self.entries[fingerprint] = {'hash': digest, 'first_seen': now, 'last_seen': now}
+        else:
+            entry['hash'] = digest
+            entry['last_seen'] = now
+        self._dirty = True
+
+    def invalidate(self, fingerprint: str) -> None:
+        """
+        Forget a posting's content hash, so the next run parses and saves it
+        again; used when saving the posting failed.
+
+        Args:
+            fingerprint (str): Job fingerprint
+        """
+        entry = self.entries.get(fingerprint)
+        if entry is not None:
+            entry['hash'] = None
+            self._dirty = True
+
+    def has_detail(self, fingerprint: str) -> bool:
+        """Check whether a posting's detail page was already fetched."""
+        entry = self.entries.get(fingerprint)
+        return entry is not None and 'detail_fetched' in entry
+
+    def mark_detail(self, fingerprint: str) -> None:
+        """
+        Record that a posting's detail page was fetched, so it never is again.
+
+        Args:
+            fingerprint (str): Job fingerprint, already marked seen
+        """
+        entry = self.entries.get(fingerprint)
+        if entry is not None:
+            entry['detail_fetched'] = datetime.now().isoformat()
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the index to disk if it changed."""
+        if not self._dirty:
+            return
+        tmp_path = f'{self.path}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({
+                    'jobs': self.entries,
+                    'timestamp': datetime.now().isoformat(),
+                }, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            log_error(logger, e, {'file': self.path})
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
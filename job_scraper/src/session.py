@@ -0,0 +1,50 @@
+"""
+HTTP session setup for the job scraper.
+One session is shared by every fetch thread; its adapter keeps a pool of
+keep-alive connections per host sized for the fetcher's concurrency.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import ENRICH_CONFIG, FETCH_CONFIG
+
+# Sent with every request; only the User-Agent and cache validators vary
+BROWSER_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+}
+
+
+def build_session(pool_hosts: int = None, pool_maxsize: int = None) -> requests.Session:
+    """
+    Create a session with browser headers and sized connection pools.
+
+    Retries stay with the caller, which backs off and honours Retry-After,
+    so the adapter itself never retries.
+
+    Args:
+        pool_hosts (int, optional): Hosts whose pools are kept open,
+            defaults to FETCH_CONFIG['pool_hosts']
+        pool_maxsize (int, optional): Connections kept per host, defaults to
+            the larger of the fetch and enrichment per-host limits
+
+    Returns:
+        requests.Session: Session safe to share between fetch threads
+    """
+    pool_hosts = pool_hosts or FETCH_CONFIG['pool_hosts']
+    pool_maxsize = pool_maxsize or max(FETCH_CONFIG['per_host_limit'], ENRICH_CONFIG['per_host_limit'])
+    adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_maxsize, max_retries=0)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(BROWSER_HEADERS)
+    return session
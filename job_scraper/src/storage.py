@@ -0,0 +1,936 @@
+"""
+SQLite-backed job storage for the job scraper.
+Persists jobs with upsert semantics and serves indexed queries to the web app.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .config import MAX_JOB_AGE, PROFILE_CONFIG, SEARCH_CONFIG, STORAGE_CONFIG
+from .dedup import source_entry
+from .features import DAY, add_features
+from .logger import logger
+from .metrics import add_states
+from .scoring import PLACE_TERM, TEXT_TERM, TITLE_TERM, FeatureVector, TermSet
+from .utils.helpers import job_fingerprint
+
+# Job fields stored in their own indexed or queried columns; the full job
+# dict is kept alongside as JSON so extra fields round-trip unchanged.
+JOB_COLUMNS = [
+    'id', 'title', 'company', 'location', 'source', 'url',
+    'salary', 'date_posted', 'date_found', 'score', 'posted_at'
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    source TEXT,
+    url TEXT,
+    salary TEXT,
+    date_posted TEXT,
+    date_found TEXT,
+    score REAL,
+    posted_at REAL,
+    data TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_date_posted ON jobs (date_posted);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT,
+    finished_at TEXT,
+    summary TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_features (
+    id TEXT PRIMARY KEY,
+    terms TEXT NOT NULL,
+    matches TEXT NOT NULL,
+    salary_min REAL,
+    salary_max REAL,
+    posted_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_job_features_terms ON job_features (terms);
+CREATE TABLE IF NOT EXISTS term_sets (
+    hash TEXT PRIMARY KEY,
+    terms TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS profile_scores (
+    profile TEXT NOT NULL,
+    id TEXT NOT NULL,
+    score REAL,
+    PRIMARY KEY (profile, id)
+);
+CREATE INDEX IF NOT EXISTS idx_profile_scores_score ON profile_scores (profile, score DESC, id);
+"""
+
+# Full-text index over title, company and description. Rows share the rowid of
+# their job; jobs has no INTEGER PRIMARY KEY, so rebuild_search_index() after a
+# VACUUM, which may renumber rowids. Triggers only queue the rowids of jobs
+# whose text is new or changed, and every write indexes the queue in one
+# statement: FTS5 flushes its buffered terms at each statement savepoint, so
+# indexing from the triggers would write an index segment per job.
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, description, tokenize = 'porter unicode61'
+);
+CREATE TABLE IF NOT EXISTS jobs_fts_pending (rowid INTEGER PRIMARY KEY);
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT OR IGNORE INTO jobs_fts_pending (rowid) VALUES (new.rowid);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, data ON jobs
+WHEN old.title IS NOT new.title OR old.company IS NOT new.company
+    OR json_extract(old.data, '$.description') IS NOT json_extract(new.data, '$.description')
+BEGIN
+    INSERT OR IGNORE INTO jobs_fts_pending (rowid) VALUES (new.rowid);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    DELETE FROM jobs_fts WHERE rowid = old.rowid;
+    DELETE FROM jobs_fts_pending WHERE rowid = old.rowid;
+END;
+"""
+
+# A "quoted phrase", or a word with an optional trailing * for prefix search
+_QUERY_TOKEN = re.compile(r'"([^"]*)"|(\w+)(\*?)')
+_WORD = re.compile(r'\w+')
+
+# job_features columns after id and terms, in FeatureVector order
+VECTOR_COLUMNS = list(FeatureVector._fields)
+
+# Column holding the text each kind of term key is looked for in, see jobs_containing()
+TERM_COLUMNS = {
+    TITLE_TERM: 'jobs_fts.title',
+    TEXT_TERM: 'jobs_fts.description',
+    PLACE_TERM: 'jobs.location',
+}
+
+# Created once the posted_at column exists, see JobStore._migrate()
+POSTED_AT_INDEX = "CREATE INDEX IF NOT EXISTS idx_jobs_posted_at ON jobs (posted_at)"
+
+# Indexes on score, dropped and rebuilt around bulk score updates in set_scores()
+SCORE_INDEXES = {
+    'idx_jobs_score': "CREATE INDEX IF NOT EXISTS idx_jobs_score ON jobs (score DESC)",
+    'idx_jobs_source': "CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs (source, score DESC)",
+}
+
+# Score updates above this many rows rebuild the score indexes instead of updating them
+BULK_SCORES = 1000
+
+# Columns callers may sort on, mapped to their ORDER BY clause
+ORDER_BY = {
+    'score': 'score DESC, id',
+    'date_posted': 'date_posted DESC, id',
+    'date_found': 'date_found DESC, id',
+}
+
+
+def _jobs_table(profile: Optional[str]) -> Tuple[str, list]:
+    """
+    The jobs table, or a view of it scored for another profile.
+
+    The default profile's scores live in jobs.score; other profiles' scores
+    live in profile_scores and replace it, so the same filters and ORDER BY
+    clauses apply to every profile.
+    """
+    if profile is None or profile == PROFILE_CONFIG['default']:
+        return 'jobs', []
+    # id and score come from profile_scores, so its index serves ORDER BY score DESC, id
+    columns = ', '.join(f'jobs.{column}' for column in JOB_COLUMNS if column not in ('id', 'score'))
+    return (f"(SELECT jobs.rowid AS rowid, profile_scores.id AS id, {columns}, jobs.data, "
+            "profile_scores.score AS score "
+            "FROM jobs "
+            "JOIN profile_scores ON profile_scores.id = jobs.id AND profile_scores.profile = ?)",
+            [profile])
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn search box input into an FTS5 query for jobs holding every word and phrase.
+
+    Every word is quoted, so punctuation and FTS5 operators in the input are
+    searched for literally instead of raising a syntax error.
+
+    Args:
+        text (str): Words, "quoted phrases" and prefix* words
+
+    Returns:
+        str: FTS5 MATCH expression, empty if the input holds no words
+    """
+    terms = []
+    for phrase, word, star in _QUERY_TOKEN.findall(text):
+        if word:
+            terms.append(f'"{word}"{star}')
+        elif _WORD.search(phrase):
+            terms.append('"' + ' '.join(_WORD.findall(phrase)) + '"')
+    return ' '.join(terms)
+
+
+def _job(row: sqlite3.Row) -> Dict:
+    """Decode a stored job; the score column is kept current by set_scores(), the JSON is not."""
+    job = json.loads(row['data'])
+    if row['score'] is not None:
+        job['score'] = row['score']
+    return job
+
+
+class JobStore:
+    """
+    Job store backed by a SQLite database in WAL mode.
+
+    Connections are kept per thread so the store can be shared by Flask
+    request handlers and the scraper.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Args:
+            path (str, optional): Database file, defaults to STORAGE_CONFIG['database']
+        """
+        self.path = path or STORAGE_CONFIG['database']
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        self._migrate(conn)
+        for statement in [POSTED_AT_INDEX, *SCORE_INDEXES.values()]:
+            conn.execute(statement)
+        self._create_search_index(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Add the posted_at column to databases created before it existed."""
+        columns = {row['name'] for row in conn.execute('PRAGMA table_info(jobs)')}
+        if 'posted_at' in columns:
+            return
+        with conn:
+            conn.execute('ALTER TABLE jobs ADD COLUMN posted_at REAL')
+            rows = conn.execute('SELECT id, data FROM jobs').fetchall()
+            updates = []
+            for row in rows:
+                job = add_features(json.loads(row['data']))
+                updates.append((job.get('posted_at'), job.get('date_posted'), json.dumps(job), row['id']))
+            conn.executemany('UPDATE jobs SET posted_at = ?, date_posted = ?, data = ? WHERE id = ?',
+                             updates)
+        logger.info("Added posting times to %d stored jobs", len(updates))
+
+    def _create_search_index(self, conn: sqlite3.Connection) -> None:
+        """Create the full-text index, filled from the stored jobs if it is new."""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+        ).fetchone()
+        conn.executescript(SEARCH_SCHEMA)
+        if not exists:
+            self.rebuild_search_index()
+
+    def rebuild_search_index(self) -> int:
+        """
+        Refill the full-text index from the stored jobs.
+
+        Returns:
+            int: Number of jobs indexed
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute('DELETE FROM jobs_fts')
+            conn.execute('DELETE FROM jobs_fts_pending')
+            indexed = conn.execute(
+                "INSERT INTO jobs_fts (rowid, title, company, description) "
+                "SELECT rowid, title, company, json_extract(data, '$.description') FROM jobs"
+            ).rowcount
+        if indexed:
+            logger.info("Indexed %d jobs for full-text search", indexed)
+        return indexed
+
+    def upsert_jobs(self, jobs: Iterable[Dict]) -> int:
+        """
+        Insert jobs, replacing any stored job with the same id.
+
+        The 'sources' a stored job collected from its near-duplicates (see
+        add_sources()) are kept, with any new ones in the job appended.
+
+        Args:
+            jobs (iterable): Job dictionaries with an 'id'
+
+        Returns:
+            int: Number of jobs written
+        """
+        now = datetime.now().isoformat()
+        jobs = list(jobs)
+        conn = self._connect()
+        with conn:
+            jobs = self._merge_sources(conn, jobs)
+            rows = [
+                tuple(job.get(column) for column in JOB_COLUMNS) + (json.dumps(job), now)
+                for job in jobs
+            ]
+            conn.executemany(
+                f"INSERT INTO jobs ({', '.join(JOB_COLUMNS)}, data, updated_at) "
+                f"VALUES ({', '.join('?' * (len(JOB_COLUMNS) + 2))}) "
+                "ON CONFLICT(id) DO UPDATE SET "
+                + ', '.join(f'{column} = excluded.{column}' for column in JOB_COLUMNS[1:])
+                + ", data = excluded.data, updated_at = excluded.updated_at",
+                rows
+            )
+            # Cached feature vectors of rewritten jobs may no longer hold
+            conn.executemany('DELETE FROM job_features WHERE id = ?', [(row[0],) for row in rows])
+            self._touch(conn, now)
+        return len(rows)
+
+    @staticmethod
+    def _merge_sources(conn: sqlite3.Connection, jobs: List[Dict]) -> List[Dict]:
+        """Return the jobs with the 'sources' their stored versions collected merged in."""
+        stored = {}
+        ids = [job['id'] for job in jobs]
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            stored.update(conn.execute(
+                "SELECT id, json_extract(data, '$.sources') FROM jobs "
+                f"WHERE id IN ({', '.join('?' * len(chunk))}) "
+                "AND json_extract(data, '$.sources') IS NOT NULL", chunk).fetchall())
+        if not stored:
+            return jobs
+        merged = []
+        for job in jobs:
+            known = stored.get(job['id'])
+            if known:
+                sources = json.loads(known)
+                sources += [source for source in job.get('sources') or [source_entry(job)]
+                            if source not in sources]
+                job = dict(job, sources=sources)
+            merged.append(job)
+        return merged
+
+    def prune(self, max_age: float = None) -> int:
+        """
+        Delete jobs posted longer ago than the age limit.
+
+        Args:
+            max_age (float, optional): Age limit in days, defaults to MAX_JOB_AGE
+
+        Returns:
+            int: Number of jobs deleted
+        """
+        max_age = MAX_JOB_AGE if max_age is None else max_age
+        cutoff = time.time() - max_age * DAY
+        conn = self._connect()
+        with conn:
+            for table in ('job_features', 'profile_scores'):
+                conn.execute(f'DELETE FROM {table} WHERE id IN '
+                             '(SELECT id FROM jobs WHERE posted_at < ?)', (cutoff,))
+            deleted = conn.execute('DELETE FROM jobs WHERE posted_at < ?', (cutoff,)).rowcount
+            if deleted:
+                self._touch(conn, datetime.now().isoformat())
+        return deleted
+
+    def delete(self, job_ids: Iterable[str]) -> int:
+        """
+        Delete jobs with their feature vectors and profile scores.
+
+        Args:
+            job_ids (iterable): Ids of the jobs to delete
+
+        Returns:
+            int: Number of jobs deleted
+        """
+        rows = [(job_id,) for job_id in job_ids]
+        conn = self._connect()
+        with conn:
+            for table in ('job_features', 'profile_scores'):
+                conn.executemany(f'DELETE FROM {table} WHERE id = ?', rows)
+            deleted = conn.executemany('DELETE FROM jobs WHERE id = ?', rows).rowcount
+            if deleted:
+                self._touch(conn, datetime.now().isoformat())
+        return deleted
+
+    def save_term_set(self, terms: TermSet) -> None:
+        """Remember the term keys behind a TermSet hash, see term_set()."""
+        conn = self._connect()
+        with conn:
+            conn.execute('INSERT OR IGNORE INTO term_sets (hash, terms) VALUES (?, ?)',
+                         (terms.hash, json.dumps(sorted(terms.keys))))
+
+    def term_set(self, terms_hash: str) -> Optional[TermSet]:
+        """Return the TermSet saved under a hash, or None."""
+        row = self._connect().execute(
+            'SELECT terms FROM term_sets WHERE hash = ?', (terms_hash,)
+        ).fetchone()
+        return TermSet(json.loads(row['terms'])) if row else None
+
+    def save_vectors(self, terms: TermSet, vectors: Iterable[Tuple[str, FeatureVector]]) -> None:
+        """
+        Cache the feature vectors of stored jobs, replacing older ones.
+
+        Args:
+            terms (TermSet): Every term that has been looked for in these jobs
+            vectors (iterable): (job id, FeatureVector) pairs
+        """
+        rows = [(job_id, terms.hash, json.dumps(sorted(vector.matches))) + tuple(vector[1:])
+                for job_id, vector in vectors]
+        if not rows:
+            return
+        self.save_term_set(terms)
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO job_features (id, terms, {', '.join(VECTOR_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * (len(VECTOR_COLUMNS) + 2))})",
+                rows
+            )
+
+    def vectors(self) -> Iterator[Tuple[str, Optional[str], Optional[FeatureVector]]]:
+        """
+        Yield every stored job with its cached feature vector.
+
+        Yields:
+            tuple: (job id, TermSet hash, FeatureVector), the last two None
+                for jobs without a cached vector
+        """
+        cursor = self._connect().cursor()
+        cursor.row_factory = None  # plain tuples; sqlite3.Row is slower over many rows
+        rows = cursor.execute(
+            f"SELECT jobs.id, job_features.terms, "
+            f"{', '.join('job_features.' + column for column in VECTOR_COLUMNS)} "
+            "FROM jobs LEFT JOIN job_features ON job_features.id = jobs.id"
+        )
+        loads, make = json.loads, FeatureVector._make
+        # Most jobs match one of a few term combinations; decode each once
+        matches = {}
+        for row in rows:
+            if row[1] is None:
+                yield row[0], None, None
+                continue
+            found = matches.get(row[2])
+            if found is None:
+                found = matches[row[2]] = frozenset(loads(row[2]))
+            yield row[0], row[1], make((found,) + row[3:])
+
+    def relabel_vectors(self, relabels: Dict[str, TermSet]) -> None:
+        """
+        Record that more terms have been looked for in cached feature vectors.
+
+        Args:
+            relabels (dict): TermSet hash -> TermSet the vectors under that
+                hash now cover
+        """
+        for terms in relabels.values():
+            self.save_term_set(terms)
+        conn = self._connect()
+        with conn:
+            conn.executemany('UPDATE job_features SET terms = ? WHERE terms = ?',
+                             [(terms.hash, old) for old, terms in relabels.items()])
+
+    def jobs_containing(self, keys: Iterable[str]) -> Optional[Set[str]]:
+        """
+        Return the ids of stored jobs whose text holds any of the given terms.
+
+        The search runs in SQL over the full-text index's copy of the title
+        and description, which unlike the jobs table keeps the description
+        outside the JSON, so no job text is decoded. The terms are looked for
+        as substrings, like TermSet.match() does; a MATCH query would only
+        find whole, stemmed words, missing e.g. 'sql' in 'PostgreSQL'.
+
+        Args:
+            keys (iterable): Term keys, see JobScorer.term_keys
+
+        Returns:
+            set: Job ids, or None if a term cannot be looked for in SQL,
+                whose lower() only folds ASCII letters
+        """
+        clauses, args = [], []
+        for key in keys:
+            column, term = TERM_COLUMNS.get(key[:2]), key[2:]
+            if column is None or not term.isascii():
+                return None
+            clauses.append(f'instr(lower({column}), ?)')
+            args.append(term)
+        if not clauses:
+            return set()
+        rows = self._connect().execute(
+            "SELECT jobs.id FROM jobs_fts JOIN jobs ON jobs.rowid = jobs_fts.rowid "
+            f"WHERE {' OR '.join(clauses)}", args
+        )
+        return {row[0] for row in rows}
+
+    def scoring_fields(self, job_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Return the fields JobScorer.vector() reads for stored jobs, without
+        decoding the rest of each job.
+
+        Args:
+            job_ids (iterable): Job ids; ids not stored are left out
+
+        Returns:
+            dict: Job id -> title, description, location, salary_min,
+                salary_max and posted_at
+        """
+        job_ids = list(job_ids)
+        jobs = {}
+        conn = self._connect()
+        # Stay below SQLite's limit on bound parameters
+        for i in range(0, len(job_ids), 500):
+            chunk = job_ids[i:i + 500]
+            rows = conn.execute(
+                "SELECT id, title, location, posted_at, "
+                "json_extract(data, '$.description') AS description, "
+                "json_extract(data, '$.salary_min') AS salary_min, "
+                "json_extract(data, '$.salary_max') AS salary_max "
+                f"FROM jobs WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+            )
+            for row in rows:
+                job = dict(row)
+                jobs[job.pop('id')] = job
+        return jobs
+
+    def set_scores(self, scores: Iterable[Tuple[str, float]], scoring_key: str = None,
+                   profile: str = None) -> int:
+        """
+        Update the score of stored jobs in place.
+
+        The default profile's scores are written to the score column only;
+        reads take the score from it rather than from the stored job dict.
+        Other profiles' scores go to the profile_scores table.
+
+        Args:
+            scores (iterable): (job id, score) pairs
+            scoring_key (str, optional): JobScorer.scoring_key every stored
+                score of the profile now agrees with, see scored_with()
+            profile (str, optional): Profile the scores are for, defaults
+                to the default profile
+
+        Returns:
+            int: Number of jobs updated
+        """
+        profile = profile or PROFILE_CONFIG['default']
+        default = profile == PROFILE_CONFIG['default']
+        rows = [(score, job_id) for job_id, score in scores]
+        bulk = default and len(rows) > BULK_SCORES
+        conn = self._connect()
+        with conn:
+            if bulk:
+                for name in SCORE_INDEXES:
+                    conn.execute(f'DROP INDEX IF EXISTS {name}')
+            if default:
+                conn.executemany('UPDATE jobs SET score = ? WHERE id = ?', rows)
+            else:
+                conn.executemany('INSERT OR REPLACE INTO profile_scores (profile, id, score) '
+                                 'VALUES (?, ?, ?)', [(profile, job_id, score) for score, job_id in rows])
+            if bulk:
+                for statement in SCORE_INDEXES.values():
+                    conn.execute(statement)
+            if scoring_key is not None:
+                self._set_scored_with(conn, {**self.scored_with(), profile: scoring_key})
+            if rows:
+                self._touch(conn, datetime.now().isoformat())
+        return len(rows)
+
+    def scores(self, profile: str = None) -> Dict[str, float]:
+        """
+        Return the stored scores of a profile.
+
+        Args:
+            profile (str, optional): Profile the scores are for, defaults
+                to the default profile
+
+        Returns:
+            dict: Job id -> score, for the jobs scored for the profile
+        """
+        profile = profile or PROFILE_CONFIG['default']
+        cursor = self._connect().cursor()
+        cursor.row_factory = None
+        if profile == PROFILE_CONFIG['default']:
+            rows = cursor.execute('SELECT id, score FROM jobs WHERE score IS NOT NULL')
+        else:
+            rows = cursor.execute('SELECT id, score FROM profile_scores WHERE profile = ?', (profile,))
+        return dict(rows)
+
+    def scored_with(self) -> Dict[str, str]:
+        """Return profile name -> scoring key of the last full rescore of each profile."""
+        row = self._connect().execute(
+            "SELECT value FROM meta WHERE key = 'scored_with'"
+        ).fetchone()
+        try:
+            scored_with = json.loads(row['value']) if row else {}
+        except ValueError:
+            return {}
+        return scored_with if isinstance(scored_with, dict) else {}
+
+    def _set_scored_with(self, conn: sqlite3.Connection, scored_with: Dict[str, str]) -> None:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('scored_with', ?)",
+                     (json.dumps(scored_with, sort_keys=True),))
+
+    def retain_profiles(self, names: Iterable[str]) -> int:
+        """
+        Delete the scores of profiles other than the given ones.
+
+        Args:
+            names (iterable): Profiles to keep
+
+        Returns:
+            int: Number of scores deleted
+        """
+        names = set(names)
+        conn = self._connect()
+        with conn:
+            stale = [row[0] for row in conn.execute('SELECT DISTINCT profile FROM profile_scores')
+                     if row[0] not in names]
+            deleted = 0
+            for profile in stale:
+                deleted += conn.execute('DELETE FROM profile_scores WHERE profile = ?',
+                                        (profile,)).rowcount
+            scored_with = self.scored_with()
+            if set(scored_with) - names:
+                self._set_scored_with(conn, {name: key for name, key in scored_with.items()
+                                             if name in names})
+            if deleted:
+                self._touch(conn, datetime.now().isoformat())
+        return deleted
+
+    def _index_pending(self, conn: sqlite3.Connection) -> None:
+        """Index the text of jobs queued by the jobs_fts triggers, replacing their old entries."""
+        conn.execute('DELETE FROM jobs_fts WHERE rowid IN (SELECT rowid FROM jobs_fts_pending)')
+        conn.execute(
+            "INSERT INTO jobs_fts (rowid, title, company, description) "
+            "SELECT jobs.rowid, jobs.title, jobs.company, json_extract(jobs.data, '$.description') "
+            "FROM jobs_fts_pending JOIN jobs ON jobs.rowid = jobs_fts_pending.rowid"
+        )
+        conn.execute('DELETE FROM jobs_fts_pending')
+
+    def _touch(self, conn: sqlite3.Connection, now: str) -> None:
+        """Record a write: index changed job text, update last_updated and bump the version counter."""
+        self._index_pending(conn)
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_updated', ?)", (now,)
+        )
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('version', 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + 1"
+        )
+
+    def add_sources(self, job_id: str, sources: Iterable[Dict]) -> bool:
+        """
+        Append source records to a stored job's 'sources' list.
+
+        Used to fold near-duplicate postings into their canonical job.
+
+        Args:
+            job_id (str): Canonical job id
+            sources (iterable): {'source', 'url'} records; ones already listed are skipped
+
+        Returns:
+            bool: True if the job was found and gained a source
+        """
+        conn = self._connect()
+        with conn:
+            row = conn.execute('SELECT data, score FROM jobs WHERE id = ?', (job_id,)).fetchone()
+            if row is None:
+                return False
+            job = _job(row)
+            known = job.setdefault('sources', [{'source': job.get('source') or '',
+                                                'url': job.get('url') or ''}])
+            added = False
+            for source in sources:
+                if source not in known:
+                    known.append(source)
+                    added = True
+            if not added:
+                return False
+            now = datetime.now().isoformat()
+            conn.execute('UPDATE jobs SET data = ?, updated_at = ? WHERE id = ?',
+                         (json.dumps(job), now, job_id))
+            self._touch(conn, now)
+        return True
+
+    def _where(self, source: str = None, company: str = None, location: str = None,
+               min_score: float = None, table: str = None) -> Tuple[str, list]:
+        prefix = f'{table}.' if table else ''
+        clauses, args = [], []
+        if source:
+            clauses.append(f'{prefix}source = ?')
+            args.append(source)
+        if company:
+            clauses.append(f'{prefix}company = ?')
+            args.append(company)
+        if location:
+            clauses.append(f'{prefix}location LIKE ?')
+            args.append(f'%{location}%')
+        if min_score is not None:
+            clauses.append(f'{prefix}score >= ?')
+            args.append(min_score)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', args
+
+    def query(self, source: str = None, company: str = None, location: str = None,
+              min_score: float = None, order_by: str = 'score',
+              limit: Optional[int] = None, offset: int = 0, profile: str = None) -> List[Dict]:
+        """
+        Query stored jobs.
+
+        Args:
+            source (str, optional): Exact job board name, e.g. 'Indeed'
+            company (str, optional): Exact company name
+            location (str, optional): Substring of the location
+            min_score (float, optional): Minimum relevance score
+            order_by (str): 'score', 'date_posted' or 'date_found'
+            limit (int, optional): Max jobs to return, all if None
+            offset (int): Number of jobs to skip
+            profile (str, optional): Profile whose scores are returned and
+                filtered on, defaults to the default profile; jobs not yet
+                scored for the profile are left out
+
+        Returns:
+            list: Job dictionaries
+        """
+        table, args = _jobs_table(profile)
+        where, where_args = self._where(source, company, location, min_score)
+        args += where_args
+        sql = f"SELECT data, score FROM {table}{where} ORDER BY {ORDER_BY[order_by]}"
+        if limit is not None:
+            sql += ' LIMIT ? OFFSET ?'
+            args += [limit, offset]
+        rows = self._connect().execute(sql, args).fetchall()
+        return [_job(row) for row in rows]
+
+    def search(self, text: str, limit: int = 20, offset: int = 0, profile: str = None,
+               **filters) -> List[Dict]:
+        """
+        Find jobs by words in their title, company or description.
+
+        Every match is ranked in SQL by a blend of its BM25 text match,
+        relative to the best match, and its relevance score, weighted by
+        SEARCH_CONFIG['score_weight']. Only the returned page of jobs is
+        decoded. The cost grows with the number of matches: a few ms for
+        words in a few thousand jobs, a few hundred for words in most of
+        100,000.
+
+        Args:
+            text (str): Words to find, all of them; see fts_query()
+            limit (int): Max jobs to return
+            offset (int): Number of ranked jobs to skip
+            profile (str, optional): Profile whose relevance scores are
+                blended in and returned, defaults to the default profile
+            **filters: source, company, location and min_score, as for query()
+
+        Returns:
+            list: Job dictionaries, best first, with their 'text_match'
+                (0 to 1) and the blended 'search_score'
+        """
+        match = fts_query(text)
+        if not match:
+            return []
+        table, args = _jobs_table(profile)
+        where, where_args = self._where(table='j', **filters)
+        where = where.replace(' WHERE ', ' AND ', 1)
+        weights = SEARCH_CONFIG['column_weights']
+        conn = self._connect()
+        score_weight = SEARCH_CONFIG['score_weight']
+        # BM25 is negative, lower is better; the best match has a text_match of 1
+        ranked = conn.execute(
+            "SELECT rowid, text_match, (1 - ?) * text_match + ? * score AS search_score FROM ("
+            "SELECT rowid, score, coalesce(weight / nullif(min(weight) OVER (), 0), 1.0) AS text_match "
+            "FROM (SELECT j.rowid AS rowid, coalesce(j.score, 0.0) AS score, "
+            "bm25(jobs_fts, ?, ?, ?) AS weight "
+            f"FROM jobs_fts JOIN {table} AS j ON j.rowid = jobs_fts.rowid "
+            f"WHERE jobs_fts MATCH ?{where})) "
+            "ORDER BY search_score DESC, rowid LIMIT ? OFFSET ?",
+            [score_weight, score_weight, weights['title'], weights['company'], weights['description']]
+            + args + [match] + where_args + [limit, offset]
+        ).fetchall()
+        if not ranked:
+            return []
+
+        rowids = [row['rowid'] for row in ranked]
+        found = {row['rowid']: _job(row) for row in conn.execute(
+            f"SELECT j.rowid, j.data, j.score FROM {table} AS j "
+            f"WHERE j.rowid IN ({', '.join('?' * len(rowids))})", args + rowids)}
+        jobs = []
+        for row in ranked:
+            job = found[row['rowid']]
+            job['text_match'] = row['text_match']
+            job['search_score'] = row['search_score']
+            jobs.append(job)
+        return jobs
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Return a single job by id, or None."""
+        row = self._connect().execute(
+            'SELECT data, score FROM jobs WHERE id = ?', (job_id,)
+        ).fetchone()
+        return _job(row) if row else None
+
+    def count(self, profile: str = None, **filters) -> int:
+        """Count stored jobs matching the same filters and profile as query()."""
+        table, args = _jobs_table(profile)
+        where, where_args = self._where(**filters)
+        return self._connect().execute(f'SELECT COUNT(*) FROM {table}{where}',
+                                       args + where_args).fetchone()[0]
+
+    def last_updated(self) -> Optional[datetime]:
+        """Return when jobs were last written, or None if never."""
+        row = self._connect().execute(
+            "SELECT value FROM meta WHERE key = 'last_updated'"
+        ).fetchone()
+        return datetime.fromisoformat(row['value']) if row else None
+
+    def version(self) -> int:
+        """
+        Return a counter bumped by every write, including from other processes.
+
+        Cheap enough to check per request, so caches built from the store can
+        tell when they are stale.
+        """
+        row = self._connect().execute(
+            "SELECT value FROM meta WHERE key = 'version'"
+        ).fetchone()
+        return int(row['value']) if row else 0
+
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """
+        Take or renew a named lease shared by every process using the store.
+
+        The lease is a meta row holding its owner and expiry time. It is
+        granted when nobody holds it, when it expired, or when owner already
+        holds it, in which case it is extended.
+
+        Args:
+            name (str): Lease name
+            owner (str): Identifier unique to the caller across processes
+            ttl (float): Seconds until the lease expires unless renewed
+
+        Returns:
+            bool: True if owner now holds the lease
+        """
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value "
+                "WHERE json_extract(meta.value, '$.owner') = ? "
+                "OR json_extract(meta.value, '$.expires') < ?",
+                (f'lease:{name}', json.dumps({'owner': owner, 'expires': now + ttl}), owner, now)
+            )
+        return cursor.rowcount > 0
+
+    def release_lease(self, name: str, owner: str) -> None:
+        """Give up a lease taken with acquire_lease(), if owner still holds it."""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM meta WHERE key = ? AND json_extract(value, '$.owner') = ?",
+                         (f'lease:{name}', owner))
+
+    def add_run(self, summary: Dict) -> None:
+        """
+        Record a scrape run summary. Runs do not change the jobs, so the
+        version counter is left alone.
+
+        Args:
+            summary (dict): Run summary with 'started_at' and 'finished_at'
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT INTO runs (started_at, finished_at, summary) VALUES (?, ?, ?)",
+                (summary.get('started_at'), summary.get('finished_at'), json.dumps(summary))
+            )
+
+    def metrics(self) -> Dict:
+        """Return the scrape metrics totals saved by every process, see ScrapeMetrics.save()."""
+        row = self._connect().execute("SELECT value FROM meta WHERE key = 'metrics'").fetchone()
+        try:
+            totals = json.loads(row['value']) if row else {}
+        except ValueError:
+            return {}
+        return totals if isinstance(totals, dict) else {}
+
+    def add_metrics(self, delta: Dict) -> None:
+        """
+        Add observations to the scrape metrics totals shared by every process.
+
+        Like runs, this does not change the jobs, so the version counter is
+        left alone.
+
+        Args:
+            delta (dict): Observations since the last save, as from ScrapeMetrics.state()
+        """
+        conn = self._connect()
+        with conn:
+            # Read and write the totals without another process writing in between
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('metrics', ?)",
+                         (json.dumps(add_states(self.metrics(), delta)),))
+
+    def runs(self, limit: int = 20) -> List[Dict]:
+        """
+        Get the most recent scrape run summaries, newest first.
+
+        Args:
+            limit (int): Maximum number of runs to return
+
+        Returns:
+            list: Run summary dictionaries
+        """
+        rows = self._connect().execute(
+            "SELECT summary FROM runs ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [json.loads(row['summary']) for row in rows]
+
+    def export_json(self, path: str, run: Dict = None) -> None:
+        """
+        Write every stored job to a JSON file in the legacy jobs.json shape.
+
+        Args:
+            path (str): Output file
+            run (dict, optional): Summary of the run that produced the
+                export, written under 'run'
+        """
+        jobs = self.query()
+        export = {
+            'jobs': jobs,
+            'timestamp': datetime.now().isoformat(),
+            'total_jobs': len(jobs)
+        }
+        if run is not None:
+            export['run'] = run
+        with open(path, 'w') as f:
+            json.dump(export, f, indent=2)
+        logger.info("Exported %d jobs to %s", len(jobs), path)
+
+    def import_json(self, path: str) -> int:
+        """
+        Load jobs from a legacy jobs.json file.
+
+        Args:
+            path (str): Input file
+
+        Returns:
+            int: Number of jobs imported
+        """
+        with open(path, 'r') as f:
+            jobs = json.load(f).get('jobs', [])
+        for job in jobs:
+            job.setdefault('id', job_fingerprint(job))
+            if 'posted_at' not in job:
+                add_features(job)
+        return self.upsert_jobs(jobs)
@@ -0,0 +1,256 @@
+"""
+Precompiled extraction of salary, posting date, experience and skills.
+Every pattern is compiled once at import or construction, and each
+description is lowercased a single time no matter how many fields are
+pulled from it.
+"""
+
+import re
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+# A number such as 95,000, 45.50 or 120, with an optional K suffix of its own
+_AMOUNT = r'(\d{1,3}(?:,\d{3})+(?:\.\d{1,2})?|\d+(?:\.\d{1,2})?)([kK](?![A-Za-z]))?'
+_TO = r'\s*(?:-|–|—|to)\s*'
+_PERIOD = r'(?:\s*(?:/|per\b|an?\b)\s*(hour|hr|month|mo|year|yr|annum|annual)\b)?'
+
+# Each pattern is paired with a literal it cannot match without; a substring
+# test on the lowercased text skips the regex scan for most descriptions.
+# Groups are (low, low K, high, high K, period); single amounts have no high.
+
+# (pattern, literal, needs a $) tried in order; the first salary found wins
+SALARY_PATTERNS = [
+    (re.compile(r'\$' + _AMOUNT + _TO + r'\$?' + _AMOUNT + _PERIOD, re.IGNORECASE), '$', True),  # $50,000 - $70,000
+    (re.compile(r'\$' + _AMOUNT + r'()()' + _PERIOD, re.IGNORECASE), '$', True),  # $95,000/yr
+    # 120K - 150K and 130K without a $; 401k plans are not pay
+    (re.compile(r'(?<![\w$.,])(?!401k)(\d{2,3})(k)' + _TO + r'(\d{2,3})(k)(?![a-z])' + _PERIOD,
+                re.IGNORECASE), 'k', False),
+    (re.compile(r'(?<![\w$.,])(?!401k)(\d{2,3})(k)(?![a-z])()()' + _PERIOD, re.IGNORECASE), 'k', False),
+]
+
+# Pay periods per year, for annualizing hourly and monthly pay
+HOURS_PER_YEAR = 2080
+PERIODS_PER_YEAR = {'hour': HOURS_PER_YEAR, 'hr': HOURS_PER_YEAR, 'month': 12, 'mo': 12}
+
+# Annual amounts below this are bonuses, fees or stipends rather than pay
+MIN_ANNUAL_SALARY = 10000
+
+# (pattern, literal, timedelta unit, multiplier) tried in order against
+# lowercased text; patterns without a number count as that many units ago
+DATE_PATTERNS = [
+    (re.compile(r'(\d+)\s*hours?\s*ago'), 'ago', 'hours', 1),
+    (re.compile(r'(\d+)\s*days?\s*ago'), 'ago', 'days', 1),
+    (re.compile(r'(\d+)\s*weeks?\s*ago'), 'ago', 'weeks', 1),
+    (re.compile(r'(\d+)\s*months?\s*ago'), 'ago', 'days', 30),
+    (re.compile(r'today'), 'today', 'days', 0),
+    (re.compile(r'yesterday'), 'yesterday', 'days', 1),
+    (re.compile(r'just\s*posted'), 'posted', 'days', 0),
+]
+
+# Tried in order against lowercased text
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*-\s*(\d+)\+?\s*years?(?:\s+of)?\s+experience'),  # 5-7 years experience
+    re.compile(r'(\d+)\+?\s*years?(?:\s+of)?\s+experience'),  # 5+ years experience
+    re.compile(r'minimum\s+(?:of\s+)?(\d+)\s+years?(?:\s+of)?\s+experience'),  # minimum of 5 years experience
+]
+
+
+def _amount(number: str, thousands: str) -> float:
+    amount = float(number.replace(',', ''))
+    return amount * 1000 if thousands else amount
+
+
+def _annual_salary(match: re.Match) -> Optional[Dict[str, float]]:
+    """The yearly range a salary match stands for, or None if it is not pay."""
+    low_number, low_k, high_number, high_k, period = match.groups()
+    low = _amount(low_number, low_k)
+    if high_number:
+        high = _amount(high_number, high_k)
+        if high_k and not low_k and low < 1000:
+            low *= 1000  # $120 - $150K
+    else:
+        high = None
+    period = (period or '').lower()
+    if period in PERIODS_PER_YEAR:
+        per_year = PERIODS_PER_YEAR[period]
+    elif high is not None and high < 1000:
+        per_year = HOURS_PER_YEAR  # $45 - $60 with no period is hourly pay
+    else:
+        per_year = 1
+    if high is None:
+        if per_year == 1 and low < 1000:
+            return None  # a small amount on its own, not a salary
+        high = low = low * per_year
+        low, high = low * 0.9, high * 1.1  # Estimate range
+    else:
+        low, high = low * per_year, high * per_year
+    if high < MIN_ANNUAL_SALARY or low > high:
+        return None
+    return {'min': low, 'max': high}
+
+
+def salary_from(text: str, lowered: str, free_text: bool = False) -> Optional[Dict[str, float]]:
+    """
+    Extract a yearly salary range, see helpers.extract_salary.
+
+    A K suffix multiplies only the number it follows. Hourly and monthly pay
+    is annualized, and so are ranges below 1,000 without a stated period.
+    A single amount is widened by 10% either way.
+
+    Args:
+        text (str): Original text
+        lowered (str): The same text lowercased
+        free_text (bool): True for descriptions, where only amounts with a $
+            are read, since "401k" or "10k users" is not pay
+
+    Returns:
+        dict: Dictionary with min and max salary, or None if no salary found
+    """
+    for pattern, literal, dollar in SALARY_PATTERNS:
+        if literal not in lowered or (free_text and not dollar):
+            continue
+        for match in pattern.finditer(text):
+            salary = _annual_salary(match)
+            if salary:
+                return salary
+    return None
+
+
+def date_from(lowered: str, now: datetime = None) -> Optional[datetime]:
+    """
+    Parse a relative posting date, see helpers.parse_date_posted.
+
+    Args:
+        lowered (str): Lowercased text containing date information
+        now (datetime, optional): Reference time, defaults to now
+
+    Returns:
+        datetime: Parsed date, or None if parsing fails
+    """
+    for pattern, literal, unit, multiplier in DATE_PATTERNS:
+        if literal not in lowered:
+            continue
+        match = pattern.search(lowered)
+        if match:
+            now = now or datetime.now()
+            amount = int(match.group(1)) if pattern.groups else 1
+            return now - timedelta(**{unit: amount * multiplier})
+    return None
+
+
+def experience_from(lowered: str) -> Optional[Dict[str, int]]:
+    """
+    Extract a years-of-experience range, see helpers.calculate_experience_years.
+
+    Args:
+        lowered (str): Lowercased job description text
+
+    Returns:
+        dict: Dictionary with min and max years, or None if not found
+    """
+    if 'experience' not in lowered:
+        return None
+    for pattern in EXPERIENCE_PATTERNS:
+        match = pattern.search(lowered)
+        if match:
+            groups = match.groups()
+            if len(groups) == 2:  # Range found
+                return {'min': int(groups[0]), 'max': int(groups[1])}
+            years = int(groups[0])
+            return {'min': years, 'max': years + 3}
+    return None
+
+
+class SkillMatcher:
+    """
+    Finds skills from a fixed list with one combined regex.
+
+    All skills share a single alternation, longest first, inside a
+    lookahead so matches may overlap. A skill that is a prefix of a longer
+    one can hide behind it at the same offset, so those few are re-checked
+    with their own pattern when needed. Results equal running the
+    per-skill pattern `\\bskill(?:ing|ed|s)?\\b` for every skill.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        """
+        Args:
+            skills (iterable): Skills to look for; duplicates are kept in results
+        """
+        self.skills = tuple(skills)
+        lowered = sorted({skill.lower() for skill in self.skills}, key=len, reverse=True)
+        self._pattern = None
+        if lowered:
+            self._pattern = re.compile(
+                r'(?=\b(' + '|'.join(map(re.escape, lowered)) + r')(?:ing|ed|s)?\b)')
+        self._shadowed = {
+            short: re.compile(r'\b' + re.escape(short) + r'(?:ing|ed|s)?\b')
+            for short in lowered
+            if any(long != short and long.startswith(short) for long in lowered)
+        }
+
+    def find(self, lowered: str) -> List[str]:
+        """Return the configured skills occurring in lowercased text, in list order."""
+        if self._pattern is None:
+            return []
+        found = set(self._pattern.findall(lowered))
+        for short, pattern in self._shadowed.items():
+            if short not in found and pattern.search(lowered):
+                found.add(short)
+        return [skill for skill in self.skills if skill.lower() in found]
+
+
+class Extraction(NamedTuple):
+    """Fields extracted from one description."""
+    salary: Optional[Dict[str, float]]
+    date_posted: Optional[datetime]
+    experience: Optional[Dict[str, int]]
+    skills: List[str]
+
+
+class DescriptionExtractor:
+    """
+    Pulls salary, posting date, experience and skills out of descriptions.
+    """
+
+    def __init__(self, skills: Sequence[str] = ()):
+        """
+        Args:
+            skills (list, optional): Skills reported by extract()
+        """
+        self.skill_matcher = SkillMatcher(skills)
+
+    def extract(self, text: str, now: datetime = None) -> Extraction:
+        """
+        Extract every field from one description.
+
+        Args:
+            text (str): Description text
+            now (datetime, optional): Reference time for relative dates
+
+        Returns:
+            Extraction: Fields found, None or empty where absent
+        """
+        lowered = text.lower()
+        return Extraction(
+            salary_from(text, lowered, free_text=True),
+            date_from(lowered, now),
+            experience_from(lowered),
+            self.skill_matcher.find(lowered),
+        )
+
+    def extract_batch(self, texts: Iterable[str]) -> List[Extraction]:
+        """
+        Extract every field from many descriptions.
+
+        Relative dates in the whole batch share one reference time.
+
+        Args:
+            texts (iterable): Description texts
+
+        Returns:
+            list: One Extraction per text, in input order
+        """
+        now = datetime.now()
+        extract = self.extract
+        return [extract(text, now) for text in texts]
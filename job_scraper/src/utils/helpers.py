@@ -2,12 +2,16 @@
 Helper functions for the job scraper.
 """
 
+import hashlib
 import random
 import time
+from functools import lru_cache
 from typing import Dict, Any, Optional
 import re
-from datetime import datetime, timedelta
-from fake_useragent import UserAgent
+from datetime import datetime
+
+from .extraction import SkillMatcher, date_from, experience_from, salary_from
+from .user_agents import user_agents
 
 def get_random_user_agent() -> str:
     """
@@ -16,17 +20,7 @@ def get_random_user_agent() -> str:
     Returns:
         str: Random user agent string
     """
-    try:
-        ua = UserAgent()
-        return ua.random
-    except:
-        # Fallback user agents if fake-useragent fails
-        default_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0'
-        ]
-        return random.choice(default_agents)
+    return user_agents().random
 
 def sleep_with_jitter(base_delay: float = 2.0, jitter: float = 1.0) -> None:
     """
@@ -49,28 +43,7 @@ def extract_salary(text: str) -> Optional[Dict[str, float]]:
     Returns:
         dict: Dictionary with min and max salary, or None if no salary found
     """
-    # Common salary patterns
-    patterns = [
-        r'\$(\d{2,3}(?:,\d{3})*(?:\.\d{2})?)\s*-\s*\$(\d{2,3}(?:,\d{3})*(?:\.\d{2})?)',  # $50,000 - $70,000
-        r'\$(\d{2,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:to|–)\s*\$(\d{2,3}(?:,\d{3})*(?:\.\d{2})?)',  # $50,000 to $70,000
-        r'\$(\d{2,3}(?:,\d{3})*(?:\.\d{2})?)/(?:yr|year|annual)',  # $50,000/yr
-        r'(\d{2,3}(?:,\d{3})*(?:\.\d{2})?)[Kk]',  # 50K
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            groups = match.groups()
-            if len(groups) == 2:  # Range found
-                min_salary = float(groups[0].replace(',', ''))
-                max_salary = float(groups[1].replace(',', ''))
-                return {'min': min_salary, 'max': max_salary}
-            elif len(groups) == 1:  # Single value found
-                salary = float(groups[0].replace(',', ''))
-                if 'k' in text.lower():
-                    salary *= 1000
-                return {'min': salary * 0.9, 'max': salary * 1.1}  # Estimate range
-    return None
+    return salary_from(text, text.lower())
 
 def parse_date_posted(text: str) -> Optional[datetime]:
     """
@@ -82,27 +55,7 @@ def parse_date_posted(text: str) -> Optional[datetime]:
     Returns:
         datetime: Parsed date, or None if parsing fails
     """
-    now = datetime.now()
-    
-    # Common patterns
-    patterns = {
-        r'(\d+)\s*hours?\s*ago': lambda x: now - timedelta(hours=int(x)),
-        r'(\d+)\s*days?\s*ago': lambda x: now - timedelta(days=int(x)),
-        r'(\d+)\s*weeks?\s*ago': lambda x: now - timedelta(weeks=int(x)),
-        r'(\d+)\s*months?\s*ago': lambda x: now - timedelta(days=int(x)*30),
-        r'today': lambda x: now,
-        r'yesterday': lambda x: now - timedelta(days=1),
-        r'just\s*posted': lambda x: now,
-    }
-    
-    text = text.lower()
-    for pattern, date_func in patterns.items():
-        match = re.search(pattern, text)
-        if match:
-            groups = match.groups()
-            return date_func(groups[0] if groups else None)
-    
-    return None
+    return date_from(text.lower())
 
 def clean_job_title(title: str) -> str:
     """
@@ -132,6 +85,43 @@ def clean_job_title(title: str) -> str:
     words = [replacements.get(word, word) for word in words]
     return ' '.join(words).title()
 
+def job_fingerprint(job: Dict[str, Any]) -> str:
+    """
+    Build a stable identity for a job posting.
+    
+    Prefers the board's own job id, then the posting URL, then a hash of the
+    normalized title, company and location.
+    
+    Args:
+        job (dict): Job posting information
+        
+    Returns:
+        str: Fingerprint such as 'indeed:abc123' or 'hash:<sha1>'
+    """
+    source = (job.get('source') or '').lower()
+    if job.get('job_id'):
+        return f"{source}:{job['job_id']}"
+    if job.get('url'):
+        return f"url:{job['url']}"
+    key = '|'.join([
+        clean_job_title(job.get('title', '')).lower(),
+        ' '.join(job.get('company', '').lower().split()),
+        ' '.join(job.get('location', '').lower().split()),
+    ])
+    return 'hash:' + hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+def content_hash(text: str) -> str:
+    """
+    Hash posting content to detect changes between scrapes.
+    
+    Args:
+        text (str): Posting text
+        
+    Returns:
+        str: Short hex digest
+    """
+    return hashlib.sha1(' '.join(text.split()).encode('utf-8')).hexdigest()[:16]
+
 def calculate_experience_years(text: str) -> Optional[Dict[str, int]]:
     """
     Extract years of experience requirement from text.
@@ -142,22 +132,12 @@ def calculate_experience_years(text: str) -> Optional[Dict[str, int]]:
     Returns:
         dict: Dictionary with min and max years, or None if not found
     """
-    patterns = [
-        r'(\d+)\+?\s*-\s*(\d+)\+?\s*years?(?:\s+of)?\s+experience',  # 5-7 years experience
-        r'(\d+)\+?\s*years?(?:\s+of)?\s+experience',  # 5+ years experience
-        r'minimum\s+(?:of\s+)?(\d+)\s+years?(?:\s+of)?\s+experience',  # minimum of 5 years experience
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text.lower())
-        if match:
-            groups = match.groups()
-            if len(groups) == 2:  # Range found
-                return {'min': int(groups[0]), 'max': int(groups[1])}
-            elif len(groups) == 1:  # Single value found
-                years = int(groups[0])
-                return {'min': years, 'max': years + 3}
-    return None
+    return experience_from(text.lower())
+
+@lru_cache(maxsize=32)
+def _skill_matcher(skills: tuple) -> SkillMatcher:
+    # Callers pass the same few skill lists over and over
+    return SkillMatcher(skills)
 
 def extract_skills(text: str, skill_list: list) -> list:
     """
@@ -170,16 +150,7 @@ def extract_skills(text: str, skill_list: list) -> list:
     Returns:
         list: List of found skills
     """
-    found_skills = []
-    text = text.lower()
-    
-    for skill in skill_list:
-        # Create pattern that handles variations
-        pattern = r'\b' + re.escape(skill.lower()) + r'(?:ing|ed|s)?\b'
-        if re.search(pattern, text):
-            found_skills.append(skill)
-    
-    return found_skills
+    return _skill_matcher(tuple(skill_list)).find(text.lower())
 
 def format_salary(salary_dict: Dict[str, float]) -> str:
     """
@@ -0,0 +1,61 @@
+"""
+User agent strings for outgoing requests.
+A fixed list of current desktop browser agents ships with the package, so
+picking one never reads a data file or touches the network.
+"""
+
+import random
+import threading
+from typing import Optional, Sequence
+
+BUNDLED_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 Edg/124.0.0.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:124.0) Gecko/20100101 Firefox/124.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4.1 Safari/605.1.15',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.3 Safari/605.1.15',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 14.4; rv:125.0) Gecko/20100101 Firefox/125.0',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0',
+    'Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:124.0) Gecko/20100101 Firefox/124.0',
+)
+
+
+class UserAgentProvider:
+    """
+    Picks random user agents from a fixed list.
+
+    Exposes `random` as a property like fake_useragent.UserAgent, so it can
+    stand in wherever one was used.
+    """
+
+    def __init__(self, agents: Sequence[str] = BUNDLED_USER_AGENTS):
+        """
+        Args:
+            agents (list, optional): User agent strings, defaults to the bundled list
+        """
+        if not agents:
+            raise ValueError("at least one user agent is required")
+        self.agents = tuple(agents)
+
+    @property
+    def random(self) -> str:
+        """A randomly chosen user agent string."""
+        return random.choice(self.agents)
+
+
+_provider: Optional[UserAgentProvider] = None
+_provider_lock = threading.Lock()
+
+
+def user_agents() -> UserAgentProvider:
+    """Return the shared provider, creating it on first use."""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = UserAgentProvider()
+    return _provider
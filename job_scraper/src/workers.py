@@ -0,0 +1,146 @@
+"""
+Process-pool parsing and scoring for large scrape batches.
+Pages are parsed and scored in worker processes so CPU-bound work is not
+serialized by the GIL; the main process only reads pages and persists jobs.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin
+
+from .config import PIPELINE_CONFIG
+from .features import add_features, is_stale
+from .parsers import get_parsers
+from .scoring import JobScorer
+from .utils.helpers import content_hash, job_fingerprint
+
+
+class Page(NamedTuple):
+    """A downloaded or archived search result page."""
+    source: str
+    url: str
+    html: str
+
+
+class ParsedJob(NamedTuple):
+    """A parsed and scored job with the content hash of its card."""
+    digest: str
+    job: Dict
+
+
+# Parsers and scorer built once per worker process by init_worker
+_worker_state = {}
+
+
+def init_worker(parser_backends: Dict[str, str] = None) -> None:
+    """
+    Build the parsers and scorer a worker process reuses for every page.
+
+    Args:
+        parser_backends (dict, optional): Backend per board, defaults to PARSER_CONFIG
+    """
+    _worker_state['parsers'] = get_parsers(parser_backends)
+    _worker_state['scorer'] = JobScorer()
+
+
+def parse_and_score(page: Page) -> List[ParsedJob]:
+    """
+    Parse every job card on a page and score it.
+
+    Runs in a worker process; the HTML never travels back to the parent.
+    Jobs older than MAX_JOB_AGE are dropped before scoring.
+
+    Args:
+        page (Page): Page to process
+
+    Returns:
+        list: ParsedJob entries for every well-formed card that is not stale
+    """
+    if not _worker_state:
+        init_worker()
+    parser = _worker_state['parsers'].get(page.source)
+    if parser is None:
+        return []
+    scorer = _worker_state['scorer']
+
+    results = []
+    for card in parser.iter_cards(page.html):
+        job = parser.parse_card(card)
+        if not job:
+            continue
+        if job.get('url'):
+            job['url'] = urljoin(page.url, job['url'])
+        job['id'] = job_fingerprint(job)
+        if is_stale(add_features(job)):
+            continue
+        job['score'] = scorer.score(job)
+        results.append(ParsedJob(content_hash(parser.card_content(card)), job))
+    return results
+
+
+class ParsePool:
+    """
+    Parses and scores pages on a pool of worker processes.
+    """
+
+    def __init__(self, workers: int = None, parser_backends: Dict[str, str] = None):
+        """
+        Args:
+            workers (int, optional): Worker processes, defaults to
+                PIPELINE_CONFIG['process_workers'] or the CPU count
+            parser_backends (dict, optional): Backend per board
+        """
+        self.workers = workers or PIPELINE_CONFIG['process_workers'] or os.cpu_count() or 1
+        self.parser_backends = parser_backends
+
+    def map_pages(self, pages: Iterable[Page]) -> Iterator[Tuple[Page, List[ParsedJob]]]:
+        """
+        Process pages on the pool, yielding results in completion order.
+
+        At most a few pages per worker are in flight, so an arbitrarily long
+        page iterator is consumed lazily and memory stays bounded.
+
+        Args:
+            pages (iterable): Pages to parse and score
+
+        Yields:
+            tuple: (Page with its HTML dropped, ParsedJob list)
+        """
+        max_in_flight = self.workers * PIPELINE_CONFIG['pages_per_worker']
+        pages = iter(pages)
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                 initargs=(self.parser_backends,)) as executor:
+            in_flight = {}
+            exhausted = False
+            while in_flight or not exhausted:
+                while not exhausted and len(in_flight) < max_in_flight:
+                    page = next(pages, None)
+                    if page is None:
+                        exhausted = True
+                        break
+                    in_flight[executor.submit(parse_and_score, page)] = page._replace(html='')
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield in_flight.pop(future), future.result()
+
+
+def read_page_directory(directory: str, base_url: Optional[str] = None) -> Iterator[Page]:
+    """
+    Yield saved result pages named `<source>_<anything>.html` from a directory.
+
+    Args:
+        directory (str): Directory holding archived pages
+        base_url (str, optional): URL relative job links are resolved against
+
+    Yields:
+        Page: One page per matching file
+    """
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith('.html') or '_' not in name:
+            continue
+        source = name.split('_', 1)[0].lower()
+        with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+            yield Page(source, base_url or f'file://{os.path.abspath(directory)}/', f.read())
@@ -0,0 +1,38 @@
+"""
+Shared fixtures: an offline scraper working in a scratch directory and the
+local server replaying the saved job board pages (benchmarks/fixture_server).
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.config import CACHE_CONFIG, LOG_CONFIG, REQUEST_CONFIG  # noqa: E402
+
+# The logger is configured on import; keep its file out of the repository
+LOG_CONFIG.update(directory=tempfile.mkdtemp(prefix='job_scraper_tests_'), level='WARNING')
+
+from benchmarks.fixture_server import start_server  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def fixture_server():
+    """Base URL of the fixture server, shared by every test."""
+    server = start_server()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in a scratch directory without a response cache or politeness delays."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(CACHE_CONFIG, 'enabled', False)
+    monkeypatch.setitem(REQUEST_CONFIG, 'rate', 1e6)
+    monkeypatch.setitem(REQUEST_CONFIG, 'burst', 10 ** 6)
+    return tmp_path
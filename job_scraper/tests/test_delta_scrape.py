@@ -0,0 +1,79 @@
+"""
+Change detection between scrapes: which cards a refresh parses and saves again.
+"""
+
+import os
+import re
+
+import pytest
+
+from src.parsers.soup import SoupIndeedParser, SoupLinkedInParser
+from src.parsers.xpath import XPathIndeedParser, XPathLinkedInParser
+from src.scraper import JobScraper
+from src.utils.helpers import content_hash
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'fixtures')
+
+
+def fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name)) as f:
+        return f.read()
+
+
+def card_hashes(parser, html: str):
+    return [content_hash(parser.card_content(card)) for card in parser.iter_cards(html)]
+
+
+@pytest.mark.parametrize('parser_class', [XPathIndeedParser, SoupIndeedParser])
+def test_indeed_hash_ignores_the_relative_date(parser_class):
+    html = fixture('indeed_search.html')
+    a_day_later = re.sub(r'Posted (\d+) days ago', lambda m: f'Posted {int(m.group(1)) + 1} days ago', html)
+    assert a_day_later != html
+    assert card_hashes(parser_class(), a_day_later) == card_hashes(parser_class(), html)
+
+
+@pytest.mark.parametrize('parser_class', [XPathLinkedInParser, SoupLinkedInParser])
+def test_linkedin_hash_ignores_the_relative_date(parser_class):
+    html = fixture('linkedin_search.html')
+    a_week_later = html.replace('1 weeks ago', '2 weeks ago')
+    assert a_week_later != html
+    assert card_hashes(parser_class(), a_week_later) == card_hashes(parser_class(), html)
+
+
+def test_hash_changes_with_the_card_content():
+    parser = XPathIndeedParser()
+    html = fixture('indeed_search.html')
+    raised = card_hashes(parser, html.replace('$121,000 - $137,000', '$131,000 - $147,000'))
+    assert sum(a != b for a, b in zip(raised, card_hashes(parser, html))) == 1
+
+
+def test_both_backends_hash_cards_alike():
+    for name, xpath, soup in (('indeed', XPathIndeedParser, SoupIndeedParser),
+                              ('linkedin', XPathLinkedInParser, SoupLinkedInParser)):
+        html = fixture(f'{name}_search.html')
+        assert card_hashes(xpath(), html) == card_hashes(soup(), html)
+
+
+def indeed_scraper(base_url: str) -> JobScraper:
+    return JobScraper(base_urls={'indeed': f'{base_url}/indeed'}, use_mock=False, max_pages=1)
+
+
+def test_unchanged_cards_are_skipped_on_the_next_run(fixture_server, workdir):
+    assert indeed_scraper(fixture_server).scrape_jobs()
+    assert indeed_scraper(fixture_server).scrape_jobs() == []
+
+
+def test_jobs_from_a_failed_save_are_saved_on_the_next_run(fixture_server, workdir, monkeypatch):
+    scraper = indeed_scraper(fixture_server)
+
+    def fail(jobs):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(scraper.store, 'upsert_jobs', fail)
+    scraper.scrape_jobs()
+    assert scraper.store.count() == 0
+
+    scraper = indeed_scraper(fixture_server)
+    jobs = scraper.scrape_jobs()
+    assert jobs
+    assert scraper.store.count() == len(jobs)
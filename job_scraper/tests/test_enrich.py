@@ -0,0 +1,67 @@
+"""
+LinkedIn detail enrichment across repeated scrapes of the fixture pages.
+
+The fixture detail pages share one description, so near-duplicate detection
+is turned off to keep every posting as its own job.
+"""
+
+import pytest
+
+from src.config import DEDUP_CONFIG
+from src.scraper import JobScraper
+
+
+@pytest.fixture(autouse=True)
+def no_dedup(monkeypatch):
+    monkeypatch.setitem(DEDUP_CONFIG, 'enabled', False)
+
+
+def linkedin_scraper(base_url: str) -> JobScraper:
+    return JobScraper(base_urls={'linkedin': f'{base_url}/linkedin'}, use_mock=False, max_pages=1)
+
+
+def described(scraper: JobScraper):
+    jobs = scraper.store.query(source='LinkedIn')
+    return [job for job in jobs if job.get('description')], jobs
+
+
+def test_first_run_fetches_every_detail_page(fixture_server, workdir):
+    scraper = linkedin_scraper(fixture_server)
+    scraper.scrape_jobs()
+
+    with_description, jobs = described(scraper)
+    assert jobs
+    assert len(with_description) == len(jobs)
+    assert scraper.enricher.last_report['fetched'] == len(jobs)
+
+
+def test_changed_cards_keep_their_fetched_description(fixture_server, workdir):
+    linkedin_scraper(fixture_server).scrape_jobs()
+
+    # Every card changed since the last run, e.g. a new applicant count
+    scraper = linkedin_scraper(fixture_server)
+    for entry in scraper.seen.entries.values():
+        entry['hash'] = 'changed'
+    scraper.scrape_jobs()
+
+    with_description, jobs = described(scraper)
+    assert jobs
+    assert len(with_description) == len(jobs)
+    # Descriptions came from the store, not from the detail pages again
+    assert scraper.enricher.last_report.get('fetched', 0) == 0
+
+
+def test_detail_page_is_refetched_when_the_store_lost_the_description(fixture_server, workdir):
+    scraper = linkedin_scraper(fixture_server)
+    scraper.scrape_jobs()
+    jobs = scraper.store.query(source='LinkedIn')
+    scraper.store.upsert_jobs([dict(job, description='') for job in jobs])
+
+    scraper = linkedin_scraper(fixture_server)
+    for entry in scraper.seen.entries.values():
+        entry['hash'] = 'changed'
+    scraper.scrape_jobs()
+
+    with_description, jobs = described(scraper)
+    assert len(with_description) == len(jobs)
+    assert scraper.enricher.last_report['fetched'] == len(jobs)
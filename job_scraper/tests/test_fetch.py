@@ -0,0 +1,58 @@
+"""
+Concurrent pagination against the fixture server, with every search page
+holding postings of its own so each search pages through to max_pages.
+"""
+
+import pytest
+
+from benchmarks.fixture_server import start_server
+from src.config import DEDUP_CONFIG, ENRICH_CONFIG
+from src.scraper import JobScraper
+
+PAGES = 3
+
+
+@pytest.fixture(scope='module')
+def base_urls():
+    """Indeed and LinkedIn on two host names, so per-host limits apply to each."""
+    server = start_server(vary_pages=True)
+    yield {
+        'indeed': f'http://127.0.0.1:{server.server_port}/indeed',
+        'linkedin': f'http://localhost:{server.server_port}/linkedin',
+    }
+    server.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def search_pages_only(monkeypatch):
+    monkeypatch.setitem(ENRICH_CONFIG, 'enabled', False)
+    monkeypatch.setitem(DEDUP_CONFIG, 'enabled', False)
+
+
+def scrape(base_urls, concurrent: bool):
+    scraper = JobScraper(base_urls=base_urls, use_mock=False, max_pages=PAGES)
+    scraper.scrape_jobs(concurrent=concurrent)
+    searches = sum(len(titles) for _, titles in scraper.profiles.searches()) * len(base_urls)
+    return scraper, searches
+
+
+def test_every_search_paginates_to_max_pages(base_urls, workdir):
+    scraper, searches = scrape(base_urls, concurrent=True)
+
+    assert scraper.request_stats.snapshot()['requests_sent'] == searches * PAGES
+    assert scraper.store.count() > 0
+
+
+def test_concurrent_scrape_stores_the_same_jobs_as_sequential(base_urls, workdir, monkeypatch):
+    def stored_ids(concurrent: bool, directory: str):
+        path = workdir / directory
+        path.mkdir()
+        monkeypatch.chdir(path)
+        scraper, searches = scrape(base_urls, concurrent)
+        assert scraper.request_stats.snapshot()['requests_sent'] == searches * PAGES
+        return {job['id'] for job in scraper.store.query()}
+
+    sequential = stored_ids(False, 'sequential')
+    concurrent = stored_ids(True, 'concurrent')
+    assert sequential
+    assert concurrent == sequential
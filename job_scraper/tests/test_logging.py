@@ -0,0 +1,34 @@
+"""
+Log files of worker processes forked after logging was set up.
+"""
+
+import logging
+import multiprocessing
+import os
+
+from src import logger as log_module
+from src.config import LOG_CONFIG
+
+
+def log_from_child(name: str) -> None:
+    logging.getLogger(name).warning('from the child')
+
+
+def test_forked_worker_writes_a_file_of_its_own(tmp_path, monkeypatch):
+    monkeypatch.setitem(LOG_CONFIG, 'directory', str(tmp_path))
+    logger = log_module.setup_logger('test_forked_worker')
+    logger.warning('from the parent')
+
+    child = multiprocessing.get_context('fork').Process(target=log_from_child,
+                                                        args=('test_forked_worker',))
+    child.start()
+    child.join()
+    log_module._listeners.pop().stop()  # flush this logger's queue only
+
+    with open(tmp_path / 'job_scraper.log', encoding='utf-8') as f:
+        parent_lines = f.read()
+    with open(tmp_path / f'job_scraper.{child.pid}.log', encoding='utf-8') as f:
+        child_lines = f.read()
+    assert 'from the parent' in parent_lines and 'from the child' not in parent_lines
+    assert 'from the child' in child_lines
+    assert sorted(os.listdir(tmp_path)) == sorted(['job_scraper.log', f'job_scraper.{child.pid}.log'])
@@ -0,0 +1,36 @@
+"""
+/metrics totals shared by worker processes through the job store.
+"""
+
+from src.metrics import ScrapeMetrics
+from src.ratelimit import RequestStats
+from src.storage import JobStore
+
+
+def worker() -> ScrapeMetrics:
+    """The metrics of one worker process."""
+    return ScrapeMetrics(RequestStats())
+
+
+def test_every_worker_renders_the_totals_of_all(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    scraping, serving = worker(), worker()
+
+    scraping.jobs_saved.inc(25)
+    scraping.fetch_seconds.observe(0.2, board='indeed')
+    scraping.request_stats.record_retry(503)
+    scraping.save(store)
+
+    rendered = serving.render(store.metrics())
+    assert 'job_scraper_jobs_saved_total 25' in rendered
+    assert 'job_scraper_fetch_seconds_count{board="indeed"} 1' in rendered
+    assert 'job_scraper_retries_total{status="503"} 1' in rendered
+
+    # A worker's observations are counted once, whether saved yet or not
+    serving.jobs_saved.inc(5)
+    assert 'job_scraper_jobs_saved_total 30' in serving.render(store.metrics())
+    serving.save(store)
+    scraping.jobs_saved.inc(1)
+    scraping.save(store)
+    assert 'job_scraper_jobs_saved_total 31' in serving.render(store.metrics())
+    assert 'job_scraper_jobs_saved_total 31' in scraping.render(store.metrics())
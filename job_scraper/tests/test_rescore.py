@@ -0,0 +1,67 @@
+"""
+Rescoring stored jobs after a profile gains a term or changes weights.
+"""
+
+import time
+
+import pytest
+
+from src.features import add_features
+from src.profiles import DEFAULT_PROFILE, ProfileSet
+from src.rescore import rescore
+from src.scoring import JobScorer
+from src.storage import JobStore
+
+DESCRIPTIONS = [
+    'Own the reporting stack on PostgreSQL and Looker.',
+    'Drive stakeholder engagement across the CRM rollout.',
+    'Lead process automation for a healthcare nonprofit.',
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A store holding a few jobs with the vectors the default scorer built at ingest."""
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    scorer = JobScorer()
+    jobs = [add_features({
+        'id': f'job-{i}', 'title': 'Program Manager', 'company': f'Company {i}',
+        'location': 'Austin, TX', 'description': description, 'source': 'Indeed',
+        'date_posted': 'Posted 2 days ago',
+    }) for i, description in enumerate(DESCRIPTIONS)]
+    for job, score in zip(jobs, scorer.score_batch(jobs).scores):
+        job['score'] = score
+    store.upsert_jobs(jobs)
+    store.save_vectors(scorer.terms, [(job['id'], scorer.vector(job)) for job in jobs])
+    return store
+
+
+def profile(**settings) -> ProfileSet:
+    return ProfileSet({DEFAULT_PROFILE: JobScorer(**settings)})
+
+
+def test_added_term_is_found_inside_longer_words(store):
+    added = profile(technical_skills=list(JobScorer().technical_skills) + ['gresql'])
+    now = time.time()
+
+    report = rescore(store, added, now)
+
+    # Only the job holding the term had its text read
+    assert report['searched'] == 1
+    expected = dict(zip((job['id'] for job in store.query()),
+                        added.default.score_batch(store.query(), now).scores))
+    assert store.scores() == pytest.approx(expected, abs=1e-12)
+    assert [job_id for job_id, _, vector in store.vectors() if 'd:gresql' in vector.matches] == ['job-0']
+
+
+def test_only_changed_scores_are_written(store):
+    now = time.time()
+    rescore(store, profile(), now)
+
+    report = rescore(store, profile(), now)
+    assert report['scores_written'] == 0
+
+    weights = dict(JobScorer().weights)
+    weights['title_match'] += 0.1
+    report = rescore(store, profile(weights=weights), now)
+    assert report['scores_written'] == len(DESCRIPTIONS)
@@ -0,0 +1,33 @@
+"""
+JobStore behaviour that later writes must not undo.
+"""
+
+from src.storage import JobStore
+
+JOB = {'id': 'job-1', 'title': 'Program Manager', 'company': 'Acme', 'location': 'Los Angeles, CA',
+       'source': 'Indeed', 'url': 'https://example.com/1', 'description': 'Runs programs.', 'score': 0.5}
+
+
+def test_upsert_keeps_sources_merged_from_duplicates(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    store.upsert_jobs([JOB])
+    store.add_sources('job-1', [{'source': 'LinkedIn', 'url': 'https://example.com/2'}])
+
+    store.upsert_jobs([dict(JOB, score=0.7)])
+
+    job = store.get('job-1')
+    assert job['score'] == 0.7
+    assert job['sources'] == [{'source': 'Indeed', 'url': 'https://example.com/1'},
+                              {'source': 'LinkedIn', 'url': 'https://example.com/2'}]
+
+
+def test_upsert_appends_new_sources_once(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    store.upsert_jobs([JOB])
+    store.add_sources('job-1', [{'source': 'LinkedIn', 'url': 'https://example.com/2'}])
+
+    dice = {'source': 'Dice', 'url': 'https://example.com/3'}
+    store.upsert_jobs([dict(JOB, sources=[{'source': 'Indeed', 'url': 'https://example.com/1'}, dice])])
+    store.upsert_jobs([dict(JOB, sources=[dice])])
+
+    assert [entry['source'] for entry in store.get('job-1')['sources']] == ['Indeed', 'LinkedIn', 'Dice']